@@ -0,0 +1,93 @@
+"""
+Run blocking service calls off the API event loop.
+
+The routes are ``async def`` but the services are synchronous: each call
+opens a SQLAlchemy session and waits on the database. Called directly
+from a coroutine, one slow query stalls every other request on the event
+loop. Routes therefore await the services through AsyncService, which
+runs each call on a small dedicated thread pool:
+
+    assets = AsyncService(AssetService())
+    page = await assets.query_assets(filters=filters, limit=100)
+
+The pool is bounded (API_WORKER_THREADS) so concurrent requests queue for
+a worker instead of all waiting on the database connection pool
+(5 connections + 10 overflow by default). Each worker thread gets its own
+scoped session via get_db(), which is discarded when the call ends.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from ..core.database import remove_thread_session
+
+# Threads running service calls for API requests
+API_WORKER_THREADS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_api_executor() -> ThreadPoolExecutor:
+    """Return the thread pool used for API service calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=API_WORKER_THREADS,
+                                               thread_name_prefix="api-worker")
+    return _executor
+
+
+def shutdown_api_executor(wait: bool = True) -> None:
+    """Stop the API thread pool; the next call starts a new one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _call_and_release(fn: Callable, args, kwargs) -> Any:
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        remove_thread_session()
+
+
+async def run_sync(fn: Callable, *args, **kwargs) -> Any:
+    """Await ``fn(*args, **kwargs)`` run on the API thread pool.
+
+    The call sees the caller's context variables (e.g. the request timing
+    used for Server-Timing).
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_api_executor(), functools.partial(context.run, _call_and_release, fn, args, kwargs)
+    )
+
+
+class AsyncService:
+    """Awaitable view of a synchronous service.
+
+    Every method of the wrapped service becomes a coroutine function that
+    runs the method with run_sync; other attributes are passed through.
+    """
+
+    def __init__(self, service: Any):
+        self._service = service
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await run_sync(attr, *args, **kwargs)
+        return call
@@ -0,0 +1,64 @@
+"""
+Conditional GET support (ETag / If-None-Match / Last-Modified).
+
+Read endpoints derive a weak ETag from the data-version stamp of the
+tables they read (see services.data_version) plus anything else that
+shapes the response, such as the query string. A client that sends the
+ETag back in If-None-Match gets an empty 304 while the stamp is
+unchanged, so polling clients skip both the query and the payload.
+
+Routes read the stamp before the data: if the data changes in between,
+the response carries the older ETag and the next poll simply refetches.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag over the repr of ``parts`` (stamps, query string, ...)."""
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def http_date(value: Optional[datetime]) -> Optional[str]:
+    """Format a naive UTC datetime for the Last-Modified header."""
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """Headers sent with both the full response and the 304."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    formatted = http_date(last_modified)
+    if formatted:
+        headers["Last-Modified"] = formatted
+    return headers
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match names ``etag`` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
@@ -1,43 +1,251 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from fastapi import status as status_codes
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, date
 
-from app.core.database import get_db
+from app.core.database import get_detached_db
 from app.services import asset_service
 from app.core.models import AssetStatus
-from ..schemas import AssetCreate, AssetResponse, CategoryResponse
-from ..utils import convert_asset_to_response, convert_category_to_response
+from app.services.data_version import ASSET_UPDATED_AT, VersionedCache
+from ..schemas import (
+    AssetBatchGet, AssetBatchGetResponse, AssetBulkDelete, AssetBulkUpdate, AssetCreate, AssetResponse,
+    BulkOperationResponse, CategoryResponse
+)
+from ..concurrency import AsyncService, run_sync
+from ..conditional import etag_matches, make_etag, not_modified, validator_headers
+from ..profiling import TimedJSONResponse
+from ..streaming import NDJSON_MEDIA_TYPE, iterate_on_api_pool, ndjson_chunks
+from ..utils import (
+    ASSET_RESPONSE_FIELDS, asset_query_fields, convert_asset_to_response, convert_asset_to_sparse_response,
+    convert_category_to_response, parse_asset_fields
+)
 
 AssetService = asset_service.AssetService
 
 router = APIRouter(prefix="/assets", tags=["assets"])
+
+# The API has no user sessions of its own, so its service calls (and their
+# audit records) run as this service identity. User id 0 is the built-in
+# administrator (see AssetService._check_delete_permission), so the API must
+# only be reachable through an authenticating proxy.
+API_SERVICE_USER_ID = 0
+API_SERVICE_USERNAME = "API"
+
 asset_service = AssetService()
+asset_service.set_current_user(API_SERVICE_USER_ID, API_SERVICE_USERNAME, global_audit_context=False)
+# Service calls block on the database, so routes await them on the API thread pool
+assets = AsyncService(asset_service)
+# /statistics payload for the current data version
+_statistics_cache = VersionedCache()
+
+# Most asset ids accepted by POST /assets/batch-get
+ASSET_BATCH_GET_LIMIT = 500
+
+def _listing_filters(status, category_id, department, location, date_from, date_to):
+    return {
+        "status": status,
+        "category_id": category_id,
+        "department": department,
+        "location": location,
+        "date_from": date_from,
+        "date_to": date_to
+    }
 
 @router.get("/", response_model=List[AssetResponse])
 async def get_all_assets(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    sort: Optional[str] = Query(None, description="Sort key, prefix with '-' for descending (default -created_at)"),
     status: Optional[str] = Query(None, description="Filter by asset status"),
     category_id: Optional[int] = Query(None, description="Filter by category"),
     department: Optional[str] = Query(None, description="Filter by department"),
     location: Optional[str] = Query(None, description="Filter by location"),
-    db: Session = Depends(get_db)
+    date_from: Optional[date] = Query(None, description="Acquired on or after this date"),
+    date_to: Optional[date] = Query(None, description="Acquired on or before this date"),
+    fields: Optional[str] = Query(None, description="Comma-separated AssetResponse fields to return (default: all)")
 ):
-    """Get all assets with pagination and filtering"""
-    filters = {
-        "status": status,
-        "category_id": category_id,
-        "department": department,
-        "location": location
-    }
-    assets = asset_service.get_all_assets(skip=skip, limit=limit, filters=filters)
-    return [convert_asset_to_response(asset) for asset in assets]
+    """Get assets with keyset pagination and filtering.
+
+    When more rows are available the cursor for the next page is returned in
+    the ``X-Next-Cursor`` response header. Responses carry an ETag; a
+    request whose If-None-Match still matches gets 304 without a query.
+    With ``fields`` only those keys are returned (and selected in SQL).
+    """
+    # Rows include category names, so the category stamp counts as well
+    version = await assets.get_data_version()
+    headers = validator_headers(make_etag("assets", version["assets"], version["categories"], request.url.query),
+                                version["assets"][ASSET_UPDATED_AT])
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
+
+    filters = _listing_filters(status, category_id, department, location, date_from, date_to)
+    try:
+        selected = parse_asset_fields(fields)
+        page = await assets.query_assets(
+            filters=filters, sort=sort, limit=limit, cursor=cursor, offset=skip,
+            fields=asset_query_fields(selected)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if page["next_cursor"]:
+        headers["X-Next-Cursor"] = page["next_cursor"]
+    if selected:
+        # Partial objects do not fit the AssetResponse model
+        return TimedJSONResponse([convert_asset_to_sparse_response(asset, selected) for asset in page["items"]],
+                            headers=headers)
+    response.headers.update(headers)
+    return [convert_asset_to_response(asset) for asset in page["items"]]
+
+@router.get("/search", response_model=List[AssetResponse])
+async def search_assets(
+    q: str = Query(..., min_length=1, description="Search terms, matched as prefixes"),
+    limit: int = Query(50, ge=1, le=500)
+):
+    """Full-text search over assets, best matches first"""
+    results = await assets.search_assets(q, limit=limit)
+    return [convert_asset_to_response(asset) for asset in results]
+
+def _stream_asset_chunks(filters, sort, selected=None):
+    # A detached session: the chunks are pulled from whichever API pool
+    # thread is free, so the thread-local get_db() session must not be used
+    with get_detached_db() as session:
+        yield from ndjson_chunks(
+            asset_service.iter_assets(filters=filters, sort=sort, session=session,
+                                      fields=asset_query_fields(selected)),
+            fields=selected or ASSET_RESPONSE_FIELDS
+        )
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_assets(
+    sort: Optional[str] = Query(None, description="Sort key, prefix with '-' for descending (default -created_at)"),
+    status: Optional[str] = Query(None, description="Filter by asset status"),
+    category_id: Optional[int] = Query(None, description="Filter by category"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    location: Optional[str] = Query(None, description="Filter by location"),
+    date_from: Optional[date] = Query(None, description="Acquired on or after this date"),
+    date_to: Optional[date] = Query(None, description="Acquired on or before this date"),
+    fields: Optional[str] = Query(None, description="Comma-separated AssetResponse fields to return (default: all)")
+):
+    """Stream every matching asset as NDJSON, one AssetResponse object per line.
+
+    Rows are read from a database cursor and sent in chunks as they are
+    serialised, so the whole register can be pulled without paging.
+    """
+    try:
+        chunks = _stream_asset_chunks(
+            _listing_filters(status, category_id, department, location, date_from, date_to), sort,
+            parse_asset_fields(fields)
+        )
+        # Read the first chunk now so query errors still get a 400
+        first = await run_sync(next, chunks, None)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return StreamingResponse(iterate_on_api_pool(chunks, first), media_type=NDJSON_MEDIA_TYPE)
+
+@router.post("/batch-get", response_model=AssetBatchGetResponse)
+async def batch_get_assets(request: AssetBatchGet):
+    """Get many assets by asset_id in one query.
+
+    Items follow the order of ``asset_ids``; unknown ids are listed in
+    ``missing``. With ``fields`` only those keys (plus asset_id) are
+    returned.
+    """
+    if len(request.asset_ids) > ASSET_BATCH_GET_LIMIT:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=f"At most {ASSET_BATCH_GET_LIMIT} asset ids per request"
+        )
+    try:
+        selected = parse_asset_fields(request.fields)
+        if selected:
+            # Items are matched to the requested ids by asset_id
+            selected = tuple(dict.fromkeys(("asset_id",) + selected))
+        result = await assets.get_assets_by_asset_ids(request.asset_ids, fields=asset_query_fields(selected))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if selected:
+        items = [convert_asset_to_sparse_response(asset, selected) for asset in result["items"]]
+    else:
+        items = [convert_asset_to_response(asset) for asset in result["items"]]
+    return {"items": items, "missing": result["missing"]}
+
+@router.patch("/bulk", response_model=BulkOperationResponse)
+async def bulk_update_assets(request: AssetBulkUpdate):
+    """Apply the same changes to many assets (by database id) in one transaction"""
+    result = await assets.bulk_update_assets(request.ids, request.changes)
+    if not result["success"]:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=result["message"]
+        )
+    return {"message": result["message"], "count": result["updated_count"], "errors": result["errors"]}
+
+@router.post("/bulk/delete", response_model=BulkOperationResponse)
+async def bulk_delete_assets(request: AssetBulkDelete):
+    """Retire (soft-delete) many assets (by database id) in one transaction"""
+    result = await assets.bulk_soft_delete_assets(request.ids, reason=request.reason)
+    if not result["success"]:
+        raise HTTPException(
+            status_code=status_codes.HTTP_400_BAD_REQUEST,
+            detail=result["message"]
+        )
+    return {"message": result["message"], "count": result["deleted_count"], "errors": result["errors"]}
+
+@router.get("/statistics")
+async def get_asset_statistics(request: Request):
+    """Get asset statistics by category and status.
+
+    The payload is computed once per data version and served from memory
+    until assets or categories change; If-None-Match is answered with 304.
+    """
+    version = await assets.get_data_version()
+    headers = validator_headers(make_etag("statistics", version["assets"], version["categories"]),
+                                version["assets"][ASSET_UPDATED_AT])
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
+
+    def load():
+        return {
+            "by_category": asset_service.get_assets_by_category(),
+            "by_status": asset_service.get_assets_by_status(),
+            "category_summary": asset_service.get_category_summary()
+        }
+    payload = await run_sync(_statistics_cache.get, (version["assets"], version["categories"]), load)
+    return TimedJSONResponse(jsonable_encoder(payload), headers=headers)
+
+@router.get("/categories", response_model=List[CategoryResponse])
+async def get_asset_categories(request: Request, response: Response):
+    """Get all asset categories (with asset counts)"""
+    # Asset counts are part of the response, so the asset stamp is too
+    version = await assets.get_data_version()
+    headers = validator_headers(make_etag("categories", version["categories"], version["assets"]))
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
+    response.headers.update(headers)
+
+    def load():
+        # Opens (and releases) its own session on the API pool thread
+        return [convert_category_to_response(cat) for cat in asset_service.get_all_categories()]
+    return await run_sync(load)
 
 @router.get("/{asset_id}", response_model=AssetResponse)
-async def get_asset(asset_id: str, db: Session = Depends(get_db)):
+async def get_asset(asset_id: str):
     """Get a specific asset by ID"""
-    asset = asset_service.get_asset_by_asset_id(asset_id)
+    asset = await assets.get_asset_by_asset_id(asset_id)
     if not asset:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,14 +255,13 @@ async def get_asset(asset_id: str, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=AssetResponse)
 async def create_asset(
-    asset: AssetCreate,
-    db: Session = Depends(get_db)
+    asset: AssetCreate
 ):
     """Create a new asset"""
     try:
         asset_data = asset.dict()
         asset_data["total_cost"] = asset_data["unit_cost"] * asset_data["quantity"]
-        created_asset = asset_service.create_asset(asset_data)
+        created_asset = await assets.create_asset(asset_data)
         return convert_asset_to_response(created_asset)
     except Exception as e:
         raise HTTPException(
@@ -62,26 +269,13 @@ async def create_asset(
             detail=str(e)
         )
 
-@router.get("/categories", response_model=List[CategoryResponse])
-async def get_asset_categories(db: Session = Depends(get_db)):
-    """Get all asset categories using the dependency-injected session.
-
-    Passing the FastAPI-provided session into the service ensures any
-    accessed relationship attributes are loaded while the session is
-    still open and avoids DetachedInstanceError when Pydantic reads
-    attributes during response creation.
-    """
-    categories = asset_service.get_all_categories(session=db)
-    return [convert_category_to_response(cat) for cat in categories]
-
 @router.patch("/{asset_id}/status", response_model=AssetResponse)
 async def update_asset_status(
     asset_id: str,
-    status: AssetStatus,
-    db: Session = Depends(get_db)
+    status: AssetStatus
 ):
     """Update the status of an asset"""
-    updated_asset = asset_service.update_asset_status(asset_id, status)
+    updated_asset = await assets.update_asset_status(asset_id, status)
     if not updated_asset:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,25 +283,15 @@ async def update_asset_status(
         )
     return convert_asset_to_response(updated_asset)
 
-@router.get("/statistics")
-async def get_asset_statistics(db: Session = Depends(get_db)):
-    """Get asset statistics by category and status"""
-    return {
-        "by_category": asset_service.get_assets_by_category(),
-        "by_status": asset_service.get_assets_by_status(),
-        "category_summary": asset_service.get_category_summary()
-    }
-
 @router.put("/{asset_id}", response_model=AssetResponse)
 async def update_asset(
     asset_id: str,
-    asset_update: AssetCreate,
-    db: Session = Depends(get_db)
+    asset_update: AssetCreate
 ):
     """Update an existing asset"""
     try:
         # Find asset by asset_id (user-defined ID)
-        asset = asset_service.get_asset_by_asset_id(asset_id)
+        asset = await assets.get_asset_by_asset_id(asset_id)
         if not asset:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -116,7 +300,7 @@ async def update_asset(
         
         # Update asset data
         asset_data = asset_update.dict(exclude_unset=True)
-        result = asset_service.update_asset(asset.id, asset_data)
+        result = await assets.update_asset(asset.id, asset_data)
         
         if result["success"]:
             return convert_asset_to_response(result["asset"])
@@ -132,18 +316,18 @@ async def update_asset(
         )
 
 @router.delete("/{asset_id}")
-async def delete_asset(asset_id: str, db: Session = Depends(get_db)):
+async def delete_asset(asset_id: str):
     """Delete an asset"""
     try:
         # Find asset by asset_id (user-defined ID)
-        asset = asset_service.get_asset_by_asset_id(asset_id)
+        asset = await assets.get_asset_by_asset_id(asset_id)
         if not asset:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Asset not found"
             )
         
-        result = asset_service.delete_asset(asset.id)
+        result = await assets.delete_asset(asset.id)
         if result["success"]:
             return {"message": "Asset deleted successfully"}
         else:
@@ -1,29 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status
 from typing import List
 
-from app.core.database import get_db
 from app.services.user_service import UserService
 from .. import schemas
+from ..concurrency import AsyncService
 from ..utils import convert_user_to_response
 
 router = APIRouter(prefix="/users", tags=["users"])
 user_service = UserService()
+# Service calls block on the database, so routes await them on the API thread pool
+users = AsyncService(user_service)
 
 @router.get("/", response_model=List[schemas.UserResponse])
 async def get_all_users(
     skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    limit: int = 100
 ):
     """Get all users with pagination"""
-    users = user_service.get_all_users(skip=skip, limit=limit)
-    return [convert_user_to_response(user, include_permissions=True) for user in users]
+    rows = await users.get_all_users(skip=skip, limit=limit)
+    return [convert_user_to_response(user, include_permissions=True) for user in rows]
 
 @router.get("/{user_id}", response_model=schemas.UserResponse)
-async def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int):
     """Get a specific user by ID"""
-    user = user_service.get_user_by_id(user_id)
+    user = await users.get_user_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -33,11 +33,10 @@ async def get_user(user_id: int, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=schemas.UserResponse)
 async def create_user(
-    user: schemas.UserCreate,
-    db: Session = Depends(get_db)
+    user: schemas.UserCreate
 ):
     """Create a new user"""
-    result = user_service.create_user(user.dict())
+    result = await users.create_user(user.dict())
     
     if result.get("success"):
         return convert_user_to_response(result["user"], include_permissions=True)
@@ -50,11 +49,10 @@ async def create_user(
 @router.put("/{user_id}", response_model=schemas.UserResponse)
 async def update_user(
     user_id: int,
-    user_update: schemas.UserCreate,
-    db: Session = Depends(get_db)
+    user_update: schemas.UserCreate
 ):
     """Update an existing user"""
-    updated_user = user_service.update_user(user_id, user_update.dict())
+    updated_user = await users.update_user(user_id, user_update.dict())
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,5 +1,7 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
@@ -7,11 +9,24 @@ from datetime import datetime
 from ..core.database import get_db
 from ..core.models import User, Asset, AssetCategory
 from . import schemas
+from .concurrency import shutdown_api_executor
+from .endpoints import assets, users
+from .profiling import PROMETHEUS_MEDIA_TYPE, ServerTimingMiddleware, TimedJSONResponse, metrics_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Let in-flight service calls finish before the process exits
+    shutdown_api_executor()
+
 
 app = FastAPI(
     title="Asset Management System API",
     description="API for Asset Management System",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse
 )
 
 # Configure CORS
@@ -23,7 +38,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Timing headers and per-route metrics (outermost, so it times everything)
+app.add_middleware(ServerTimingMiddleware)
+
+app.include_router(assets.router)
+app.include_router(users.router)
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow()}
+
+
+# Per-route request metrics (Prometheus text format)
+@app.get("/admin/metrics", include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(metrics_registry.render_prometheus(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -0,0 +1,241 @@
+"""
+Per-request profiling for the API.
+
+ServerTimingMiddleware times every HTTP request and splits the time into:
+
+  - db:        time spent in SQL statements (cursor execute), and how many
+  - serialize: time spent encoding response bodies (JSON / NDJSON)
+  - total:     wall time from the request arriving to the response headers
+
+and reports them to the client in a ``Server-Timing`` header, e.g.
+
+    Server-Timing: db;dur=4.1;desc="3 queries", serialize;dur=0.8, total;dur=7.9
+
+The figures are collected in a RequestTiming object held in a context
+variable. SQL statements are attributed through SQLAlchemy engine events;
+they run on the API thread pool, so run_sync copies the request context
+into the worker (see concurrency.py). Queries from other threads (e.g. the
+audit log writer) are not attributed to any request.
+
+Once the response is complete the request is recorded in MetricsRegistry,
+per (method, route template): total latency percentiles (p50/p95/p99 over
+the most recent METRICS_SAMPLE_SIZE requests) and running totals of
+requests, latency, DB time, queries and serialization time. The registry is
+rendered in the Prometheus text format at GET /admin/metrics.
+
+For streamed responses the header can only cover the time to the first
+chunk; the registry records the whole request, including the body.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+# Requests per route kept for the latency percentiles
+METRICS_SAMPLE_SIZE = 2048
+
+METRICS_QUANTILES = (0.5, 0.95, 0.99)
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route label for requests that did not match any route (404s)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestTiming:
+    """Timings collected for a single request."""
+
+    __slots__ = ('started', 'db_seconds', 'queries', 'serialize_seconds')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_seconds = 0.0
+        self.queries = 0
+        self.serialize_seconds = 0.0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Return the Server-Timing header value (durations in ms)."""
+        return (f'db;dur={self.db_seconds * 1000:.1f};desc="{self.queries} queries", '
+                f'serialize;dur={self.serialize_seconds * 1000:.1f}, '
+                f'total;dur={self.elapsed() * 1000:.1f}')
+
+
+_current_timing: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar(
+    'api_request_timing', default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Return the timing of the request being served, if any."""
+    return _current_timing.get()
+
+
+def record_serialization(seconds: float) -> None:
+    """Add ``seconds`` of response encoding to the current request."""
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.serialize_seconds += seconds
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_timing.get() is not None:
+        context._api_timing_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timing = _current_timing.get()
+    started = getattr(context, '_api_timing_started', None)
+    if timing is not None and started is not None:
+        timing.db_seconds += time.perf_counter() - started
+        timing.queries += 1
+
+
+def install_query_timing() -> None:
+    """Attribute SQL statements on every engine to the current request."""
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that counts its encoding towards the serialize timing."""
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return super().render(content)
+        finally:
+            record_serialization(time.perf_counter() - started)
+
+
+class _RouteMetrics:
+    __slots__ = ('samples', 'count', 'seconds', 'db_seconds', 'queries', 'serialize_seconds')
+
+    def __init__(self, sample_size: int):
+        self.samples = deque(maxlen=sample_size)
+        self.count = 0
+        self.seconds = 0.0
+        self.db_seconds = 0.0
+        self.queries = 0
+        self.serialize_seconds = 0.0
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """In-process request metrics, per (method, route template)."""
+
+    def __init__(self, sample_size: int = METRICS_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, seconds: float, timing: RequestTiming) -> None:
+        """Record one completed request."""
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = _RouteMetrics(self.sample_size)
+            metrics.samples.append(seconds)
+            metrics.count += 1
+            metrics.seconds += seconds
+            metrics.db_seconds += timing.db_seconds
+            metrics.queries += timing.queries
+            metrics.serialize_seconds += timing.serialize_seconds
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Return {(method, route): {count, seconds, db_seconds, queries,
+        serialize_seconds, quantiles: {q: seconds}}}."""
+        with self._lock:
+            routes = [(key, metrics, sorted(metrics.samples)) for key, metrics in self._routes.items()]
+            result = {}
+            for key, metrics, ordered in routes:
+                result[key] = {
+                    'count': metrics.count,
+                    'seconds': metrics.seconds,
+                    'db_seconds': metrics.db_seconds,
+                    'queries': metrics.queries,
+                    'serialize_seconds': metrics.serialize_seconds,
+                    'quantiles': {q: _quantile(ordered, q) for q in METRICS_QUANTILES} if ordered else {},
+                }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def render_prometheus(self) -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        snapshot = sorted(self.snapshot().items())
+        lines = [
+            '# HELP api_request_duration_seconds API request latency by route '
+            f'(quantiles over the last {self.sample_size} requests).',
+            '# TYPE api_request_duration_seconds summary',
+        ]
+        for (method, route), stats in snapshot:
+            labels = f'method="{_label(method)}",route="{_label(route)}"'
+            for q, seconds in stats['quantiles'].items():
+                lines.append(f'api_request_duration_seconds{{{labels},quantile="{q}"}} {seconds:.6f}')
+            lines.append(f'api_request_duration_seconds_sum{{{labels}}} {stats["seconds"]:.6f}')
+            lines.append(f'api_request_duration_seconds_count{{{labels}}} {stats["count"]}')
+
+        counters = (
+            ('api_request_db_seconds_total', 'Time spent in SQL statements.', 'db_seconds', '.6f'),
+            ('api_request_db_queries_total', 'SQL statements executed.', 'queries', 'd'),
+            ('api_request_serialize_seconds_total', 'Time spent encoding response bodies.',
+             'serialize_seconds', '.6f'),
+        )
+        for name, help_text, key, spec in counters:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for (method, route), stats in snapshot:
+                labels = f'method="{_label(method)}",route="{_label(route)}"'
+                lines.append(f'{name}{{{labels}}} {stats[key]:{spec}}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics_registry = MetricsRegistry()
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware adding Server-Timing headers and recording request metrics."""
+
+    def __init__(self, app, registry: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.registry = registry or metrics_registry
+        install_query_timing()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+
+        async def send_with_timing(message):
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message).append('Server-Timing', timing.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timing.reset(token)
+            route = getattr(scope.get('route'), 'path', None) or UNMATCHED_ROUTE
+            self.registry.observe(scope['method'], route, timing.elapsed(), timing)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
 # User schemas
@@ -62,6 +62,27 @@ class AssetResponse(AssetBase):
     class Config:
         orm_mode = True
 
+class AssetBulkUpdate(BaseModel):
+    ids: List[int]
+    changes: Dict[str, Any]
+
+class AssetBulkDelete(BaseModel):
+    ids: List[int]
+    reason: Optional[str] = None
+
+class BulkOperationResponse(BaseModel):
+    message: str
+    count: int
+    errors: List[str] = []
+
+class AssetBatchGet(BaseModel):
+    asset_ids: List[str]
+    fields: Optional[List[str]] = None
+
+class AssetBatchGetResponse(BaseModel):
+    items: List[Dict[str, Any]]
+    missing: List[str] = []
+
 # Category schemas
 class CategoryBase(BaseModel):
     name: str
@@ -0,0 +1,83 @@
+"""
+Newline-delimited JSON (NDJSON) response bodies.
+
+Large listings are streamed as one JSON object per line instead of a JSON
+array built in memory: rows come straight from a database cursor
+(AssetService.iter_assets), are serialised in chunks of NDJSON_CHUNK_ROWS
+and each chunk is sent as soon as it is ready, so memory stays flat and
+clients can start reading before the query finishes.
+
+orjson is used when it is installed; otherwise the standard json module.
+"""
+
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Sequence
+
+from .concurrency import run_sync
+from .profiling import record_serialization
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows serialised per chunk (one write to the client)
+NDJSON_CHUNK_ROWS = 500
+
+
+def _dumps(row: Dict[str, Any]) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(row, default=str)
+    return json.dumps(row, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def ndjson_chunks(rows: Iterable[Dict[str, Any]], fields: Optional[Sequence[str]] = None,
+                  chunk_rows: int = NDJSON_CHUNK_ROWS) -> Iterator[bytes]:
+    """Serialise rows as NDJSON, yielding one bytes chunk per ``chunk_rows`` rows.
+
+    Args:
+        rows: Row dicts (primitive values; anything else is sent as str())
+        fields: Keys to emit, in order (all keys of each row by default)
+        chunk_rows: Rows per yielded chunk
+    """
+    lines = []
+    encoding = 0.0
+    for row in rows:
+        started = time.perf_counter()
+        if fields is not None:
+            row = {name: row.get(name) for name in fields}
+        lines.append(_dumps(row))
+        encoding += time.perf_counter() - started
+        if len(lines) >= chunk_rows:
+            lines.append(b"")
+            record_serialization(encoding)
+            encoding = 0.0
+            yield b"\n".join(lines)
+            lines = []
+    if lines:
+        lines.append(b"")
+        record_serialization(encoding)
+        yield b"\n".join(lines)
+
+
+async def iterate_on_api_pool(chunks: Iterator[bytes], first: Optional[bytes] = None) -> AsyncIterator[bytes]:
+    """Drive a blocking chunk iterator from the API thread pool.
+
+    ``first`` is a chunk already taken from ``chunks`` (see the assets
+    stream route, which reads it up front to report query errors before
+    the response starts). The iterator is closed if the client goes away.
+    """
+    try:
+        if first is not None:
+            yield first
+        while True:
+            chunk = await run_sync(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        await run_sync(chunks.close)
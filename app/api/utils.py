@@ -1,13 +1,58 @@
 """
 Utility functions for converting between service models and API schemas.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from ..core.models import Asset, User, Role, Permission, AssetCategory
+from ..services.asset_projection import ASSET_ROW_FIELDS
 from . import schemas
 
 
+# Keys of an AssetResponse, in response order
+ASSET_RESPONSE_FIELDS = (
+    'id', 'asset_id', 'name', 'description', 'category_id', 'subcategory_id',
+    'acquisition_date', 'supplier', 'quantity', 'unit_cost', 'total_cost', 'location',
+    'custodian', 'department', 'assigned_to_id', 'status', 'asset_tag', 'serial_number',
+    'useful_life', 'depreciation_method', 'accumulated_depreciation', 'net_book_value',
+    'remarks', 'created_at', 'updated_at', 'category_name', 'subcategory_name', 'assigned_to_name'
+)
+
+
+def parse_asset_fields(fields) -> Optional[Tuple[str, ...]]:
+    """Parse a sparse fieldset (``"id,name"`` or a list) into AssetResponse keys.
+
+    Returns None when no fieldset was requested.
+
+    Raises:
+        ValueError: if a name is not an AssetResponse field
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [name.strip() for name in fields.split(',')]
+    fields = [name for name in fields if name]
+    unknown = [name for name in fields if name not in ASSET_RESPONSE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown asset field(s): {', '.join(unknown)}")
+    if not fields:
+        raise ValueError("No asset fields requested")
+    return tuple(dict.fromkeys(fields))
+
+
+def asset_query_fields(fields: Optional[Tuple[str, ...]]) -> Optional[List[str]]:
+    """Database columns behind a sparse fieldset, for AssetService ``fields`` arguments."""
+    if fields is None:
+        return None
+    # assigned_to_name is not a column; it is returned as None like in full responses
+    return [name for name in fields if name in ASSET_ROW_FIELDS] or ['id']
+
+
+def convert_asset_to_sparse_response(asset: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Response dict with only ``fields`` (asset dicts from a sparse service read)."""
+    return {name: asset.get(name) for name in fields}
+
+
 def convert_asset_to_response(asset: Asset) -> Dict[str, Any]:
     """Convert an Asset model to API response format"""
     # Support both dicts returned from service and ORM Asset objects
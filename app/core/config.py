@@ -19,4 +19,6 @@ class Config:
         
         # Paths
         self.BASE_DIR = Path(__file__).parent.parent.parent
-        self.UI_DIR = self.BASE_DIR / "app" / "gui" / "ui"
\ No newline at end of file
+        self.UI_DIR = self.BASE_DIR / "app" / "gui" / "ui"
+        # Monthly archives of audit records past the retention horizon
+        self.AUDIT_ARCHIVE_DIR = Path(os.getenv("AUDIT_ARCHIVE_DIR", self.BASE_DIR / "data" / "audit_archive"))
\ No newline at end of file
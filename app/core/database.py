@@ -12,11 +12,24 @@ def init_db(database_url):
     engine = create_engine(database_url, echo=False)
     _Session = scoped_session(sessionmaker(bind=engine))
     Base.metadata.create_all(engine)
+
+    # Full-text search index (FTS5 / GIN) and its triggers
+    from .fulltext import ensure_fulltext_indexes
+    ensure_fulltext_indexes(engine)
     
     # Initialize default data
     _init_default_roles_and_permissions()
 
 
+def get_session_factory():
+    """Return the current session factory (None before init_db).
+
+    In-process caches key on it so they reload after init_db switches
+    databases.
+    """
+    return _Session
+
+
 def get_db_session():
     """Get a database session"""
     if _Session is None:
@@ -24,6 +37,17 @@ def get_db_session():
     return _Session()
 
 
+def remove_thread_session():
+    """Close and discard the calling thread's session.
+
+    _Session is thread-local, so background workers get their own session
+    from get_db(); pooled worker threads call this when a job finishes so
+    no session (or connection) lingers on an idle thread.
+    """
+    if _Session is not None:
+        _Session.remove()
+
+
 @contextmanager
 def get_db():
     """Context manager for database sessions"""
@@ -38,6 +62,28 @@ def get_db():
         session.close()
 
 
+@contextmanager
+def get_detached_db():
+    """Context manager for a session that is not tied to the calling thread.
+
+    get_db() sessions come from the thread-local registry, so a generator
+    that is resumed on different threads (a streamed API response) would
+    share its session with whatever else runs on those threads. This
+    session belongs to the caller alone.
+    """
+    if _Session is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    session = _Session.session_factory()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def _init_default_roles_and_permissions():
     """Initialize default roles and permissions if they don't exist"""
     from .models import Role, Permission, RolePermission, UserRole, PermissionType
@@ -0,0 +1,203 @@
+"""
+Full-text search indexes.
+
+Asset and audit log search used to run LIKE '%term%' over several columns,
+which cannot use an index and scans the whole table for every search. The
+search indexes are maintained by the database itself:
+
+  SQLite      assets_fts / audit_logs_fts, FTS5 external-content tables
+              (rowid = id of the indexed row) kept in sync by
+              insert/update/delete triggers; ranked with bm25()
+  PostgreSQL  ix_assets_search / ix_audit_logs_search, GIN indexes on a
+              to_tsvector('simple', ...) expression over the same columns
+              (maintained by PostgreSQL on every write); ranked with ts_rank()
+
+ensure_fulltext_indexes() is idempotent and runs from init_db, so new and
+existing databases pick the indexes up on start-up (see also
+migrations/add_fulltext_search.py). Other dialects, or SQLite builds
+without FTS5, keep working through the LIKE fallback in the services.
+
+Search terms are matched as prefixes ("lapt" finds "Laptop", "CH-02"
+finds "CH-020"), and all terms must match.
+"""
+
+import re
+import weakref
+from collections import namedtuple
+from typing import Optional
+
+from sqlalchemy import Float, Integer, text
+from sqlalchemy.exc import OperationalError
+
+# One full-text index: the indexed table, the SQLite FTS5 table, the
+# PostgreSQL GIN index name and the indexed (column, bm25 weight) pairs
+FulltextIndex = namedtuple('FulltextIndex', 'table fts_table pg_index columns')
+
+# Asset identifiers rank highest
+ASSET_SEARCH = FulltextIndex('assets', 'assets_fts', 'ix_assets_search', (
+    ('asset_id', 10.0),
+    ('asset_tag', 10.0),
+    ('serial_number', 8.0),
+    ('name', 5.0),
+    ('model_number', 3.0),
+    ('location', 2.0),
+    ('description', 1.0),
+))
+
+AUDIT_SEARCH = FulltextIndex('audit_logs', 'audit_logs_fts', 'ix_audit_logs_search', (
+    ('description', 1.0),
+    ('action', 1.0),
+    ('username', 1.0),
+))
+
+FULLTEXT_INDEXES = (ASSET_SEARCH, AUDIT_SEARCH)
+
+_TERM_PATTERN = re.compile(r'[^\s"]+')
+_WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# engine -> whether its full-text indexes are usable
+_available = weakref.WeakKeyDictionary()
+
+
+def _column_names(index: FulltextIndex):
+    return [name for name, _ in index.columns]
+
+
+def _sqlite_statements(index: FulltextIndex):
+    fts = index.fts_table
+    cols = ', '.join(_column_names(index))
+    new_cols = ', '.join(f'new.{name}' for name in _column_names(index))
+    old_cols = ', '.join(f'old.{name}' for name in _column_names(index))
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {index.table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {index.table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END",
+        # Only edits to indexed columns touch the index (not depreciation runs)
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {index.table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END",
+    ]
+
+
+def _postgres_document(index: FulltextIndex):
+    """The tsvector expression indexed (and matched) on PostgreSQL."""
+    parts = " || ' ' || ".join(f"coalesce({name}, '')" for name in _column_names(index))
+    return f"to_tsvector('simple', {parts})"
+
+
+def _ensure_sqlite_index(conn, index: FulltextIndex):
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (index.fts_table,)
+    ).first()
+    if not exists:
+        conn.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE {index.fts_table} USING fts5("
+            f"{', '.join(_column_names(index))}, content='{index.table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2')"
+        )
+    for statement in _sqlite_statements(index):
+        conn.exec_driver_sql(statement)
+    if not exists:
+        # Index the rows that predate the table
+        conn.exec_driver_sql(f"INSERT INTO {index.fts_table}({index.fts_table}) VALUES ('rebuild')")
+
+
+def ensure_fulltext_indexes(engine) -> bool:
+    """Create the search indexes for `engine` if missing; return availability."""
+    dialect = engine.dialect.name
+    try:
+        if dialect == 'sqlite':
+            with engine.begin() as conn:
+                for index in FULLTEXT_INDEXES:
+                    _ensure_sqlite_index(conn, index)
+        elif dialect == 'postgresql':
+            with engine.begin() as conn:
+                for index in FULLTEXT_INDEXES:
+                    conn.exec_driver_sql(
+                        f"CREATE INDEX IF NOT EXISTS {index.pg_index} ON {index.table} "
+                        f"USING GIN ({_postgres_document(index)})"
+                    )
+        else:
+            _available[engine] = False
+            return False
+    except OperationalError as e:
+        # e.g. SQLite compiled without FTS5
+        print(f"Full-text search unavailable, falling back to LIKE: {e}")
+        _available[engine] = False
+        return False
+    _available[engine] = True
+    return True
+
+
+def drop_fulltext_indexes(engine):
+    """Remove the search indexes (and SQLite triggers) from `engine`."""
+    with engine.begin() as conn:
+        for index in FULLTEXT_INDEXES:
+            if engine.dialect.name == 'sqlite':
+                for suffix in ('ai', 'ad', 'au'):
+                    conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {index.fts_table}_{suffix}")
+                conn.exec_driver_sql(f"DROP TABLE IF EXISTS {index.fts_table}")
+            elif engine.dialect.name == 'postgresql':
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.pg_index}")
+    _available[engine] = False
+
+
+def is_fulltext_available(engine) -> bool:
+    """Whether ensure_fulltext_indexes succeeded for `engine`."""
+    if engine not in _available:
+        return ensure_fulltext_indexes(engine)
+    return _available[engine]
+
+
+def search_terms(query: str):
+    """Split user input into the terms that are matched (as prefixes)."""
+    return [term for term in _TERM_PATTERN.findall(query or '') if _WORD_PATTERN.search(term)]
+
+
+def _sqlite_match(terms):
+    # Each term is a quoted phrase with a prefix on its last token, so
+    # "CH-02" matches the tokens "ch" "02..." in sequence
+    return ' '.join('"%s"*' % term for term in terms)
+
+
+def _postgres_match(terms):
+    words = [word for term in terms for word in _WORD_PATTERN.findall(term)]
+    return ' & '.join(f"{word.lower()}:*" for word in words)
+
+
+def fulltext_subquery(session, index: FulltextIndex, query: str) -> Optional[object]:
+    """Return a subquery of (id, rank) for rows of `index.table` matching `query`.
+
+    Lower rank is a better match. Returns None when the query has no
+    searchable terms or the database has no full-text index, in which case
+    callers fall back to LIKE matching.
+    """
+    terms = search_terms(query)
+    engine = session.get_bind()
+    if not terms or not is_fulltext_available(engine):
+        return None
+
+    if engine.dialect.name == 'sqlite':
+        weights = ', '.join(str(weight) for _, weight in index.columns)
+        statement = text(
+            f"SELECT rowid AS id, bm25({index.fts_table}, {weights}) AS rank "
+            f"FROM {index.fts_table} WHERE {index.fts_table} MATCH :match"
+        ).bindparams(match=_sqlite_match(terms))
+    else:
+        document = _postgres_document(index)
+        statement = text(
+            f"SELECT id, -ts_rank({document}, to_tsquery('simple', :match)) AS rank "
+            f"FROM {index.table} WHERE {document} @@ to_tsquery('simple', :match)"
+        ).bindparams(match=_postgres_match(terms))
+    return statement.columns(id=Integer, rank=Float).subquery(f'{index.table}_search')
+
+
+def asset_search_subquery(session, query: str) -> Optional[object]:
+    """fulltext_subquery over the asset search index."""
+    return fulltext_subquery(session, ASSET_SEARCH, query)
+
+
+def audit_search_subquery(session, query: str) -> Optional[object]:
+    """fulltext_subquery over the audit log search index."""
+    return fulltext_subquery(session, AUDIT_SEARCH, query)
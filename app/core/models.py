@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, DateTime, Float, Text, Enum
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, DateTime, Float, Text, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from .database import Base
 from datetime import datetime
@@ -39,6 +39,25 @@ class DepreciationMethod(enum.Enum):
     DOUBLE_DECLINING = "Double Declining Balance"
     SUM_OF_YEARS = "Sum of Years Digits"
     
+    @staticmethod
+    def declining_balance_rate(total_cost, useful_life, salvage_value=0):
+        """Fixed Declining Balance rate that reaches salvage value over useful life."""
+        if salvage_value > 0:
+            return 1 - (salvage_value / total_cost) ** (1 / useful_life)
+        return 1 - (0.1 / total_cost) ** (1 / useful_life)  # Assume 10% salvage if not specified
+
+    @staticmethod
+    def geometric_accumulated_depreciation(total_cost, rate, years):
+        """Depreciation accumulated over `years` years at a fixed rate on book value.
+
+        Closed form of sum(cost * rate * (1 - rate) ** j for j < years); the
+        first year comes out exactly as cost * rate.
+        """
+        if years <= 0 or rate == 0:
+            return 0.0
+        q = 1 - rate
+        return total_cost * rate * (1 - q ** years) / (1 - q)
+
     @staticmethod
     def calculate_depreciation(method, total_cost, useful_life, current_year=1, salvage_value=0):
         """
@@ -54,6 +73,10 @@ class DepreciationMethod(enum.Enum):
         - accumulated_depreciation = sum of depreciation from year 1 to year (current_year-1)
         - current_book_value = total_cost - accumulated_depreciation
         
+        Accumulated depreciation is computed in closed form (geometric series
+        for the declining balance methods, arithmetic series for sum of years)
+        so the cost does not grow with current_year.
+        
         Args:
             method: DepreciationMethod enum value or string
             total_cost: Initial cost of the asset
@@ -96,19 +119,12 @@ class DepreciationMethod(enum.Enum):
         elif m == DepreciationMethod.DECLINING_BALANCE:
             # Declining balance: fixed rate applied to book value each year
             # Rate is calculated to reach salvage value over useful life
-            if salvage_value > 0:
-                rate = 1 - (salvage_value / total_cost) ** (1 / useful_life)
-            else:
-                rate = 1 - (0.1 / total_cost) ** (1 / useful_life)  # Assume 10% salvage if not specified
+            rate = DepreciationMethod.declining_balance_rate(total_cost, useful_life, salvage_value)
             
-            book_value = total_cost
-            accumulated_depreciation = 0.0
-            
-            # Calculate accumulated depreciation through previous years
-            for year in range(1, current_year):
-                annual_dep = book_value * rate
-                accumulated_depreciation += annual_dep
-                book_value -= annual_dep
+            # Accumulated depreciation over (current_year - 1) years is a geometric series
+            accumulated_depreciation = DepreciationMethod.geometric_accumulated_depreciation(
+                total_cost, rate, current_year - 1)
+            book_value = total_cost - accumulated_depreciation
             
             # Current year's depreciation
             annual_depreciation = book_value * rate
@@ -120,17 +136,17 @@ class DepreciationMethod(enum.Enum):
         elif m == DepreciationMethod.DOUBLE_DECLINING:
             # Double declining balance: rate = 2/useful_life, applied to book value
             rate = 2.0 / useful_life
-            book_value = total_cost
-            accumulated_depreciation = 0.0
             
-            # Calculate accumulated depreciation through previous years
-            for year in range(1, current_year):
-                annual_dep = book_value * rate
-                # Don't depreciate below salvage value
-                if book_value - annual_dep < salvage_value:
-                    annual_dep = max(0, book_value - salvage_value)
-                accumulated_depreciation += annual_dep
-                book_value -= annual_dep
+            # Geometric series, floored at salvage value once a year's
+            # depreciation would take the book value below it
+            accumulated_depreciation = DepreciationMethod.geometric_accumulated_depreciation(
+                total_cost, rate, current_year - 1)
+            book_value = total_cost - accumulated_depreciation
+            if total_cost < salvage_value:
+                book_value = total_cost
+            elif book_value < salvage_value:
+                book_value = salvage_value
+            accumulated_depreciation = total_cost - book_value
             
             # Current year's depreciation
             annual_depreciation = book_value * rate
@@ -144,13 +160,9 @@ class DepreciationMethod(enum.Enum):
             sum_of_years = (useful_life * (useful_life + 1)) / 2.0
             depreciable_amount = total_cost - salvage_value
             
-            accumulated_depreciation = 0.0
-            
-            # Calculate accumulated depreciation through previous years
-            for year in range(1, current_year):
-                remaining_years = useful_life - (year - 1)
-                annual_dep = (depreciable_amount * remaining_years) / sum_of_years
-                accumulated_depreciation += annual_dep
+            # Years 1..k use fractions L, L-1, ..., L-k+1 (an arithmetic series)
+            k = current_year - 1
+            accumulated_depreciation = depreciable_amount * (k * useful_life - k * (k - 1) / 2.0) / sum_of_years
             
             # Current year's depreciation
             remaining_years_current = useful_life - (current_year - 1)
@@ -180,6 +192,7 @@ class AssetCategory(Base):
     name = Column(String, nullable=False, unique=True)
     description = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # data-version stamp
     
     assets = relationship("Asset", back_populates="category")
     subcategories = relationship("AssetSubCategory", back_populates="category")
@@ -193,6 +206,7 @@ class AssetSubCategory(Base):
     category_id = Column(Integer, ForeignKey('asset_categories.id'), nullable=False)
     description = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # data-version stamp
     
     category = relationship("AssetCategory", back_populates="subcategories")
     assets = relationship("Asset", back_populates="subcategory")
@@ -200,6 +214,18 @@ class AssetSubCategory(Base):
 
 class Asset(Base):
     __tablename__ = "assets"
+    # Indexes follow the filters and keyset orderings used by AssetService
+    # (see migrations/add_query_indexes.py for existing databases)
+    __table_args__ = (
+        Index('ix_assets_created_at', 'created_at', 'id'),
+        Index('ix_assets_status_created_at', 'status', 'created_at', 'id'),
+        Index('ix_assets_category_created_at', 'category_id', 'created_at', 'id'),
+        Index('ix_assets_acquisition_date', 'acquisition_date', 'id'),
+        Index('ix_assets_expiry_date', 'expiry_date'),
+        Index('ix_assets_department', 'department'),
+        Index('ix_assets_location', 'location'),
+        Index('ix_assets_updated_at', 'updated_at'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     asset_id = Column(String, nullable=False, unique=True)  # User-defined asset ID
@@ -247,7 +273,7 @@ class Asset(Base):
     remarks = Column(Text)  # Additional notes/remarks
     
     # Audit fields
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Default keyset sort key
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
@@ -368,6 +394,12 @@ class ReportLog(Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Newest-first listings and their (timestamp, id) keyset cursor
+        Index('ix_audit_logs_timestamp_id', 'timestamp', 'id'),
+        # Latest entry per record/action (e.g. deletion reasons in Recently Deleted)
+        Index('ix_audit_logs_table_record_action', 'table_name', 'record_id', 'action', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     action = Column(String, nullable=False)  # CREATE, UPDATE, DELETE, LOGIN, LOGOUT, etc.
@@ -392,6 +424,24 @@ class AuditLog(Base):
     user = relationship("User")
 
 
+class AuditDailyStat(Base):
+    """Audit record counts per (UTC) day, action and username.
+
+    Maintained as audit records are written (see services/audit_rollup.py)
+    so audit statistics read a few hundred rows instead of the raw log.
+    """
+    __tablename__ = "audit_daily_stats"
+    __table_args__ = (
+        UniqueConstraint('day', 'action', 'username', name='uq_audit_daily_stats_key'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)
+    action = Column(String, nullable=False)
+    username = Column(String, nullable=False, default='')  # '' when the record had no username
+    count = Column(Integer, nullable=False, default=0)
+
+
 class SystemConfiguration(Base):
     __tablename__ = "system_configuration"
     
@@ -417,6 +467,11 @@ class SystemConfiguration(Base):
 
 class UserSession(Base):
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        Index('ix_user_sessions_user_active', 'user_id', 'is_active'),
+        # Expiry sweep: active sessions idle since before a cutoff
+        Index('ix_user_sessions_active_last_activity', 'is_active', 'last_activity'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -1,8 +1,29 @@
-from PySide6.QtWidgets import QDialog, QMessageBox, QListWidgetItem
+from datetime import datetime
+
+from PySide6.QtWidgets import QDialog, QMessageBox, QListWidgetItem, QLabel, QTextEdit
 from PySide6.QtCore import Qt
 from ..ui.audit_entry_dialog_ui import Ui_AuditEntryDialog
-from ...core.database import get_db, get_db_session
-from ...core.models import AuditLog
+from ...services.audit_service import AuditService
+from ...services.audit_payload import reconstruct_history
+
+# Most recent audit entries loaded for one asset
+AUDIT_HISTORY_LIMIT = 500
+
+
+def format_changes(before, after) -> str:
+    """Render the columns that differ between two record states, one per line."""
+    if before is None and after is None:
+        return ''
+    if before is None:
+        return '\n'.join(f"{key}: {value}" for key, value in after.items() if value is not None)
+    if after is None:
+        return 'Record removed'
+    lines = []
+    for key in list(before) + [k for k in after if k not in before]:
+        old, new = before.get(key), after.get(key)
+        if old != new:
+            lines.append(f"{key}: {'' if old is None else old} \u2192 {'' if new is None else new}")
+    return '\n'.join(lines) or 'No field changes'
 
 
 class AuditEntryDialog(QDialog):
@@ -42,56 +63,48 @@ class AuditEntryDialog(QDialog):
         # Make dialog modal
         self.setWindowModality(Qt.ApplicationModal)
 
-        # If an asset_id was provided, load audit entries and convert to plain dicts.
-        # Using plain dicts prevents DetachedInstanceError without keeping the
-        # DB session open for the dialog lifetime.
+        # Before/after view of the selected entry, rebuilt from the record's
+        # change-sets (see services/audit_payload.py)
+        self.changesValue = QTextEdit(self)
+        self.changesValue.setObjectName(u"changesValue")
+        self.changesValue.setReadOnly(True)
+        self.changesValue.setMinimumHeight(120)
+        self.ui.formLayout.addRow(QLabel('Changes', self), self.changesValue)
+
+        # If an asset_id was provided, load the record's audit history as plain
+        # dicts (including archived entries) and reconstruct the full
+        # before/after state for each entry, newest first.
         self._audit_entries = []
         try:
             if self.asset_id is not None:
                 try:
-                    with get_db() as session:
-                        logs = (session.query(AuditLog)
-                                .filter(AuditLog.table_name == 'assets', AuditLog.record_id == str(self.asset_id))
-                                .order_by(AuditLog.timestamp.desc())
-                                .all())
-                        for l in logs:
-                            entry = {
-                                'id': getattr(l, 'id', None),
-                                'username': getattr(l, 'username', None),
-                                'user_id': getattr(l, 'user_id', None),
-                                'timestamp': getattr(l, 'timestamp', None),
-                                'action': getattr(l, 'action', None),
-                                'description': getattr(l, 'description', None),
-                                # Include minimal user info if safe
-                                'user': None
-                            }
-                            try:
-                                u = getattr(l, 'user', None)
-                                if u is not None:
-                                    entry['user'] = {
-                                        'id': getattr(u, 'id', None),
-                                        'name': getattr(u, 'name', None),
-                                        'email': getattr(u, 'email', None)
-                                    }
-                            except Exception:
-                                entry['user'] = None
-
-                            self._audit_entries.append(entry)
-                            # Create list item label using timestamp and action
+                    logs = AuditService().get_audit_logs(
+                        limit=AUDIT_HISTORY_LIMIT,
+                        filters={'table_name': 'assets', 'record_id': self.asset_id,
+                                 'include_archived': True}
+                    )
+                    for entry in reversed(reconstruct_history(logs)):
+                        try:
+                            if entry.get('timestamp'):
+                                entry['timestamp'] = datetime.fromisoformat(entry['timestamp'])
+                        except Exception:
+                            pass
+                        self._audit_entries.append(entry)
+                        # Create list item label using timestamp and action
+                        label = ''
+                        try:
+                            ts = entry.get('timestamp')
+                            if ts is not None:
+                                label = ts.strftime('%Y-%m-%d %H:%M:%S') + ' - '
+                        except Exception:
                             label = ''
-                            try:
-                                ts = entry.get('timestamp')
-                                if ts is not None:
-                                    label = ts.strftime('%Y-%m-%d %H:%M:%S') + ' - '
-                            except Exception:
-                                label = ''
-                            label = label + (entry.get('action') or 'Audit')
-                            it = QListWidgetItem(label)
-                            it.setData(Qt.UserRole, len(self._audit_entries) - 1)
-                            try:
-                                self.ui.auditList.addItem(it)
-                            except Exception:
-                                pass
+                        label = label + (entry.get('action') or 'Audit')
+                        it = QListWidgetItem(label)
+                        it.setData(Qt.UserRole, len(self._audit_entries) - 1)
+                        try:
+                            self.ui.auditList.addItem(it)
+                        except Exception:
+                            pass
                 except Exception:
                     # ignore DB load errors; fall back to provided data
                     pass
@@ -214,6 +227,10 @@ class AuditEntryDialog(QDialog):
                 self.ui.descriptionValue.setPlainText(str(description))
             except Exception:
                 pass
+            try:
+                self.changesValue.setPlainText(format_changes(entry.get('before'), entry.get('after')))
+            except Exception:
+                pass
         except Exception:
             pass
 
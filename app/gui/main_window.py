@@ -404,70 +404,12 @@ class MainWindow(QMainWindow):
         """Load assets from database for the specified category"""
         try:
             if category == 'all':
-                assets = self.asset_service.get_all_assets()
+                filters = None
             else:
-                # Query assets by category name directly
-                assets = self.asset_service.get_assets_by_category_name(category)
-            
-            # Convert database assets to format expected by table view
-            asset_data = []
-            for asset in assets:
-                # support both dicts (from service) and ORM objects
-                if isinstance(asset, dict):
-                    acq = asset.get('acquisition_date')
-                    date_registered = ''
-                    if acq:
-                        try:
-                            if isinstance(acq, str):
-                                date_registered = datetime.fromisoformat(acq).strftime('%Y-%m-%d')
-                            elif isinstance(acq, datetime):
-                                date_registered = acq.strftime('%Y-%m-%d')
-                            else:
-                                date_registered = str(acq)
-                        except Exception:
-                            date_registered = str(acq)
-
-                    asset_data.append({
-                        'id': asset.get('id'),
-                        'asset_id': asset.get('asset_id'),
-                        'name': asset.get('name'),
-                        'model_number': asset.get('model_number'),
-                        'serial_number': asset.get('serial_number'),
-                        'location': asset.get('location'),
-                        # Use location as the value displayed in the table's
-                        # department column (location is the combo selection).
-                        'department': asset.get('location') or asset.get('department') or 'Not Assigned',
-                        'category': asset.get('category_name') or asset.get('category') or 'Unknown',
-                        'date_registered': date_registered,
-                        'expiry_date': asset.get('expiry_date') or self.calculate_expiry_date(asset),
-                        'value': float(asset.get('total_cost', 0)),
-                        'status': asset.get('status') if asset.get('status') else 'Unknown'
-                    })
-                else:
-                    # For ORM objects, use expiry_date from database if available, else calculate
-                    expiry = getattr(asset, 'expiry_date', None)
-                    if expiry:
-                        expiry_str = expiry.strftime('%Y-%m-%d') if hasattr(expiry, 'strftime') else str(expiry)
-                    else:
-                        expiry_str = self.calculate_expiry_date(asset)
-                    
-                    asset_data.append({
-                        'id': asset.id,  # Database ID for edit/delete operations
-                        'asset_id': asset.asset_id,  # User-defined asset ID for display
-                        'name': asset.name,
-                        'model_number': getattr(asset, 'model_number', '') if hasattr(asset, 'model_number') else '',
-                        'serial_number': getattr(asset, 'serial_number', '') if hasattr(asset, 'serial_number') else '',
-                        'location': getattr(asset, 'location', '') if hasattr(asset, 'location') else '',
-                        # Prefer location (combo selection) for the table column
-                        'department': (getattr(asset, 'location', None) or asset.department or 'Not Assigned'),
-                        'category': asset.category.name if asset.category else 'Unknown',
-                        'date_registered': asset.acquisition_date.strftime('%Y-%m-%d') if asset.acquisition_date else '',
-                        'expiry_date': expiry_str,
-                        'value': float(asset.total_cost or 0),
-                        'status': asset.status.value if asset.status else 'Unknown'
-                    })
-            
-            table_view.load_assets(asset_data)
+                # Filter by category name in SQL; category pages also list retired assets
+                filters = {'category_name': category, 'include_retired': True}
+            # The table model pages rows in as the user scrolls
+            table_view.load_query(filters)
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load assets: {str(e)}")
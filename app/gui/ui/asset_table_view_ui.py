@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'asset_table_view.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.9.3
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -17,8 +17,7 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QFrame, QHBoxLayout,
     QHeaderView, QLabel, QLineEdit, QSizePolicy,
-    QSpacerItem, QTableWidget, QTableWidgetItem, QVBoxLayout,
-    QWidget)
+    QSpacerItem, QTableView, QVBoxLayout, QWidget)
 
 class Ui_AssetTableView(object):
     def setupUi(self, AssetTableView):
@@ -190,29 +189,7 @@ class Ui_AssetTableView(object):
 
         self.verticalLayout.addLayout(self.summaryLayout)
 
-        self.assetTable = QTableWidget(AssetTableView)
-        if (self.assetTable.columnCount() < 10):
-            self.assetTable.setColumnCount(10)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(6, __qtablewidgetitem6)
-        __qtablewidgetitem7 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(7, __qtablewidgetitem7)
-        __qtablewidgetitem8 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(8, __qtablewidgetitem8)
-        __qtablewidgetitem9 = QTableWidgetItem()
-        self.assetTable.setHorizontalHeaderItem(9, __qtablewidgetitem9)
+        self.assetTable = QTableView(AssetTableView)
         self.assetTable.setObjectName(u"assetTable")
         self.assetTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.assetTable.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -243,26 +220,6 @@ class Ui_AssetTableView(object):
         self.highestValueLabel.setText(QCoreApplication.translate("AssetTableView", u"Highest Value Asset", None))
         self.highestValueName.setText(QCoreApplication.translate("AssetTableView", u"N/A", None))
         self.highestValueAmount.setText(QCoreApplication.translate("AssetTableView", u"\u20a60.00", None))
-        ___qtablewidgetitem = self.assetTable.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("AssetTableView", u"Asset ID", None));
-        ___qtablewidgetitem1 = self.assetTable.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("AssetTableView", u"Name", None));
-        ___qtablewidgetitem2 = self.assetTable.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("AssetTableView", u"Model Number", None));
-        ___qtablewidgetitem3 = self.assetTable.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("AssetTableView", u"Serial Number", None));
-        ___qtablewidgetitem4 = self.assetTable.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("AssetTableView", u"Department", None));
-        ___qtablewidgetitem5 = self.assetTable.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("AssetTableView", u"Category", None));
-        ___qtablewidgetitem6 = self.assetTable.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("AssetTableView", u"Date Registered", None));
-        ___qtablewidgetitem7 = self.assetTable.horizontalHeaderItem(7)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("AssetTableView", u"Exp. Date", None));
-        ___qtablewidgetitem8 = self.assetTable.horizontalHeaderItem(8)
-        ___qtablewidgetitem8.setText(QCoreApplication.translate("AssetTableView", u"Value", None));
-        ___qtablewidgetitem9 = self.assetTable.horizontalHeaderItem(9)
-        ___qtablewidgetitem9.setText(QCoreApplication.translate("AssetTableView", u"Status", None));
         pass
     # retranslateUi
 
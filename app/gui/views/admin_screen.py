@@ -2,7 +2,7 @@ from PySide6.QtWidgets import (QWidget, QDialog, QVBoxLayout, QHBoxLayout,
                              QLabel, QLineEdit, QComboBox, QPushButton, QMessageBox,
                              QCheckBox, QRadioButton, QButtonGroup, QTableWidgetItem,
                              QGroupBox, QScrollArea, QTableWidget)
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer
 from PySide6.QtGui import QColor, QBrush, QKeySequence, QAction
 from ..ui.admin_screen_ui import Ui_AdminScreen
 from ..dialogs.add_user_dialog import AddUserDialog
@@ -19,6 +19,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Audit log rows fetched per page (more are fetched when scrolled to the end)
+AUDIT_PAGE_SIZE = 50
+AUDIT_SEARCH_DEBOUNCE_MS = 300
+
 
 class AdminScreen(QWidget):
     def __init__(self, parent=None):
@@ -89,6 +93,20 @@ class AdminScreen(QWidget):
         self.ui.auditLogsTable.setColumnWidth(1, 100)  # User
         self.ui.auditLogsTable.setColumnWidth(2, 200)  # Action
 
+        # Audit log search box and keyset paging state
+        self._audit_filters = {}
+        self._audit_cursor = None
+        self.auditSearchEdit = QLineEdit(self.ui.auditLogsFrame)
+        self.auditSearchEdit.setPlaceholderText("Search audit log...")
+        self.auditSearchEdit.setClearButtonEnabled(True)
+        self.ui.verticalLayout_2.insertWidget(1, self.auditSearchEdit)
+        # Older records live in the audit archive; scanning it is opt-in
+        self.auditIncludeArchivedCheck = QCheckBox("Include archived logs", self.ui.auditLogsFrame)
+        self.ui.verticalLayout_2.insertWidget(2, self.auditIncludeArchivedCheck)
+        self._audit_search_timer = QTimer(self)
+        self._audit_search_timer.setSingleShot(True)
+        self._audit_search_timer.setInterval(AUDIT_SEARCH_DEBOUNCE_MS)
+
     def setup_connections(self):
         """Setup signal/slot connections"""
         # User management connections
@@ -96,6 +114,14 @@ class AdminScreen(QWidget):
         self.ui.usersTable.itemSelectionChanged.connect(self.on_user_selected)
         self.ui.savePermissionsBtn.clicked.connect(self.save_user_permissions)
 
+        # Audit log search (debounced) and paging on scroll
+        self.auditSearchEdit.textChanged.connect(lambda _text: self._audit_search_timer.start())
+        self._audit_search_timer.timeout.connect(
+            lambda: self.load_audit_logs(self.auditSearchEdit.text().strip()))
+        self.auditIncludeArchivedCheck.toggled.connect(
+            lambda _checked: self.load_audit_logs(self.auditSearchEdit.text().strip()))
+        self.ui.auditLogsTable.verticalScrollBar().valueChanged.connect(self._on_audit_logs_scrolled)
+
         # Register Alt+R action to show Recently Deleted screen
         try:
             action = QAction(self)
@@ -183,7 +209,8 @@ class AdminScreen(QWidget):
 
             # Show recent successful login events to admin (non-sensitive)
             try:
-                logs = self.audit_service.get_audit_logs(limit=50, filters={'action': 'LOGIN_SUCCESS'})
+                logs = self.audit_service.query_audit_logs(
+                    filters={'action': 'LOGIN_SUCCESS'}, limit=AUDIT_PAGE_SIZE)['items']
             except Exception:
                 logs = []
 
@@ -289,6 +316,7 @@ class AdminScreen(QWidget):
         self.ui.usersTable.setEnabled(False)
         self.ui.permissionsScrollArea.setEnabled(False)
         self.ui.savePermissionsBtn.setEnabled(False)
+        self.auditSearchEdit.setEnabled(False)
 
     # Compatibility slots for Qt auto-connect: forwarders to strongly-typed handlers
     @Slot()
@@ -427,33 +455,48 @@ class AdminScreen(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load users: {str(e)}")
             
-    def load_audit_logs(self):
-        """Load audit logs from database"""
+    def load_audit_logs(self, search: str = None):
+        """Load the first page of audit logs (newest first), optionally searched"""
+        self._audit_filters = {'search': search} if search else {}
+        if self.auditIncludeArchivedCheck.isChecked():
+            self._audit_filters['include_archived'] = True
+        self._audit_cursor = None
+        self.ui.auditLogsTable.setRowCount(0)
+        self._append_audit_page()
+
+    def _append_audit_page(self):
+        """Append the next keyset page of audit logs to the table"""
         try:
-            # Clear existing items
-            self.ui.auditLogsTable.setRowCount(0)
-            
-            # TODO: Create AuditLog model and implement actual audit logging
-            # For now, we'll show some basic information about users
-            with get_db() as session:
-                users = session.query(User).order_by(User.created_at.desc()).limit(50)
-                
-                for user in users:
-                    row = self.ui.auditLogsTable.rowCount()
-                    self.ui.auditLogsTable.insertRow(row)
-                    
-                    # Format the timestamp
-                    timestamp = user.created_at.strftime("%Y-%m-%d %H:%M")
-                    
-                    self.ui.auditLogsTable.setItem(row, 0, QTableWidgetItem(timestamp))
-                    self.ui.auditLogsTable.setItem(row, 1, QTableWidgetItem("System"))
-                    self.ui.auditLogsTable.setItem(row, 2, QTableWidgetItem(f"Created user: {user.name}"))
-            # The following lines seem to reference an undefined 'log', so they are commented out or removed.
-            # self.ui.auditLogsTable.setItem(row, 1, QTableWidgetItem(log["user"]))
-            # self.ui.auditLogsTable.setItem(row, 2, QTableWidgetItem(log["action"]))
+            page = self.audit_service.query_audit_logs(
+                filters=self._audit_filters, limit=AUDIT_PAGE_SIZE, cursor=self._audit_cursor)
+            self._audit_cursor = page['next_cursor']
+
+            for log in page['items']:
+                row = self.ui.auditLogsTable.rowCount()
+                self.ui.auditLogsTable.insertRow(row)
+
+                timestamp = log.get('timestamp') or ''
+                try:
+                    timestamp = datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+                except ValueError:
+                    pass
+                username = log.get('username') or (log.get('user') or {}).get('name') or "System"
+                action_item = QTableWidgetItem(log.get('description') or log.get('action') or '')
+                action_item.setToolTip(log.get('action') or '')
+
+                self.ui.auditLogsTable.setItem(row, 0, QTableWidgetItem(timestamp))
+                self.ui.auditLogsTable.setItem(row, 1, QTableWidgetItem(username))
+                self.ui.auditLogsTable.setItem(row, 2, action_item)
         except Exception as e:
+            self._audit_cursor = None
             QMessageBox.critical(self, "Error", f"Failed to load audit logs: {str(e)}")
 
+    def _on_audit_logs_scrolled(self, value):
+        """Fetch the next audit page when the table is scrolled to the end"""
+        scrollbar = self.ui.auditLogsTable.verticalScrollBar()
+        if self._audit_cursor and value >= scrollbar.maximum():
+            self._append_audit_page()
+
     def show_deactivated_users_dialog(self):
         # Deprecated: replaced by Recently Deleted dialog (use show_recently_deleted)
         return
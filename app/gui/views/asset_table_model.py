@@ -0,0 +1,258 @@
+"""
+Lazily paged table model for the asset register.
+
+AssetTableModel keeps only the rows the user has scrolled to. The first page
+is read when a query is set; QTableView asks for more through
+canFetchMore/fetchMore as the user scrolls near the end, and each call reads
+the next keyset page from AssetService.query_assets. Rows are held as compact
+AssetRow tuples and cell text, colours and alignment are computed in data()
+for the cells that are actually painted.
+
+When constructed with a BackgroundLoader, pages are read on a worker thread
+and inserted when they arrive; changing the query discards a page that is
+still loading for the previous one.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QColor
+
+from ...services.asset_projection import AssetRow
+from ...services.asset_service import AssetService
+from ...services.expiry_calculator import ExpiryCalculator
+from ..workers import BackgroundLoader
+
+# Rows read per fetchMore call
+DEFAULT_PAGE_SIZE = 200
+
+ASSET_TABLE_HEADERS = [
+    "Asset ID", "Name", "Model Number", "Serial Number", "Department",
+    "Category", "Date Registered", "Exp. Date", "Value", "Status"
+]
+
+# Columns that can be sorted in SQL, mapped to AssetService sort keys
+SORTABLE_COLUMNS = {
+    0: 'asset_id',
+    1: 'name',
+    6: 'acquisition_date',
+    8: 'total_cost',
+}
+
+STATUS_COLORS = {
+    'Available': QColor('#4CAF50'),
+    'In Use': QColor('#2196F3'),
+    'Under Maintenance': QColor('#FFC107'),
+    'Disposed': QColor('#F44336')
+}
+DEFAULT_STATUS_COLOR = QColor('#757575')
+EXPIRED_COLOR = QColor('#F44336')        # Red - expired
+EXPIRING_SOON_COLOR = QColor('#FFC107')  # Yellow - expiring within 30 days
+VALID_COLOR = QColor('#4CAF50')          # Green - valid
+
+
+class AssetTableModel(QAbstractTableModel):
+    """Read-only asset model that pages rows in from the database on demand."""
+
+    # Emitted after a page has been appended (also for an empty first page)
+    pageLoaded = Signal()
+
+    def __init__(self, asset_service: Optional[AssetService] = None,
+                 page_size: int = DEFAULT_PAGE_SIZE, parent=None,
+                 loader: Optional[BackgroundLoader] = None):
+        super().__init__(parent)
+        self.asset_service = asset_service or AssetService()
+        self.page_size = page_size
+        self.loader = loader
+        self._loading = False
+        self._filters: Optional[Dict[str, Any]] = None
+        self._sort: Optional[str] = None
+        self._rows: List[AssetRow] = []
+        self._cursor: Optional[str] = None
+        self._has_more = False
+        # Expiry dates are derived per row; cache them for the painted rows
+        self._expiry_cache: Dict[int, Optional[date]] = {}
+
+    # Query control -------------------------------------------------------
+
+    def set_query(self, filters: Optional[Dict[str, Any]] = None, sort: Optional[str] = None):
+        """Replace the filters/sort and reload the first page."""
+        self._filters = dict(filters) if filters else None
+        self._sort = sort
+        self.refresh()
+
+    def set_search(self, text: str):
+        """Apply a search string on top of the current filters."""
+        filters = dict(self._filters or {})
+        if text:
+            filters['search'] = text
+        else:
+            filters.pop('search', None)
+        self.set_query(filters, self._sort)
+
+    def filters(self) -> Optional[Dict[str, Any]]:
+        return self._filters
+
+    def refresh(self):
+        """Drop the loaded rows and read the first page again."""
+        self.beginResetModel()
+        self._rows = []
+        self._expiry_cache = {}
+        self._cursor = None
+        self._has_more = True
+        # A page still loading for the previous query is discarded
+        self._loading = False
+        if self.loader is not None:
+            self.loader.cancel()
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def asset_at(self, row: int) -> Optional[AssetRow]:
+        """Return the AssetRow displayed at ``row`` (None if out of range)."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    # QAbstractTableModel -------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(ASSET_TABLE_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(ASSET_TABLE_HEADERS):
+            return ASSET_TABLE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def is_loading(self) -> bool:
+        return self._loading
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more or self._loading:
+            return
+        args = (self._filters, self._sort, self._cursor)
+        if self.loader is None:
+            try:
+                page = self._read_page(*args)
+            except Exception as e:
+                self._on_page_error(str(e))
+                return
+            self._append_page(page)
+            return
+        self._loading = True
+        self.loader.start(self._read_page, *args,
+                          on_result=self._append_page, on_error=self._on_page_error)
+
+    def _read_page(self, filters, sort, cursor):
+        # Runs on a worker thread when a loader is set: no model state here
+        return self.asset_service.query_assets(
+            filters=filters, sort=sort, limit=self.page_size, cursor=cursor, as_rows=True
+        )
+
+    def _append_page(self, page):
+        self._loading = False
+        items = page['items']
+        self._cursor = page['next_cursor']
+        self._has_more = page['has_more']
+        if items:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+            self._rows.extend(items)
+            self.endInsertRows()
+        self.pageLoaded.emit()
+
+    def _on_page_error(self, message: str):
+        print(f"Error loading assets page: {message}")
+        self._loading = False
+        self._has_more = False
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Re-query in the requested order; unsupported columns keep the default order."""
+        key = SORTABLE_COLUMNS.get(column)
+        sort = None if key is None else (key if order == Qt.AscendingOrder else f"-{key}")
+        if sort == self._sort:
+            return
+        self._sort = sort
+        self.refresh()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        asset = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display_text(asset, column)
+        if role == Qt.UserRole and column == 0:
+            return asset.id
+        if role == Qt.TextAlignmentRole and column == 8:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.ForegroundRole:
+            if column == 7:
+                return self._expiry_color(self._expiry_date(asset))
+            if column == 9:
+                return STATUS_COLORS.get(self._status_text(asset), DEFAULT_STATUS_COLOR)
+        return None
+
+    # Cell rendering ------------------------------------------------------
+
+    def _display_text(self, asset: AssetRow, column: int) -> str:
+        if column == 0:
+            return asset.asset_id or ''
+        if column == 1:
+            return asset.name or ''
+        if column == 2:
+            return asset.model_number or ''
+        if column == 3:
+            return asset.serial_number or ''
+        if column == 4:
+            # The department column shows the location (combo selection) when set
+            return asset.location or asset.department or 'Not Assigned'
+        if column == 5:
+            return asset.category_name or 'Unknown'
+        if column == 6:
+            return asset.acquisition_date.strftime('%Y-%m-%d') if asset.acquisition_date else ''
+        if column == 7:
+            expiry = self._expiry_date(asset)
+            return expiry.strftime('%Y-%m-%d') if expiry else ''
+        if column == 8:
+            return f"₦{float(asset.total_cost or 0):,.2f}"
+        if column == 9:
+            return self._status_text(asset)
+        return ''
+
+    @staticmethod
+    def _status_text(asset: AssetRow) -> str:
+        return asset.status.value if asset.status else 'Unknown'
+
+    def _expiry_date(self, asset: AssetRow) -> Optional[date]:
+        """End of useful life using the Dec 31 logic, falling back to the stored expiry_date."""
+        if asset.id in self._expiry_cache:
+            return self._expiry_cache[asset.id]
+        expiry = asset.expiry_date
+        if asset.acquisition_date and asset.useful_life:
+            try:
+                expiry = ExpiryCalculator.calculate_expiry_date(asset.acquisition_date, asset.useful_life)
+            except Exception as e:
+                print(f"Error calculating expiry: {e}")
+        if isinstance(expiry, datetime):
+            expiry = expiry.date()
+        self._expiry_cache[asset.id] = expiry
+        return expiry
+
+    @staticmethod
+    def _expiry_color(expiry: Optional[date]):
+        if not expiry:
+            return None
+        today = date.today()
+        if expiry <= today:
+            return EXPIRED_COLOR
+        if expiry <= today + timedelta(days=30):
+            return EXPIRING_SOON_COLOR
+        return VALID_COLOR
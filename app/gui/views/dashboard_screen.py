@@ -8,6 +8,8 @@ from app.gui.dialogs.chart_magnifier_dialog import ChartMagnifierDialog
 from app.services.asset_service import AssetService
 from app.services.session_service import SessionService
 from app.services.audit_service import AuditService
+from app.services.dashboard_snapshot import DashboardSnapshot
+from app.gui.workers import BackgroundLoader
 
 class DashboardScreen(QWidget):
     def __init__(self, session_service: SessionService, parent=None):
@@ -19,6 +21,7 @@ class DashboardScreen(QWidget):
         self.session_service = session_service
         self.asset_service = AssetService()
         self.audit_service = AuditService()
+        self.snapshot = DashboardSnapshot(self.audit_service)
         
         # Set current user context for services
         if self.session_service.is_authenticated():
@@ -30,6 +33,9 @@ class DashboardScreen(QWidget):
         # Initialize charts
         self.pie_chart = None
         self.bar_chart = None
+
+        # Dashboard queries run on a worker thread
+        self.loader = BackgroundLoader(self)
         
         self.init_dashboard()
         self.load_dashboard_data()
@@ -74,87 +80,69 @@ class DashboardScreen(QWidget):
             pass
     
     def load_dashboard_data(self):
-        """Load and display dashboard data from services"""
+        """Load dashboard data on a worker thread and display it when ready"""
+        self.loader.start(self.read_dashboard_data, on_result=self.show_dashboard_data,
+                          on_error=self._on_dashboard_error)
+
+    def read_dashboard_data(self):
+        """Read everything the dashboard shows. Runs on a worker thread: no widget access."""
+        return self.snapshot.get()
+
+    def show_dashboard_data(self, data):
+        """Display a DashboardSnapshot result"""
         try:
-            # Load asset statistics
-            self.load_asset_statistics()
-            
-            # Load category data for charts
-            self.load_category_charts()
-            
-            # Load recent activities
-            self.load_recent_activities()
-            
+            self.show_asset_statistics(data)
+            self.show_category_charts(data['by_category'])
+            self.show_recent_activities(data['recent_activity'])
         except Exception as e:
             print(f"Error loading dashboard data: {e}")
-    
-    def load_asset_statistics(self):
-        """Load and display asset statistics"""
-        try:
-            with self.asset_service.get_session() as session:
-                # Get all assets
-                assets = self.asset_service.get_all_assets(session)
-                total_assets = len(assets)
 
-                # Calculate total value (support dicts or ORM objects)
-                def _get_total(a):
-                    if isinstance(a, dict):
-                        return float(a.get('total_cost', 0) or 0)
-                    return float(getattr(a, 'total_cost', 0) or 0)
+    def _on_dashboard_error(self, message):
+        print(f"Error loading dashboard data: {message}")
+        self.show_asset_statistics(None)
+        self.ui.recentActivitiesList.clear()
+        self.ui.recentActivitiesList.addItem("Error loading activities")
 
-                total_value = sum(_get_total(asset) for asset in assets)
-                
-                # Get categories with the same session
-                categories = self.asset_service.get_all_categories(session)
-                total_categories = len(categories)
-                
-                # Update UI
-                self.ui.totalAssetsLabel.setText(f"Total Assets: {total_assets:,}")
-                self.ui.totalValueLabel.setText(f"Total Value: ₦{total_value:,.2f}")
-                self.ui.totalCategoriesLabel.setText(f"Total Categories: {total_categories}")
-            
-        except Exception as e:
-            print(f"Error loading asset statistics: {e}")
+    def show_asset_statistics(self, snapshot):
+        """Display asset statistics"""
+        if snapshot is None:
             self.ui.totalAssetsLabel.setText("Total Assets: Error")
             self.ui.totalValueLabel.setText("Total Value: Error")
             self.ui.totalCategoriesLabel.setText("Total Categories: Error")
+            return
+        self.ui.totalAssetsLabel.setText(f"Total Assets: {snapshot['total_assets']:,}")
+        self.ui.totalValueLabel.setText(f"Total Value: ₦{snapshot['total_value']:,.2f}")
+        self.ui.totalCategoriesLabel.setText(f"Total Categories: {snapshot['total_categories']}")
     
-    def load_category_charts(self):
-        """Load data for category charts"""
+    def show_category_charts(self, category_stats):
+        """Update category charts from get_assets_by_category statistics"""
         try:
-            with self.asset_service.get_session() as session:
-                # Get category statistics
-                category_stats = self.asset_service.get_assets_by_category(session)
+            if category_stats:
+                # Prepare data for pie chart (asset count by category)
+                pie_data = {}
+                bar_data = {}
                 
-                if category_stats:
-                    # Prepare data for pie chart (asset count by category)
-                    pie_data = {}
-                    bar_data = {}
+                for category_name, stats in category_stats.items():
+                    count = stats.get('count', 0)
+                    total_value = stats.get('total_value', 0)
                     
-                    for category_name, stats in category_stats.items():
-                        count = stats.get('count', 0)
-                        total_value = stats.get('total_value', 0)
-                        
-                        if count > 0:
-                            pie_data[category_name] = count
-                            bar_data[category_name] = total_value
+                    if count > 0:
+                        pie_data[category_name] = count
+                        bar_data[category_name] = total_value
+            
+                # Update charts
+                if self.pie_chart and pie_data:
+                    self.pie_chart.update_data(pie_data)
                 
-                    # Update charts
-                    if self.pie_chart and pie_data:
-                        self.pie_chart.update_data(pie_data)
-                    
-                    if self.bar_chart and bar_data:
-                        self.bar_chart.update_data(bar_data)
+                if self.bar_chart and bar_data:
+                    self.bar_chart.update_data(bar_data)
             
         except Exception as e:
             print(f"Error loading category charts: {e}")
     
-    def load_recent_activities(self):
-        """Load recent activities from audit log"""
+    def show_recent_activities(self, recent_logs):
+        """Display recent activities from the audit log"""
         try:
-            # Get recent audit logs for the last 24 hours
-            recent_logs = self.audit_service.get_recent_activity(hours=24, limit=10)
-
             # Clear existing items
             self.ui.recentActivitiesList.clear()
 
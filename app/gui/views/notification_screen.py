@@ -117,7 +117,7 @@ class NotificationScreen(QWidget):
         
         # Pull recent asset-related audit logs and build notifications
         try:
-            logs = self.audit_service.get_table_changes('assets', limit=200)
+            logs = self.audit_service.query_audit_logs(filters={'table_name': 'assets'}, limit=200)['items']
         except Exception as e:
             print(f"Error fetching audit logs for notifications: {e}")
             logs = []
@@ -6,6 +6,8 @@ from ...core.models import User, Asset, AssetStatus
 from ...services.user_service import UserService
 from ...services.asset_service import AssetService
 from ...services.audit_service import set_global_audit_user
+from ...services.audit_writer import flush_audit_writer
+from ..workers import BackgroundLoader
 from PySide6.QtWidgets import QMessageBox
 
 class RecentlyDeletedDialog(QDialog):
@@ -35,6 +37,8 @@ class RecentlyDeletedDialog(QDialog):
             pass
         self.user_service = UserService()
         self.asset_service = AssetService()
+        # Table contents are read on a worker thread
+        self.loader = BackgroundLoader(self)
         # If dialog was created from MainWindow, propagate current user context
         # Attempt to discover current user id/name by walking the parent chain
         try:
@@ -109,35 +113,28 @@ class RecentlyDeletedDialog(QDialog):
         self.load_data()
 
     def load_data(self):
-        # Load deactivated users
+        """Reload both tables; the queries run on a worker thread."""
+        self.loader.start(self.read_data, on_result=self.show_data)
+
+    def read_data(self):
+        """Read deactivated users and retired/disposed assets as plain tuples.
+
+        Runs on a worker thread, so it must not touch widgets.
+        """
+        # Deletion reasons come from the audit log; write any queued records first
+        flush_audit_writer()
+        users, assets = [], []
         try:
             with get_db() as session:
-                users = session.query(User).filter(User.deleted_at != None).order_by(User.deleted_at.desc()).all()
-                self.ui.usersTable.setRowCount(0)
-                for u in users:
-                    r = self.ui.usersTable.rowCount()
-                    self.ui.usersTable.insertRow(r)
-                    item0 = QTableWidgetItem(u.email or "")
-                    item0.setData(Qt.UserRole, getattr(u, 'id', None))
-                    self.ui.usersTable.setItem(r, 0, item0)
-                    item1 = QTableWidgetItem(u.name or "")
-                    self.ui.usersTable.setItem(r, 1, item1)
+                # Load deactivated users
+                for u in session.query(User).filter(User.deleted_at != None).order_by(User.deleted_at.desc()).all():
                     role_text = u.role.name.value if getattr(u, 'role', None) else 'Unknown'
-                    item2 = QTableWidgetItem(role_text)
-                    self.ui.usersTable.setItem(r, 2, item2)
                     deleted_text = u.deleted_at.strftime('%Y-%m-%d %H:%M:%S') if getattr(u, 'deleted_at', None) else ''
-                    item3 = QTableWidgetItem(deleted_text)
-                    self.ui.usersTable.setItem(r, 3, item3)
+                    users.append((getattr(u, 'id', None), u.email or "", u.name or "", role_text, deleted_text))
 
                 # Load assets considered "deleted" (Retired or Disposed)
-                assets = session.query(Asset).filter(Asset.status.in_([AssetStatus.RETIRED, AssetStatus.DISPOSED])).order_by(Asset.updated_at.desc()).all()
-                self.ui.assetsTable.setRowCount(0)
-                for a in assets:
-                    r = self.ui.assetsTable.rowCount()
-                    self.ui.assetsTable.insertRow(r)
-                    item0 = QTableWidgetItem(a.asset_id or "")
-                    # Store DB id in UserRole and deletion reason in a secondary role
-                    item0.setData(Qt.UserRole, getattr(a, 'id', None))
+                rows = session.query(Asset).filter(Asset.status.in_([AssetStatus.RETIRED, AssetStatus.DISPOSED])).order_by(Asset.updated_at.desc()).all()
+                for a in rows:
                     # Fetch latest audit log entry for this asset deletion to show reason
                     try:
                         from ...core.models import AuditLog
@@ -149,17 +146,39 @@ class RecentlyDeletedDialog(QDialog):
                         reason_text = log.description if log and getattr(log, 'description', None) else ''
                     except Exception:
                         reason_text = ''
-                    item0.setData(Qt.UserRole + 1, reason_text)
-                    self.ui.assetsTable.setItem(r, 0, item0)
-                    item1 = QTableWidgetItem(a.name or "")
-                    self.ui.assetsTable.setItem(r, 1, item1)
-                    item2 = QTableWidgetItem(a.status.value if a.status else "")
-                    self.ui.assetsTable.setItem(r, 2, item2)
                     updated_text = a.updated_at.strftime('%Y-%m-%d %H:%M:%S') if getattr(a, 'updated_at', None) else ''
-                    item3 = QTableWidgetItem(updated_text)
-                    self.ui.assetsTable.setItem(r, 3, item3)
+                    assets.append((getattr(a, 'id', None), a.asset_id or "", reason_text, a.name or "",
+                                   a.status.value if a.status else "", updated_text))
         except Exception as e:
             print(f"Error loading recently deleted data: {e}")
+        return users, assets
+
+    def show_data(self, data):
+        """Fill the users and assets tables from read_data results."""
+        users, assets = data
+        self.ui.usersTable.setRowCount(0)
+        for user_id, email, name, role_text, deleted_text in users:
+            r = self.ui.usersTable.rowCount()
+            self.ui.usersTable.insertRow(r)
+            item0 = QTableWidgetItem(email)
+            item0.setData(Qt.UserRole, user_id)
+            self.ui.usersTable.setItem(r, 0, item0)
+            self.ui.usersTable.setItem(r, 1, QTableWidgetItem(name))
+            self.ui.usersTable.setItem(r, 2, QTableWidgetItem(role_text))
+            self.ui.usersTable.setItem(r, 3, QTableWidgetItem(deleted_text))
+
+        self.ui.assetsTable.setRowCount(0)
+        for asset_db_id, asset_id, reason_text, name, status_text, updated_text in assets:
+            r = self.ui.assetsTable.rowCount()
+            self.ui.assetsTable.insertRow(r)
+            item0 = QTableWidgetItem(asset_id)
+            # Store DB id in UserRole and deletion reason in a secondary role
+            item0.setData(Qt.UserRole, asset_db_id)
+            item0.setData(Qt.UserRole + 1, reason_text)
+            self.ui.assetsTable.setItem(r, 0, item0)
+            self.ui.assetsTable.setItem(r, 1, QTableWidgetItem(name))
+            self.ui.assetsTable.setItem(r, 2, QTableWidgetItem(status_text))
+            self.ui.assetsTable.setItem(r, 3, QTableWidgetItem(updated_text))
 
     def restore_selected(self):
         """Restore selected users or assets depending on active tab."""
@@ -284,6 +303,7 @@ class RecentlyDeletedDialog(QDialog):
             description = ''
             try:
                 from ...core.models import AuditLog
+                flush_audit_writer()
                 try:
                     with get_db() as session:
                         log = session.query(AuditLog).filter(
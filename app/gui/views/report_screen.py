@@ -7,6 +7,10 @@ from ...core.models import ReportStatus, ReportFormat
 from datetime import datetime
 import os
 from ...services.export_method import export_csv, export_xlsx, export_pdf, export_docx
+from ...services.report_rows import (
+    all_assets_rows, category_rows, department_rows, depreciation_rows,
+    valuation_rows, maintenance_rows, stream_report_csv, stream_report_xlsx
+)
 
 
 class ReportScreen(QWidget):
@@ -75,47 +79,50 @@ class ReportScreen(QWidget):
         """Generate the actual report based on parameters"""
         records_count = 0
         try:
-            # Get assets data based on report type
-            if report_type == "All Assets Report":
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_all_assets_data(assets)
-            elif report_type == "Assets by Category":
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_assets_by_category_data(assets)
-            elif report_type == "Assets by Department":
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_assets_by_department_data(assets)
-            elif report_type == "Depreciation Report":
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_depreciation_data(assets)
-            elif report_type == "Asset Valuation Report":
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_valuation_data(assets)
-            elif report_type == "Maintenance Schedule":
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_maintenance_data(assets)
+            if export_format == "CSV File":
+                # Streamed straight from the database, row by row
+                records_count = stream_report_csv(report_type, file_path, self.asset_service)
+            elif export_format == "Excel Spreadsheet (.xlsx)":
+                # Write-only workbook, also streamed from the database
+                records_count = stream_report_xlsx(report_type, file_path, self.asset_service)
             else:
-                assets = self.asset_service.get_all_assets()
-                data = self.prepare_all_assets_data(assets)
+                # Get assets data based on report type
+                if report_type == "All Assets Report":
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_all_assets_data(assets)
+                elif report_type == "Assets by Category":
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_assets_by_category_data(assets)
+                elif report_type == "Assets by Department":
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_assets_by_department_data(assets)
+                elif report_type == "Depreciation Report":
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_depreciation_data(assets)
+                elif report_type == "Asset Valuation Report":
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_valuation_data(assets)
+                elif report_type == "Maintenance Schedule":
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_maintenance_data(assets)
+                else:
+                    assets = self.asset_service.get_all_assets()
+                    data = self.prepare_all_assets_data(assets)
             
-            # Filter by date range if applicable
-            filtered_data = self.filter_by_date_range(data, start_date, end_date)
+                # Filter by date range if applicable
+                filtered_data = self.filter_by_date_range(data, start_date, end_date)
             
-            # Calculate records count
-            if isinstance(filtered_data, dict):
-                records_count = sum(len(group) for group in filtered_data.values())
-            else:
-                records_count = len(filtered_data)
+                # Calculate records count
+                if isinstance(filtered_data, dict):
+                    records_count = sum(len(group) for group in filtered_data.values())
+                else:
+                    records_count = len(filtered_data)
             
-            # Export based on format
-            if export_format == "CSV File":
-                self.export_to_csv(filtered_data, file_path, report_type)
-            elif export_format == "Excel Spreadsheet (.xlsx)":
-                self.export_to_excel(filtered_data, file_path, report_type)
-            elif export_format == "PDF Document":
-                self.export_to_pdf(filtered_data, file_path, report_type)
-            elif export_format == "Word Document (.docx)":
-                self.export_to_docx(filtered_data, file_path, report_type)
+                # Export based on format
+                if export_format == "PDF Document":
+                    self.export_to_pdf(filtered_data, file_path, report_type)
+                elif export_format == "Word Document (.docx)":
+                    self.export_to_docx(filtered_data, file_path, report_type)
             
             # Log successful report generation
             self.log_report_generation(
@@ -134,275 +141,42 @@ class ReportScreen(QWidget):
             )
             raise Exception(f"Report generation failed: {str(e)}")
     
-    def prepare_all_assets_data(self, assets):
-        """Prepare data for all assets report with depreciation fields"""
-        from ...services.expiry_calculator import ExpiryCalculator
-        data = []
+    def _asset_dicts(self, assets):
+        """Yield assets as dicts (service dicts pass through, ORM objects are converted)."""
         for asset in assets:
-            # support both dicts (service) and ORM objects (legacy callers)
-            aid = asset.get('asset_id') if isinstance(asset, dict) else getattr(asset, 'asset_id', '')
-            name = asset.get('name') if isinstance(asset, dict) else getattr(asset, 'name', '')
-            category = asset.get('category_name') or asset.get('category') if isinstance(asset, dict) else (asset.category.name if getattr(asset, 'category', None) else 'Unknown')
-            department = asset.get('department') if isinstance(asset, dict) else getattr(asset, 'department', None)
-            acq = asset.get('acquisition_date') if isinstance(asset, dict) else getattr(asset, 'acquisition_date', None)
-            # normalize date
-            acq_str = ''
-            acq_date = None
-            if acq:
-                try:
-                    if isinstance(acq, str):
-                        acq_dt = datetime.fromisoformat(acq)
-                    else:
-                        acq_dt = acq
-                    acq_date = acq_dt.date() if isinstance(acq_dt, datetime) else acq_dt
-                    acq_str = acq_date.strftime('%Y-%m-%d')
-                except Exception:
-                    acq_str = str(acq)
+            yield asset if isinstance(asset, dict) else self.asset_service._asset_to_dict(asset)
 
-            total_cost = float(asset.get('total_cost') or 0) if isinstance(asset, dict) else float(getattr(asset, 'total_cost', 0) or 0)
-            useful_life = asset.get('useful_life') if isinstance(asset, dict) else getattr(asset, 'useful_life', 0)
-            depreciation_pct = asset.get('depreciation_percentage') if isinstance(asset, dict) else getattr(asset, 'depreciation_percentage', 0) or 0
-            status = asset.get('status') if isinstance(asset, dict) else (getattr(asset, 'status').value if getattr(asset, 'status', None) else 'Unknown')
-            model = asset.get('model_number') if isinstance(asset, dict) else getattr(asset, 'model_number', '')
-            serial = asset.get('serial_number') if isinstance(asset, dict) else getattr(asset, 'serial_number', '')
-            
-            # Calculate remaining useful life using Dec 31 logic
-            remaining_life = useful_life
-            if acq_date and useful_life:
-                try:
-                    remaining_life = ExpiryCalculator.calculate_remaining_useful_life(useful_life, acq_date)
-                except Exception:
-                    remaining_life = useful_life
+    def _group_rows(self, pairs):
+        """Collect (group, row) pairs into the dict-of-lists shape used by the exporters."""
+        grouped = {}
+        for group, row in pairs:
+            grouped.setdefault(group, []).append(row)
+        return grouped
 
-            data.append({
-                'Asset ID': aid,
-                'Name': name,
-                'Model Number': model or '',
-                'Serial Number': serial or '',
-                'Category': category or 'Unknown',
-                'Department': department or 'Not Assigned',
-                'Acquisition Date': acq_str,
-                'Total Cost': total_cost,
-                'Useful Life (Years)': useful_life or 0,
-                'Remaining Life (Years)': remaining_life or 0,
-                'Depreciation %': float(depreciation_pct) or 0,
-                'Status': status or 'Unknown'
-            })
-        return data
+    def prepare_all_assets_data(self, assets):
+        """Prepare data for all assets report with depreciation fields"""
+        return list(all_assets_rows(self._asset_dicts(assets)))
     
     def prepare_assets_by_category_data(self, assets):
         """Prepare data grouped by category"""
-        category_data = {}
-        for asset in assets:
-            if isinstance(asset, dict):
-                category = asset.get('category_name') or asset.get('category') or 'Unknown'
-                acq = asset.get('acquisition_date')
-                try:
-                    if acq:
-                        acq_str = datetime.fromisoformat(acq).strftime('%Y-%m-%d') if isinstance(acq, str) else acq.strftime('%Y-%m-%d')
-                    else:
-                        acq_str = ''
-                except Exception:
-                    acq_str = str(acq) if acq else ''
-
-                entry = {
-                    'Asset ID': asset.get('asset_id'),
-                    'Name': asset.get('name'),
-                    'Model Number': asset.get('model_number') or '',
-                    'Serial Number': asset.get('serial_number') or '',
-                    'Department': asset.get('department') or 'Not Assigned',
-                    'Acquisition Date': acq_str,
-                    'Total Cost': float(asset.get('total_cost') or 0),
-                    'Status': asset.get('status') or 'Unknown'
-                }
-            else:
-                category = asset.category.name if asset.category else 'Unknown'
-                entry = {
-                    'Asset ID': asset.asset_id,
-                    'Name': asset.name,
-                    'Model Number': getattr(asset, 'model_number', '') or '',
-                    'Serial Number': getattr(asset, 'serial_number', '') or '',
-                    'Department': asset.department or 'Not Assigned',
-                    'Acquisition Date': asset.acquisition_date.strftime('%Y-%m-%d') if asset.acquisition_date else '',
-                    'Total Cost': float(asset.total_cost or 0),
-                    'Status': asset.status.value if asset.status else 'Unknown'
-                }
-
-            if category not in category_data:
-                category_data[category] = []
-            category_data[category].append(entry)
-        return category_data
+        return self._group_rows(category_rows(self._asset_dicts(assets)))
     
     def prepare_assets_by_department_data(self, assets):
         """Prepare data grouped by department"""
-        dept_data = {}
-        for asset in assets:
-            if isinstance(asset, dict):
-                dept = asset.get('department') or 'Not Assigned'
-                category = asset.get('category_name') or asset.get('category') or 'Unknown'
-                acq = asset.get('acquisition_date')
-                try:
-                    if acq:
-                        acq_str = datetime.fromisoformat(acq).strftime('%Y-%m-%d') if isinstance(acq, str) else acq.strftime('%Y-%m-%d')
-                    else:
-                        acq_str = ''
-                except Exception:
-                    acq_str = str(acq) if acq else ''
-
-                entry = {
-                    'Asset ID': asset.get('asset_id'),
-                    'Name': asset.get('name'),
-                    'Model Number': asset.get('model_number') or '',
-                    'Serial Number': asset.get('serial_number') or '',
-                    'Category': category,
-                    'Acquisition Date': acq_str,
-                    'Total Cost': float(asset.get('total_cost') or 0),
-                    'Status': asset.get('status') or 'Unknown'
-                }
-            else:
-                dept = asset.department or 'Not Assigned'
-                entry = {
-                    'Asset ID': asset.asset_id,
-                    'Name': asset.name,
-                    'Model Number': getattr(asset, 'model_number', '') or '',
-                    'Serial Number': getattr(asset, 'serial_number', '') or '',
-                    'Category': asset.category.name if asset.category else 'Unknown',
-                    'Acquisition Date': asset.acquisition_date.strftime('%Y-%m-%d') if asset.acquisition_date else '',
-                    'Total Cost': float(asset.total_cost or 0),
-                    'Status': asset.status.value if asset.status else 'Unknown'
-                }
-
-            if dept not in dept_data:
-                dept_data[dept] = []
-            dept_data[dept].append(entry)
-        return dept_data
+        return self._group_rows(department_rows(self._asset_dicts(assets)))
     
     def prepare_depreciation_data(self, assets):
         """Prepare depreciation report data"""
-        data = []
-        for asset in assets:
-            # Support dict or ORM
-            total_cost = asset.get('total_cost') if isinstance(asset, dict) else getattr(asset, 'total_cost', None)
-            useful_life = asset.get('useful_life') if isinstance(asset, dict) else getattr(asset, 'useful_life', None)
-            acq = asset.get('acquisition_date') if isinstance(asset, dict) else getattr(asset, 'acquisition_date', None)
-
-            if acq and total_cost and useful_life:
-                try:
-                    # normalize acquisition date
-                    if isinstance(acq, str):
-                        acq_date = datetime.fromisoformat(acq).date()
-                    else:
-                        acq_date = acq if isinstance(acq, datetime) else acq
-                        acq_date = acq_date.date() if isinstance(acq_date, datetime) else acq_date
-
-                    annual_depreciation = float(total_cost) / float(useful_life)
-                    years_owned = (datetime.now().date() - acq_date).days / 365.25
-                    accumulated_depreciation = min(annual_depreciation * years_owned, float(total_cost))
-                    book_value = float(total_cost) - accumulated_depreciation
-
-                    data.append({
-                        'Asset ID': asset.get('asset_id') if isinstance(asset, dict) else getattr(asset, 'asset_id', ''),
-                        'Name': asset.get('name') if isinstance(asset, dict) else getattr(asset, 'name', ''),
-                        'Model Number': asset.get('model_number') if isinstance(asset, dict) else getattr(asset, 'model_number', '') or '',
-                        'Serial Number': asset.get('serial_number') if isinstance(asset, dict) else getattr(asset, 'serial_number', '') or '',
-                        'Original Cost': float(total_cost),
-                        'Useful Life': useful_life,
-                        'Annual Depreciation': round(annual_depreciation, 2),
-                        'Accumulated Depreciation': round(accumulated_depreciation, 2),
-                        'Book Value': round(book_value, 2),
-                        'Years Owned': round(years_owned, 2)
-                    })
-                except Exception:
-                    # skip problematic records
-                    continue
-        return data
+        return list(depreciation_rows(self._asset_dicts(assets)))
     
     def prepare_valuation_data(self, assets):
         """Prepare asset valuation report data"""
-        data = []
-        total_original_cost = 0
-        total_book_value = 0
-        
-        for asset in assets:
-            # Support dict or ORM asset
-            original_cost = float(asset.get('total_cost') or 0) if isinstance(asset, dict) else float(getattr(asset, 'total_cost', 0) or 0)
-            acq = asset.get('acquisition_date') if isinstance(asset, dict) else getattr(asset, 'acquisition_date', None)
-            useful_life = asset.get('useful_life') if isinstance(asset, dict) else getattr(asset, 'useful_life', None)
-            book_value = original_cost
-
-            if acq and useful_life and original_cost > 0:
-                try:
-                    if isinstance(acq, str):
-                        acq_date = datetime.fromisoformat(acq).date()
-                    else:
-                        acq_date = acq if isinstance(acq, datetime) else acq
-                        acq_date = acq_date.date() if isinstance(acq_date, datetime) else acq_date
-
-                    years_owned = (datetime.now().date() - acq_date).days / 365.25
-                    annual_depreciation = original_cost / float(useful_life)
-                    accumulated_depreciation = min(annual_depreciation * years_owned, original_cost)
-                    book_value = original_cost - accumulated_depreciation
-                except Exception:
-                    book_value = original_cost
-
-            total_original_cost += original_cost
-            total_book_value += book_value
-
-            category = asset.get('category_name') or asset.get('category') if isinstance(asset, dict) else (asset.category.name if getattr(asset, 'category', None) else 'Unknown')
-            data.append({
-                'Asset ID': asset.get('asset_id') if isinstance(asset, dict) else getattr(asset, 'asset_id', ''),
-                'Name': asset.get('name') if isinstance(asset, dict) else getattr(asset, 'name', ''),
-                'Model Number': asset.get('model_number') if isinstance(asset, dict) else getattr(asset, 'model_number', '') or '',
-                'Serial Number': asset.get('serial_number') if isinstance(asset, dict) else getattr(asset, 'serial_number', '') or '',
-                'Category': category or 'Unknown',
-                'Original Cost': original_cost,
-                'Current Book Value': round(book_value, 2),
-                'Depreciation': round(original_cost - book_value, 2)
-            })
-        
-        # Add summary
-        data.append({
-            'Asset ID': 'TOTAL',
-            'Name': 'Summary',
-            'Category': '',
-            'Original Cost': round(total_original_cost, 2),
-            'Current Book Value': round(total_book_value, 2),
-            'Depreciation': round(total_original_cost - total_book_value, 2)
-        })
-        
-        return data
+        return list(valuation_rows(self._asset_dicts(assets)))
     
     def prepare_maintenance_data(self, assets):
         """Prepare maintenance schedule data"""
         # This is a placeholder - in a real system, you'd have maintenance records
-        data = []
-        for asset in assets:
-            if isinstance(asset, dict):
-                category = asset.get('category_name') or asset.get('category') or 'Unknown'
-                status = asset.get('status') or 'Unknown'
-                aid = asset.get('asset_id')
-                name = asset.get('name')
-            else:
-                category = asset.category.name if asset.category else 'Unknown'
-                status = asset.status.value if asset.status else 'Unknown'
-                aid = getattr(asset, 'asset_id', '')
-                name = getattr(asset, 'name', '')
-            # Model and Serial may come from dict or ORM
-            model = asset.get('model_number') if isinstance(asset, dict) else getattr(asset, 'model_number', '')
-            serial = asset.get('serial_number') if isinstance(asset, dict) else getattr(asset, 'serial_number', '')
-
-            data.append({
-                'Asset ID': aid,
-                'Name': name,
-                'Model Number': model or '',
-                'Serial Number': serial or '',
-                'Category': category,
-                'Last Maintenance': 'N/A',  # Would come from maintenance records
-                'Next Maintenance Due': 'N/A',  # Would be calculated
-                'Maintenance Type': 'Routine',
-                'Status': status
-            })
-        return data
+        return list(maintenance_rows(self._asset_dicts(assets)))
     
     def filter_by_date_range(self, data, start_date, end_date):
         """Filter data by date range (simplified implementation)"""
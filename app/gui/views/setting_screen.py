@@ -537,11 +537,11 @@ class SettingScreen(QWidget):
                     item = QTableWidgetItem(str(val) if not pd.isna(val) else '')
                     self.ui.importPreviewTable.setItem(r, c, item)
 
-            # Prepare AssetService
-            from ...services.asset_service import AssetService
+            # Prepare BulkImportService
+            from ...services.bulk_import_service import BulkImportService
             from ...services.settings_service import SettingsService
             
-            asset_service = AssetService()
+            import_service = BulkImportService()
             settings_service = SettingsService()
             
             # Check if asset creation is allowed
@@ -557,7 +557,7 @@ class SettingScreen(QWidget):
                     uid = parent.get_user_id()
                     uname = parent.get_username()
                     if uid is not None:
-                        asset_service.set_current_user(uid or 0, uname or 'System')
+                        import_service.set_current_user(uid or 0, uname or 'System')
             except Exception:
                 pass
 
@@ -577,7 +577,6 @@ class SettingScreen(QWidget):
                 return None
 
             # Get or create default category for imports
-            from ...services.asset_service import AssetService as AS
             default_category = None
             try:
                 with get_db() as temp_session:
@@ -625,8 +624,19 @@ class SettingScreen(QWidget):
             failed = 0
             self.ui.importProgressBar.setValue(0)
             failed_rows = []
+            # Parsed rows are collected and inserted in chunks by BulkImportService
+            pending_assets = []
+            pending_rows = []
+
+            def failed_row(idx, message):
+                row = df.iloc[idx]
+                return {
+                    'row_index': idx + 2,  # +2 because: 0-indexed + header row
+                    'message': message,
+                    **{c: (str(row[c]) if c in row.index and not pd.isna(row[c]) else '') for c in cols}
+                }
             
-            # Process each row
+            # Parse each row
             for idx in range(total):
                 row = df.iloc[idx]
                 asset_data = {}
@@ -737,43 +747,48 @@ class SettingScreen(QWidget):
                     
                     # IMPORTANT: Provide unit_cost (NOT NULL constraint)
                     if 'unit_cost' not in asset_data or asset_data.get('unit_cost') is None:
-                        total = asset_data.get('total_cost', 0)
+                        row_total = asset_data.get('total_cost', 0)
                         qty = asset_data.get('quantity', 1)
-                        asset_data['unit_cost'] = float(total) / float(qty) if qty else 0
+                        asset_data['unit_cost'] = float(row_total) / float(qty) if qty else 0
 
-                    # Create asset via service
-                    result = asset_service.create_asset(asset_data)
-                    
-                    if result.get('success'):
-                        success += 1
-                    else:
-                        failed += 1
-                        error_msg = result.get('message', 'Unknown error')
-                        print(f"Row {idx + 2} failed: {error_msg} | Asset: {asset_data.get('asset_id', 'N/A')}")
-                        failed_rows.append({
-                            'row_index': idx + 2,  # +2 because: 0-indexed + header row
-                            'message': error_msg,
-                            **{c: (str(row[c]) if c in row.index and not pd.isna(row[c]) else '') for c in cols}
-                        })
+                    pending_assets.append(asset_data)
+                    pending_rows.append(idx)
                         
                 except Exception as e:
                     failed += 1
-                    failed_rows.append({
-                        'row_index': idx + 2,
-                        'message': str(e),
-                        **{c: (str(row[c]) if c in row.index and not pd.isna(row[c]) else '') for c in cols}
-                    })
-
-                # Update progress UI
-                percent = int((idx + 1) / total * 100)
+                    failed_rows.append(failed_row(idx, str(e)))
+
+                # Keep the UI responsive while parsing large files
+                if idx % 500 == 0:
+                    QApplication.processEvents()
+
+            def on_progress(processed, imported, import_failed):
+                percent = int((processed + failed) / total * 100)
                 self.ui.importProgressBar.setValue(percent)
-                self.ui.importSuccessLabel.setText(f"Success: {success}")
-                self.ui.importFailedLabel.setText(f"Failed: {failed}")
+                self.ui.importSuccessLabel.setText(f"Success: {imported}")
+                self.ui.importFailedLabel.setText(f"Failed: {failed + import_failed}")
                 self.ui.importPercentLabel.setText(f"{percent}%")
-                
-                # Allow UI to update every 10 rows to improve performance
-                if idx % 10 == 0:
-                    QApplication.processEvents()
+                QApplication.processEvents()
+
+            result = import_service.import_assets(
+                pending_assets, progress_callback=on_progress, source=Path(file_path).name
+            )
+            success = result.get('imported', 0)
+            for failure in result.get('failed_rows', []):
+                idx = pending_rows[failure['index']]
+                print(f"Row {idx + 2} failed: {failure['message']} | Asset: {failure.get('asset_id') or 'N/A'}")
+                failed_rows.append(failed_row(idx, failure['message']))
+            if not result.get('success'):
+                # Rows that were never attempted (e.g. creation disabled) also count as failed
+                attempted = success + len(result.get('failed_rows', []))
+                for idx in pending_rows[attempted:]:
+                    failed_rows.append(failed_row(idx, result.get('message', 'Unknown error')))
+            failed = len(failed_rows)
+            failed_rows.sort(key=lambda r: r['row_index'])
+            self.ui.importProgressBar.setValue(100)
+            self.ui.importSuccessLabel.setText(f"Success: {success}")
+            self.ui.importFailedLabel.setText(f"Failed: {failed}")
+            self.ui.importPercentLabel.setText("100%")
 
             # Import complete
             msg = f"Import complete — Successful: {success}, Failed: {failed}"
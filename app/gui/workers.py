@@ -0,0 +1,165 @@
+"""
+Background data loading for GUI screens.
+
+Screens used to query the database on the GUI thread, which froze the
+window whenever the database was slow or remote. BackgroundLoader runs a
+plain function on a shared QThreadPool and hands its return value back to
+a callback on the GUI thread:
+
+    self.loader = BackgroundLoader(self)
+    self.loader.start(read_rows, filters, on_result=self.show_rows)
+
+The function runs on a worker thread, so it must only read data (services
+return primitive dicts/tuples) and never touch widgets. Each worker thread
+gets its own scoped SQLAlchemy session via get_db(), which is discarded
+when the job ends.
+
+Starting a new load cancels the previous one on the same loader, and
+destroying the loader's parent widget cancels whatever is pending; results
+of cancelled (stale) loads are discarded instead of being delivered.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal, Slot
+
+from ..core.database import remove_thread_session
+
+# Worker threads shared by all loaders; kept small so background reads do
+# not exhaust the database connection pool (5 connections by default).
+MAX_LOADER_THREADS = 3
+
+_pool: Optional[QThreadPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_loader_pool() -> QThreadPool:
+    """Return the thread pool used for background loads."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = QThreadPool()
+                _pool.setMaxThreadCount(MAX_LOADER_THREADS)
+    return _pool
+
+
+class LoadToken:
+    """Cancellation flag shared between a loader and one queued job."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _TaskSignals(QObject):
+    # Created on the GUI thread, so emissions from the worker are queued
+    # back to the GUI thread. Arguments: token, value, error message.
+    finished = Signal(object, object, object)
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, token: LoadToken, fn: Callable, args, kwargs):
+        super().__init__()
+        self.token = token
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+
+    def run(self):
+        value, error = None, None
+        # Jobs that went stale while waiting in the queue are skipped
+        if not self.token.cancelled:
+            try:
+                value = self.fn(*self.args, **self.kwargs)
+            except Exception as e:
+                error = str(e)
+            finally:
+                remove_thread_session()
+        # Always report back so the loader can release the task
+        self.signals.finished.emit(self.token, value, error)
+
+
+class _PendingLoad:
+    """Plain-Python holder for the current token.
+
+    It is referenced from the parent's destroyed signal, which fires while
+    the loader itself is being torn down, so it must not be a QObject.
+    """
+
+    def __init__(self):
+        self.token: Optional[LoadToken] = None
+
+    def cancel(self, *args):
+        if self.token is not None:
+            self.token.cancel()
+            self.token = None
+
+
+class BackgroundLoader(QObject):
+    """Runs one load at a time on the loader pool and delivers the latest result."""
+
+    def __init__(self, parent: Optional[QObject] = None, pool: Optional[QThreadPool] = None):
+        super().__init__(parent)
+        self._pool = pool or get_loader_pool()
+        self._pending = _PendingLoad()
+        self._tasks = {}
+        if parent is not None:
+            parent.destroyed.connect(self._pending.cancel)
+
+    def start(self, fn: Callable, *args, on_result: Optional[Callable[[Any], None]] = None,
+              on_error: Optional[Callable[[str], None]] = None, **kwargs) -> LoadToken:
+        """Run ``fn(*args, **kwargs)`` on a worker thread, cancelling the previous load.
+
+        ``on_result(value)`` or ``on_error(message)`` is called on the GUI
+        thread unless the load was cancelled in the meantime.
+        """
+        self.cancel()
+        token = LoadToken()
+        task = _LoadTask(token, fn, args, kwargs)
+        task.signals.finished.connect(self._on_finished)
+        # Keep the Python task (and its signals) alive until it reports back
+        self._tasks[token] = (task, on_result, on_error)
+        self._pending.token = token
+        self._pool.start(task)
+        return token
+
+    def cancel(self):
+        """Discard the current load; its result will not be delivered."""
+        token = self._pending.token
+        self._pending.cancel()
+        entry = self._tasks.get(token)
+        # Jobs that have not started yet are removed from the queue outright
+        if entry is not None and self._pool.tryTake(entry[0]):
+            self._tasks.pop(token, None)
+
+    def is_loading(self) -> bool:
+        return self._pending.token is not None
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """Block until queued loads finish and deliver their results.
+
+        Intended for tests and shutdown; screens should rely on callbacks.
+        """
+        done = self._pool.waitForDone(timeout_ms)
+        QCoreApplication.sendPostedEvents()
+        QCoreApplication.processEvents()
+        return done
+
+    @Slot(object, object, object)
+    def _on_finished(self, token, value, error):
+        _task, on_result, on_error = self._tasks.pop(token, (None, None, None))
+        if token.cancelled or token is not self._pending.token:
+            return
+        self._pending.token = None
+        if error is None:
+            if on_result is not None:
+                on_result(value)
+        elif on_error is not None:
+            on_error(error)
+        else:
+            print(f"Background load failed: {error}")
@@ -3,6 +3,7 @@ from pathlib import Path
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+import threading
 import traceback
 
 try:
@@ -84,6 +85,19 @@ def main():
     except Exception as e:
         print(f"Database initialization error: {e}")
         sys.exit(1)
+
+    # Move audit records past the retention horizon into the monthly
+    # archive (at most once a day) without holding up start-up
+    def _archive_audit_logs():
+        from app.core.database import remove_thread_session
+        try:
+            from app.services.audit_archive import run_scheduled_audit_archival
+            run_scheduled_audit_archival()
+        except Exception as e:
+            print(f"Error archiving audit logs: {e}")
+        finally:
+            remove_thread_session()
+    threading.Thread(target=_archive_audit_logs, name="audit-archival", daemon=True).start()
     
     # Create application
     app = QApplication(sys.argv)
@@ -96,6 +110,12 @@ def main():
             print("Application: last window closed, quitting application")
         except Exception:
             pass
+        # Write any queued audit records before the process exits
+        try:
+            from app.services.audit_writer import shutdown_audit_writer
+            shutdown_audit_writer()
+        except Exception as e:
+            print(f"Error flushing audit log on shutdown: {e}")
     app.lastWindowClosed.connect(_on_last_window_closed)
     
     # Initialize theme manager and apply theme
@@ -0,0 +1,106 @@
+"""
+Column-projection read layer for assets.
+
+List views, exports and the API only need plain values, so instead of
+hydrating full Asset ORM instances (plus category/subcategory relationships)
+these helpers SELECT exactly the columns that AssetService._asset_to_dict
+exposes, with the category and subcategory names joined in SQL. Rows come
+back as AssetRow namedtuples, which are compact (no per-instance __dict__),
+never enter the session identity map and cannot raise DetachedInstanceError.
+"""
+
+from collections import namedtuple
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from ..core.models import Asset, AssetCategory, AssetSubCategory
+
+# Field order matches the dict produced by AssetService._asset_to_dict
+ASSET_ROW_FIELDS = (
+    'id', 'asset_id', 'name', 'description',
+    'category_id', 'category_name', 'subcategory_id', 'subcategory_name',
+    'acquisition_date', 'expiry_date', 'supplier', 'quantity',
+    'unit_cost', 'total_cost', 'useful_life', 'depreciation_method',
+    'depreciation_percentage', 'accumulated_depreciation', 'net_book_value',
+    'location', 'custodian', 'department', 'assigned_to_id', 'status',
+    'asset_tag', 'serial_number', 'model_number', 'remarks',
+    'created_at', 'updated_at',
+)
+
+AssetRow = namedtuple('AssetRow', ASSET_ROW_FIELDS)
+
+_JOINED_COLUMNS = {
+    'category_name': AssetCategory.name.label('category_name'),
+    'subcategory_name': AssetSubCategory.name.label('subcategory_name'),
+}
+
+_FLOAT_FIELDS = frozenset((
+    'unit_cost', 'total_cost', 'depreciation_percentage',
+    'accumulated_depreciation', 'net_book_value',
+))
+_DATE_FIELDS = frozenset(('acquisition_date', 'expiry_date'))
+_ENUM_FIELDS = frozenset(('status', 'depreciation_method'))
+
+
+def validate_asset_fields(fields: Sequence[str]) -> tuple:
+    """Return ``fields`` as a tuple, without duplicates.
+
+    Raises:
+        ValueError: if a name is not one of ASSET_ROW_FIELDS
+    """
+    unknown = [name for name in fields if name not in ASSET_ROW_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown asset field(s): {', '.join(unknown)}")
+    return tuple(dict.fromkeys(fields))
+
+
+def asset_projection_columns(fields: Optional[Sequence[str]] = None):
+    """Return the SELECT list for ``fields`` (default: AssetRow, in ASSET_ROW_FIELDS order)."""
+    names = ASSET_ROW_FIELDS if fields is None else fields
+    return [_JOINED_COLUMNS.get(name, getattr(Asset, name, None)) for name in names]
+
+
+def query_asset_rows(session: Session, fields: Optional[Sequence[str]] = None):
+    """Start a projection query over assets with category names outer-joined.
+
+    The returned Query can be filtered and ordered on Asset columns exactly
+    like session.query(Asset); use row_to_asset_row / asset_row_to_dict on
+    the results. ``fields`` (names from ASSET_ROW_FIELDS) narrows the SELECT
+    list to those columns, and the category / subcategory joins are only
+    added when their names are selected; convert such rows with
+    asset_row_to_dict(row, fields).
+    """
+    names = ASSET_ROW_FIELDS if fields is None else fields
+    query = session.query(*asset_projection_columns(names)).select_from(Asset)
+    if 'category_name' in names:
+        query = query.outerjoin(AssetCategory, Asset.category_id == AssetCategory.id)
+    if 'subcategory_name' in names:
+        query = query.outerjoin(AssetSubCategory, Asset.subcategory_id == AssetSubCategory.id)
+    return query
+
+
+def row_to_asset_row(row) -> AssetRow:
+    """Convert a SQLAlchemy Row from query_asset_rows into an AssetRow."""
+    return AssetRow._make(row)
+
+
+def asset_row_to_dict(row, fields: Sequence[str] = ASSET_ROW_FIELDS) -> Dict[str, Any]:
+    """Convert a projection row into the dict shape used across the app.
+
+    Mirrors AssetService._asset_to_dict: enums become their values, dates
+    become ISO strings and money columns become floats. Pass the same
+    ``fields`` as to a narrowed query_asset_rows(fields=...).
+    """
+    result = {}
+    for name, value in zip(fields, row):
+        if value is not None:
+            if name in _ENUM_FIELDS:
+                value = getattr(value, 'value', value)
+            elif name in _FLOAT_FIELDS:
+                value = float(value)
+            elif name in _DATE_FIELDS and isinstance(value, (date, datetime)):
+                value = value.isoformat()
+        result[name] = value
+    return result
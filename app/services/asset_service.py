@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, or_, and_
-from typing import List, Optional, Dict, Any, Union
+from sqlalchemy import func, desc, or_, and_, select, case, update
+from sqlalchemy import inspect as sa_inspect
+from typing import Iterator, List, Optional, Dict, Any, Union, Tuple
 from datetime import datetime, timedelta, date
+from decimal import Decimal
+from enum import Enum
+import base64
 import json
 
 from ..core.models import (
@@ -10,15 +14,99 @@ from ..core.models import (
 )
 from ..core.models import PermissionType, UserRole
 from ..core.database import get_db
+from ..core.fulltext import asset_search_subquery
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import DetachedInstanceError
 from .audit_service import AuditService
+from .audit_payload import ASSET_IDENTITY_FIELDS, diff_values
+from .data_version import get_data_version
 from .settings_service import SettingsService
+from .permission_cache import get_permission_resolver
+from .asset_projection import (
+    AssetRow, query_asset_rows, row_to_asset_row, asset_row_to_dict, validate_asset_fields
+)
 import logging
 
 # Custom type hints
 AssetFilters = Dict[str, Union[str, int, None]]
 AssetStatistics = Dict[str, Union[float, Dict[str, int]]]
+AssetPage = Dict[str, Any]
+
+# Sort keys accepted by query_assets. Every key is paired with Asset.id as a
+# tie-breaker so the (sort column, id) tuple is unique and can be used as a
+# keyset cursor. Every listed column must be NOT NULL: a NULL compares as
+# unknown in the keyset predicate, so such rows would silently drop out of
+# later pages (created_at was made NOT NULL by
+# migrations/backfill_asset_created_at.py for this reason).
+ASSET_SORT_KEYS = {
+    'created_at': Asset.created_at,
+    'acquisition_date': Asset.acquisition_date,
+    'name': Asset.name,
+    'asset_id': Asset.asset_id,
+    'total_cost': Asset.total_cost,
+}
+DEFAULT_ASSET_SORT = '-created_at'
+MAX_ASSET_PAGE_SIZE = 1000
+
+# Rows fetched per round trip by iter_assets
+STREAM_BATCH_SIZE = 1000
+
+# Grouping keys for iter_assets, matching how reports label missing values
+ASSET_GROUP_KEYS = {
+    'category': func.coalesce(func.nullif(AssetCategory.name, ''), 'Unknown'),
+    'department': func.coalesce(func.nullif(Asset.department, ''), 'Not Assigned'),
+}
+
+# Ids per UPDATE ... WHERE id IN (...) statement in bulk operations
+BULK_CHUNK_SIZE = 500
+
+# Columns bulk_update_assets may not set (identity, unique and maintained columns)
+BULK_PROTECTED_FIELDS = ('id', 'asset_id', 'asset_tag', 'created_at', 'updated_at', 'net_book_value')
+
+
+def _audit_value(value: Any) -> Any:
+    """Convert a column value the way _asset_to_dict does for audit change-sets."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _parse_sort(sort: Optional[str]) -> Tuple[str, bool]:
+    """Split a sort spec like '-created_at' into (key, descending)."""
+    spec = (sort or DEFAULT_ASSET_SORT).strip()
+    descending = spec.startswith('-')
+    key = spec.lstrip('+-')
+    if key not in ASSET_SORT_KEYS:
+        raise ValueError(f"Unsupported sort key: {key}")
+    return key, descending
+
+
+def _encode_cursor(sort_key: str, value: Any, row_id: int) -> str:
+    """Encode the last row of a page as an opaque, URL-safe cursor."""
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    payload = json.dumps({'k': sort_key, 'v': value, 'id': row_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, int]:
+    """Decode a cursor produced by _encode_cursor for the given sort key."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        if payload.get('k') != sort_key:
+            raise ValueError("cursor was issued for a different sort order")
+        value = payload['v']
+        if sort_key == 'created_at' and value is not None:
+            value = datetime.fromisoformat(value)
+        elif sort_key == 'acquisition_date' and value is not None:
+            value = date.fromisoformat(value)
+        return value, int(payload['id'])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
 
 
 class AssetService:
@@ -28,11 +116,14 @@ class AssetService:
         self._current_user_id = None
         self._current_user_name = None
     
-    def set_current_user(self, user_id: int, user_name: str):
-        """Set current user for audit logging."""
+    def set_current_user(self, user_id: int, user_name: str, global_audit_context: bool = True):
+        """Set current user for permission checks and audit logging.
+
+        global_audit_context is passed to AuditService.set_current_user.
+        """
         self._current_user_id = user_id
         self._current_user_name = user_name
-        self.audit_service.set_current_user(user_id, user_name)
+        self.audit_service.set_current_user(user_id, user_name, global_context=global_audit_context)
     
     def get_session(self) -> Session:
         """Get a new database session"""
@@ -103,28 +194,309 @@ class AssetService:
             print(f"Error getting subcategories: {e}")
             return []
     
-    def get_all_assets(self, session: Session = None) -> List[Asset]:
-        """Get all assets with category and subcategory information"""
+    def _apply_asset_filters(self, query, filters: Optional[AssetFilters]):
+        """Push asset filters down into the SQL WHERE clause.
+
+        Supported keys (all optional, None/empty values are ignored):
+          - status: status value/name, AssetStatus or a list of them
+          - category_id, subcategory_id, category_name
+          - department, location (exact match)
+          - date_from / date_to: acquisition_date range (inclusive)
+          - expiry_from / expiry_to: expiry_date range (inclusive)
+          - search: full-text match (terms as prefixes, see app.core.fulltext)
+            on the indexed asset columns, or a category name prefix; without
+            a search index, a case-insensitive substring of asset_id, name,
+            model or serial number, department, location or category name
+          - include_retired: include RETIRED/DISPOSED assets (default False)
+        """
+        filters = filters or {}
+
+        status = filters.get('status')
+        if status:
+            statuses = status if isinstance(status, (list, tuple, set)) else [status]
+            query = query.filter(Asset.status.in_([self._coerce_status(s) for s in statuses]))
+        elif not filters.get('include_retired'):
+            query = query.filter(Asset.status.notin_([AssetStatus.RETIRED, AssetStatus.DISPOSED]))
+
+        if filters.get('category_id') is not None:
+            query = query.filter(Asset.category_id == filters['category_id'])
+        if filters.get('subcategory_id') is not None:
+            query = query.filter(Asset.subcategory_id == filters['subcategory_id'])
+        if filters.get('category_name'):
+            # Category names are unique; comparing with a scalar subquery (rather
+            # than IN) lets the planner use the category_id index
+            query = query.filter(Asset.category_id == (
+                select(AssetCategory.id).where(AssetCategory.name == filters['category_name'])
+                .scalar_subquery()
+            ))
+        if filters.get('department'):
+            query = query.filter(Asset.department == filters['department'])
+        if filters.get('location'):
+            query = query.filter(Asset.location == filters['location'])
+        if filters.get('date_from'):
+            query = query.filter(Asset.acquisition_date >= self._coerce_date(filters['date_from']))
+        if filters.get('date_to'):
+            query = query.filter(Asset.acquisition_date <= self._coerce_date(filters['date_to']))
+        if filters.get('expiry_from'):
+            query = query.filter(Asset.expiry_date >= self._coerce_date(filters['expiry_from']))
+        if filters.get('expiry_to'):
+            query = query.filter(Asset.expiry_date <= self._coerce_date(filters['expiry_to']))
+        search = (filters.get('search') or '').strip()
+        matches = asset_search_subquery(query.session, search) if search else None
+        if matches is not None:
+            query = query.filter(or_(
+                Asset.id.in_(select(matches.c.id)),
+                Asset.category_id.in_(
+                    select(AssetCategory.id).where(AssetCategory.name.ilike(f"{search}%"))
+                )
+            ))
+        elif search:
+            pattern = f"%{search}%"
+            query = query.filter(or_(
+                Asset.asset_id.ilike(pattern),
+                Asset.name.ilike(pattern),
+                Asset.model_number.ilike(pattern),
+                Asset.serial_number.ilike(pattern),
+                Asset.department.ilike(pattern),
+                Asset.location.ilike(pattern),
+                Asset.category_id.in_(
+                    select(AssetCategory.id).where(AssetCategory.name.ilike(pattern))
+                )
+            ))
+        return query
+
+    @staticmethod
+    def _coerce_status(value: Any) -> AssetStatus:
+        """Accept an AssetStatus, its value ('In Use') or its name ('IN_USE')."""
+        if isinstance(value, AssetStatus):
+            return value
+        try:
+            return AssetStatus(value)
+        except ValueError:
+            try:
+                return AssetStatus[str(value).upper()]
+            except KeyError:
+                raise ValueError(f"Unknown asset status: {value}")
+
+    @staticmethod
+    def _coerce_date(value: Any) -> date:
+        """Accept date/datetime objects or ISO strings for date filters."""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value).split('T')[0])
+
+    def _build_asset_page_query(self, session: Session, filters: Optional[AssetFilters],
+                                sort: Optional[str], cursor: Optional[str],
+                                select: Optional[Tuple[str, ...]] = None):
+        """Build the filtered, keyset-ordered asset query shared by all list readers.
+
+        ``select`` narrows the columns (see _asset_select_fields).
+        """
+        sort_key, descending = _parse_sort(sort)
+        sort_col = ASSET_SORT_KEYS[sort_key]
+
+        query = self._apply_asset_filters(query_asset_rows(session, select), filters)
+
+        if cursor:
+            value, last_id = _decode_cursor(cursor, sort_key)
+            if descending:
+                query = query.filter(or_(sort_col < value, and_(sort_col == value, Asset.id < last_id)))
+            else:
+                query = query.filter(or_(sort_col > value, and_(sort_col == value, Asset.id > last_id)))
+
+        return query.order_by(*self._asset_order(sort)), sort_key
+
+    @staticmethod
+    def _asset_select_fields(fields: Optional[List[str]], *required: str) -> Optional[Tuple[str, ...]]:
+        """Columns to SELECT for a sparse read of ``fields`` (None: every column).
+
+        ``required`` columns (id, the sort key, ...) are selected as well
+        but left out of the returned dicts by _sparse.
+        """
+        if fields is None:
+            return None
+        return tuple(dict.fromkeys((*validate_asset_fields(fields), *required)))
+
+    @staticmethod
+    def _sparse(row, select: Optional[Tuple[str, ...]], fields: Optional[List[str]]) -> Dict[str, Any]:
+        if select is None:
+            return asset_row_to_dict(row)
+        values = asset_row_to_dict(row, select)
+        return {name: values[name] for name in fields}
+
+    def _asset_order(self, sort: Optional[str], *leading) -> List[Any]:
+        """ORDER BY terms for ``sort`` with Asset.id as tie-breaker, after ``leading``."""
+        sort_key, descending = _parse_sort(sort)
+        sort_col = ASSET_SORT_KEYS[sort_key]
+        if descending:
+            return [*leading, sort_col.desc(), Asset.id.desc()]
+        return [*leading, sort_col.asc(), Asset.id.asc()]
+
+    def query_assets(self, filters: Optional[AssetFilters] = None, sort: Optional[str] = None,
+                     limit: Optional[int] = 100, cursor: Optional[str] = None,
+                     offset: Optional[int] = None, session: Session = None,
+                     as_rows: bool = False, fields: Optional[List[str]] = None) -> AssetPage:
+        """Return one page of assets using keyset pagination.
+
+        Filters are applied in SQL (see _apply_asset_filters). ``sort`` is one
+        of ASSET_SORT_KEYS, optionally prefixed with '-' for descending order
+        (default '-created_at'). Pass the ``next_cursor`` of a page back as
+        ``cursor`` to fetch the following page; ``offset`` is only honoured
+        for legacy callers that do not use cursors. ``limit=None`` returns all
+        matching rows. With ``as_rows=True`` the items are AssetRow tuples
+        instead of dicts (see get_asset_rows). ``fields`` (names from
+        ASSET_ROW_FIELDS) limits both the SELECT list and the item dicts.
+
+        Returns a dict with keys: items (list of asset dicts), next_cursor
+        (str or None) and has_more (bool).
+
+        Raises:
+            ValueError: if the sort key, status filter, cursor or a field is
+                invalid, or ``fields`` is combined with ``as_rows``.
+        """
+        if limit is not None:
+            limit = max(1, min(int(limit), MAX_ASSET_PAGE_SIZE))
+        if fields is not None and as_rows:
+            raise ValueError("fields cannot be combined with as_rows")
+        # The keyset cursor needs the sort column and id of the last row
+        select = self._asset_select_fields(fields, 'id', _parse_sort(sort)[0])
+
+        def _run(s: Session) -> AssetPage:
+            query, sort_key = self._build_asset_page_query(s, filters, sort, cursor, select)
+            if offset and not cursor:
+                query = query.offset(offset)
+            if limit is not None:
+                # Fetch one extra row to learn whether another page exists
+                query = query.limit(limit + 1)
+            rows = query.all()
+
+            has_more = limit is not None and len(rows) > limit
+            if has_more:
+                rows = rows[:limit]
+            next_cursor = None
+            if has_more and rows:
+                last = rows[-1]
+                next_cursor = _encode_cursor(sort_key, getattr(last, sort_key), last.id)
+            return {
+                'items': [row_to_asset_row(r) if as_rows else self._sparse(r, select, fields) for r in rows],
+                'next_cursor': next_cursor,
+                'has_more': has_more
+            }
+
+        if session is None:
+            with get_db() as s:
+                return _run(s)
+        return _run(session)
+
+    def get_asset_rows(self, filters: Optional[AssetFilters] = None, sort: Optional[str] = None,
+                       session: Session = None) -> List[AssetRow]:
+        """Return matching assets as compact AssetRow tuples.
+
+        This is the cheapest bulk read: no ORM instances and no dict per row.
+        Enum columns hold AssetStatus/DepreciationMethod members and dates are
+        date objects; use asset_row_to_dict when the dict shape is needed.
+        """
+        def _run(s: Session) -> List[AssetRow]:
+            query, _sort_key = self._build_asset_page_query(s, filters, sort, None)
+            return [row_to_asset_row(r) for r in query.all()]
+
+        if session is None:
+            with get_db() as s:
+                return _run(s)
+        return _run(session)
+
+    def iter_assets(self, filters: Optional[AssetFilters] = None, sort: Optional[str] = None,
+                    group_by: Optional[str] = None, batch_size: int = STREAM_BATCH_SIZE,
+                    session: Session = None, fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield matching assets as dicts without loading them all.
+
+        Rows are fetched ``batch_size`` at a time (yield_per, with a
+        server-side cursor on PostgreSQL), so memory stays flat however many
+        assets match. The database session stays open until the generator
+        is exhausted or closed.
+
+        Args:
+            filters: See _apply_asset_filters
+            sort: See query_assets
+            group_by: One of ASSET_GROUP_KEYS; rows are ordered by that
+                group first (within a group by ``sort``)
+            batch_size: Rows fetched per round trip
+            session: Session to read through (a new one by default)
+            fields: Only SELECT and yield these columns (see query_assets)
+        """
+        if session is None:
+            with get_db() as session:
+                yield from self.iter_assets(filters, sort, group_by, batch_size, session=session, fields=fields)
+            return
+        # Grouping by category orders on the joined category name
+        select = self._asset_select_fields(fields, *(('category_name',) if group_by == 'category' else ()))
+        query, _sort_key = self._build_asset_page_query(session, filters, sort, None, select)
+        if group_by:
+            query = query.order_by(None).order_by(*self._asset_order(sort, ASSET_GROUP_KEYS[group_by]))
+        query = query.execution_options(stream_results=True).yield_per(batch_size)
+        for row in query:
+            yield self._sparse(row, select, fields)
+
+    def get_data_version(self, session: Session = None) -> Dict[str, Tuple]:
+        """Return the asset and category data-version stamps (see data_version)."""
+        if session is not None:
+            return get_data_version(session)
+        with get_db() as session:
+            return get_data_version(session)
+
+    def get_asset_summary(self, filters: Optional[AssetFilters] = None,
+                          session: Session = None) -> Dict[str, Any]:
+        """Aggregate the assets matching ``filters`` in SQL.
+
+        Returns a dict with keys: total (count), total_value, highest_value,
+        highest_name, expiring_soon (expiry_date within the next 30 days)
+        and expired (expiry_date already passed).
+        """
+        def _run(s: Session) -> Dict[str, Any]:
+            today = date.today()
+            soon = today + timedelta(days=30)
+            totals = self._apply_asset_filters(s.query(
+                func.count(Asset.id),
+                func.coalesce(func.sum(Asset.total_cost), 0),
+                func.sum(case((Asset.expiry_date < today, 1), else_=0)),
+                func.sum(case((and_(Asset.expiry_date >= today, Asset.expiry_date <= soon), 1), else_=0))
+            ), filters).one()
+            highest = (self._apply_asset_filters(s.query(Asset.name, Asset.total_cost), filters)
+                       .order_by(Asset.total_cost.desc(), Asset.id.asc())
+                       .first())
+            return {
+                'total': int(totals[0] or 0),
+                'total_value': float(totals[1] or 0),
+                'highest_value': float(highest.total_cost or 0) if highest else 0.0,
+                'highest_name': highest.name if highest else None,
+                'expired': int(totals[2] or 0),
+                'expiring_soon': int(totals[3] or 0)
+            }
+
         try:
-            # Always return primitive dicts to avoid DetachedInstanceError when UI accesses attributes
             if session is None:
                 with get_db() as s:
-                    rows = (s.query(Asset)
-                           .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                           .filter(Asset.status.notin_([AssetStatus.RETIRED, AssetStatus.DISPOSED]))
-                           .order_by(Asset.created_at.desc())
-                           .all())
-                    # Convert to primitive dicts while session is still open to avoid DetachedInstanceError
-                    return [self._asset_to_dict(a) for a in rows]
-            else:
-                rows = (session.query(Asset)
-                       .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                       .filter(Asset.status.notin_([AssetStatus.RETIRED, AssetStatus.DISPOSED]))
-                       .order_by(Asset.created_at.desc())
-                       .all())
-
-            # If a session was provided by the caller, convert using that active session
-            return [self._asset_to_dict(a) for a in rows]
+                    return _run(s)
+            return _run(session)
+        except Exception as e:
+            print(f"Error getting asset summary: {e}")
+            return {'total': 0, 'total_value': 0.0, 'highest_value': 0.0, 'highest_name': None,
+                    'expired': 0, 'expiring_soon': 0}
+
+    def get_all_assets(self, session: Session = None, skip: int = 0, limit: Optional[int] = None,
+                       filters: Optional[AssetFilters] = None) -> List[Dict[str, Any]]:
+        """Get non-retired assets (newest first) with category and subcategory information.
+
+        ``skip``/``limit``/``filters`` are pushed down into SQL; with the
+        defaults every matching asset is returned. Prefer query_assets for
+        paging through large registers.
+        """
+        try:
+            # Always return primitive dicts to avoid DetachedInstanceError when UI accesses attributes
+            page = self.query_assets(filters=filters, limit=limit, offset=skip, session=session)
+            return page['items']
         except Exception as e:
             print(f"Error getting all assets: {e}")
             return []
@@ -151,26 +523,12 @@ class AssetService:
             if category_name.lower() == 'all':
                 return self.get_all_assets(session)
 
-            if session is None:
-                with get_db() as s:
-                    rows = (s.query(Asset)
-                           .join(AssetCategory)
-                           .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                           .filter(AssetCategory.name == category_name)
-                           .order_by(Asset.created_at.desc())
-                           .all())
-                    # Convert to primitive dicts while session is still open
-                    return [self._asset_to_dict(a) for a in rows]
-            else:
-                rows = (session.query(Asset)
-                       .join(AssetCategory)
-                       .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                       .filter(AssetCategory.name == category_name)
-                       .order_by(Asset.created_at.desc())
-                       .all())
-
-            # If caller supplied an active session, convert using that session
-            return [self._asset_to_dict(a) for a in rows]
+            page = self.query_assets(
+                filters={'category_name': category_name, 'include_retired': True},
+                limit=None,
+                session=session
+            )
+            return page['items']
         except Exception as e:
             print(f"Error getting assets by category name: {e}")
             return []
@@ -178,12 +536,11 @@ class AssetService:
     def get_assets_by_category_id(self, session: Session, category_id: int) -> List[Asset]:
         """Get all assets in a specific category"""
         try:
-            rows = (session.query(Asset)
-                   .options(joinedload(Asset.category), joinedload(Asset.subcategory))
+            rows = (query_asset_rows(session)
                    .filter(Asset.category_id == category_id)
                    .order_by(Asset.created_at.desc())
                    .all())
-            return [self._asset_to_dict(a) for a in rows]
+            return [asset_row_to_dict(r) for r in rows]
         except Exception as e:
             print(f"Error getting assets by category ID: {e}")
             return []
@@ -273,39 +630,51 @@ class AssetService:
         """Get assets added in the last N days"""
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
-            rows = (session.query(Asset)
-                   .options(joinedload(Asset.category))
+            rows = (query_asset_rows(session)
                    .filter(Asset.created_at >= cutoff_date)
                    .order_by(desc(Asset.created_at))
                    .limit(10)
                    .all())
-            return [self._asset_to_dict(a) for a in rows]
+            return [asset_row_to_dict(r) for r in rows]
         except Exception as e:
             print(f"Error getting recently added assets: {e}")
             return []
     
-    def search_assets(self, query: str) -> List[Asset]:
-        """Search assets by name, asset_id, description, or location"""
+    def search_assets(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Full-text search over asset IDs, tags, serial/model numbers, names,
+        locations and descriptions.
+
+        Terms match as prefixes and must all match; results are ordered by
+        relevance (identifier matches first), then newest first. Uses the
+        FTS5 / tsvector index from app.core.fulltext and falls back to LIKE
+        matching when the database has none.
+        """
         if not query.strip():
-            return self.get_all_assets()
+            return self.get_all_assets(limit=limit)
             
         try:
             with get_db() as session:
-                search_term = f'%{query}%'
-                rows = (session.query(Asset)
-                       .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                       .filter(
-                           or_(
-                               Asset.name.like(search_term),
-                               Asset.asset_id.like(search_term),
-                               Asset.description.like(search_term),
-                               Asset.location.like(search_term),
-                               Asset.asset_tag.like(search_term)
-                           )
-                       )
-                       .order_by(Asset.created_at.desc())
-                       .all())
-                return [self._asset_to_dict(a) for a in rows]
+                matches = asset_search_subquery(session, query)
+                if matches is not None:
+                    rows_query = (query_asset_rows(session)
+                                  .join(matches, matches.c.id == Asset.id)
+                                  .order_by(matches.c.rank, Asset.created_at.desc()))
+                else:
+                    search_term = f'%{query}%'
+                    rows_query = (query_asset_rows(session)
+                                  .filter(
+                                      or_(
+                                          Asset.name.like(search_term),
+                                          Asset.asset_id.like(search_term),
+                                          Asset.description.like(search_term),
+                                          Asset.location.like(search_term),
+                                          Asset.asset_tag.like(search_term)
+                                      )
+                                  )
+                                  .order_by(Asset.created_at.desc()))
+                if limit:
+                    rows_query = rows_query.limit(limit)
+                return [asset_row_to_dict(r) for r in rows_query.all()]
         except Exception as e:
             print(f"Error searching assets: {e}")
             return []
@@ -324,6 +693,37 @@ class AssetService:
         # asset service so users can create assets regardless of total_cost.
         return {"success": True, "message": "Asset creation allowed"}
     
+    @staticmethod
+    def prepare_new_asset_data(asset_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize input for a new asset and keep only Asset columns.
+
+        Converts status/depreciation_method strings to enums (unknown status
+        falls back to AVAILABLE, unknown method is dropped) and derives
+        net_book_value from total_cost and accumulated_depreciation. The
+        input dict is updated in place, as create_asset always did.
+        """
+        # Handle enum conversions
+        if 'status' in asset_data and isinstance(asset_data['status'], str):
+            try:
+                asset_data['status'] = AssetStatus(asset_data['status'])
+            except ValueError:
+                asset_data['status'] = AssetStatus.AVAILABLE
+
+        if 'depreciation_method' in asset_data and isinstance(asset_data['depreciation_method'], str):
+            try:
+                asset_data['depreciation_method'] = DepreciationMethod(asset_data['depreciation_method'])
+            except ValueError:
+                asset_data.pop('depreciation_method', None)
+
+        # Calculate net book value
+        if 'total_cost' in asset_data and 'accumulated_depreciation' in asset_data:
+            asset_data['net_book_value'] = asset_data['total_cost'] - asset_data.get('accumulated_depreciation', 0)
+        elif 'total_cost' in asset_data:
+            asset_data['net_book_value'] = asset_data['total_cost']
+        # Remove keys that are not columns on the Asset model (e.g., annual_depreciation)
+        allowed_fields = set(Asset.__table__.columns.keys())
+        return {k: v for k, v in asset_data.items() if k in allowed_fields}
+
     def create_asset(self, asset_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new asset with validation and audit logging"""
         # Check permissions
@@ -333,37 +733,7 @@ class AssetService:
         
         try:
             with get_db() as session:
-                # Handle enum conversions
-                if 'status' in asset_data and isinstance(asset_data['status'], str):
-                    try:
-                        asset_data['status'] = AssetStatus(asset_data['status'])
-                    except ValueError:
-                        asset_data['status'] = AssetStatus.AVAILABLE
-                
-                if 'depreciation_method' in asset_data and isinstance(asset_data['depreciation_method'], str):
-                    try:
-                        asset_data['depreciation_method'] = DepreciationMethod(asset_data['depreciation_method'])
-                    except ValueError:
-                        asset_data.pop('depreciation_method', None)
-                
-                # Calculate net book value
-                if 'total_cost' in asset_data and 'accumulated_depreciation' in asset_data:
-                    asset_data['net_book_value'] = asset_data['total_cost'] - asset_data.get('accumulated_depreciation', 0)
-                elif 'total_cost' in asset_data:
-                    asset_data['net_book_value'] = asset_data['total_cost']
-                # Remove keys that are not columns on the Asset model (e.g., annual_depreciation)
-                try:
-                    allowed_fields = set(Asset.__table__.columns.keys())
-                except Exception:
-                    allowed_fields = { 
-                        'id','asset_id','description','name','category_id','subcategory_id','acquisition_date',
-                        'supplier','quantity','unit_cost','total_cost','useful_life','depreciation_method',
-                        'depreciation_percentage','accumulated_depreciation','net_book_value','location','custodian','department',
-                        'assigned_to_id','status','asset_tag','serial_number','remarks','created_at','updated_at','expiry_date',
-                        'model_number'
-                    }
-
-                filtered_data = {k: v for k, v in asset_data.items() if k in allowed_fields}
+                filtered_data = self.prepare_new_asset_data(asset_data)
 
                 # Ensure asset_id is unique: if provided and exists, generate a unique fallback
                 provided_asset_id = filtered_data.get('asset_id')
@@ -394,7 +764,7 @@ class AssetService:
                     description=f"Created asset: {asset.name} (ID: {asset.asset_id})",
                     table_name="assets",
                     record_id=str(asset.id),
-                    new_values=self._asset_to_dict(asset)
+                    new_values=self._audit_changes(None, self._asset_to_dict(asset))[1]
                 )
                 
                 return {
@@ -413,11 +783,8 @@ class AssetService:
         """Get an asset by ID"""
         try:
             with get_db() as session:
-                asset = (session.query(Asset)
-                       .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                       .filter(Asset.id == asset_id)
-                       .first())
-                return self._asset_to_dict(asset) if asset else None
+                row = query_asset_rows(session).filter(Asset.id == asset_id).first()
+                return asset_row_to_dict(row) if row else None
         except Exception as e:
             print(f"Error getting asset by ID: {e}")
             return None
@@ -505,13 +872,14 @@ class AssetService:
                 
                 # Audit logging
                 new_values = self._asset_to_dict(asset)
+                old_changes, new_changes = self._audit_changes(old_values, new_values)
                 self.audit_service.log_action(
                     action="ASSET_UPDATED",
                     description=f"Updated asset: {asset.name} (ID: {asset.asset_id})",
                     table_name="assets",
                     record_id=str(asset.id),
-                    old_values=old_values,
-                    new_values=new_values
+                    old_values=old_changes,
+                    new_values=new_changes
                 )
                 
                 return {
@@ -561,13 +929,14 @@ class AssetService:
                         return {"success": False, "message": f"Asset update failed on retry: constraint violation ({str(ie)})"}
 
                     new_values = self._asset_to_dict(asset2)
+                    old_changes, new_changes = self._audit_changes(old_values, new_values)
                     self.audit_service.log_action(
                         action="ASSET_UPDATED",
                         description=f"Updated asset (retry): {asset2.name} (ID: {asset2.asset_id})",
                         table_name="assets",
                         record_id=str(asset2.id),
-                        old_values=old_values,
-                        new_values=new_values
+                        old_values=old_changes,
+                        new_values=new_changes
                     )
 
                     return {"success": True, "message": "Asset updated successfully (retry)", "asset": new_values}
@@ -595,29 +964,14 @@ class AssetService:
         except Exception:
             aid = None
 
-        is_admin = False
-        user_info = None
-        try:
-            # Treat the special admin session id (0) as admin without DB lookup
-            if getattr(self, '_current_user_id', None) == 0:
-                is_admin = True
-            elif getattr(self, '_current_user_id', None):
-                from .user_service import UserService
-                user_svc = UserService()
-                user_info = user_svc.get_user_by_id(self._current_user_id)
-                if user_info and user_info.get('role') == UserRole.ADMIN.value:
-                    is_admin = True
-        except Exception as e:
-            # Non-fatal: log and continue; permission checks below will handle failures
-            logger.exception("Error fetching current user for delete check: %s", e)
-
-        # Permission-first policy: explicit Delete permission grants ability
-        # to delete regardless of the global toggle. Admins bypass checks.
-
         # Don't allow deletion of assets that are currently in use
         # Use a session-bound instance to check status safely.
         try:
-            if aid is not None:
+            if isinstance(asset, Asset) and not sa_inspect(asset).detached:
+                # Session-bound instance (delete_asset): no need to query again
+                if asset.status == AssetStatus.IN_USE:
+                    return {"success": False, "message": "Cannot delete assets that are currently in use"}
+            elif aid is not None:
                 with get_db() as session:
                     a = session.query(Asset).filter(Asset.id == aid).first()
                     if a and a.status == AssetStatus.IN_USE:
@@ -635,6 +989,30 @@ class AssetService:
             logger.exception("Error checking asset usage state: %s", e)
             return {"success": False, "message": "Error verifying asset state"}
 
+        return self._check_delete_permission()
+
+    def _check_delete_permission(self) -> Dict[str, Any]:
+        """Check whether the current user may delete assets at all."""
+        logger = logging.getLogger(__name__)
+        is_admin = False
+        user_info = None
+        try:
+            # Treat the special admin session id (0) as admin without DB lookup
+            if getattr(self, '_current_user_id', None) == 0:
+                is_admin = True
+            elif getattr(self, '_current_user_id', None):
+                from .user_service import UserService
+                user_svc = UserService()
+                user_info = user_svc.get_user_by_id(self._current_user_id)
+                if user_info and user_info.get('role') == UserRole.ADMIN.value:
+                    is_admin = True
+        except Exception as e:
+            # Non-fatal: log and continue; permission checks below will handle failures
+            logger.exception("Error fetching current user for delete check: %s", e)
+
+        # Permission-first policy: explicit Delete permission grants ability
+        # to delete regardless of the global toggle. Admins bypass checks.
+
         # Admins bypass the permission check and are allowed
         if is_admin:
             return {"success": True, "message": "Asset deletion allowed"}
@@ -645,29 +1023,19 @@ class AssetService:
         # 3. Otherwise deny
         try:
             # Ensure we log current context for debugging permission failures
-            logger.debug("can_delete_asset called: current_user_id=%r, aid=%r", getattr(self, '_current_user_id', None), aid)
+            logger.debug("_check_delete_permission called: current_user_id=%r", getattr(self, '_current_user_id', None))
             if not getattr(self, '_current_user_id', None):
                 logger.warning("Deletion blocked: no authenticated user in AssetService context")
                 return {"success": False, "message": "Deletion requires an authenticated user"}
 
-            # Prefer to check permissions directly in the DB to avoid any
-            # potential context/instance issues with UserService.
+            # Check the user's role grants DELETE_ASSET (cached role bitmask)
             try:
-                with get_db() as session:
-                    user = session.query(User).options(joinedload(User.role)).filter(User.id == self._current_user_id).first()
-                    if user and user.role:
-                        # Check RolePermission for DELETE_ASSET
-                        from ..core.models import RolePermission, Permission
-                        rp = session.query(RolePermission).join(Permission, RolePermission.permission_id == Permission.id).filter(
-                            RolePermission.role_id == user.role.id,
-                            Permission.name == PermissionType.DELETE_ASSET,
-                            RolePermission.granted == 'true'
-                        ).first()
-                        if rp:
-                            logger.debug("User %r allowed via RolePermission", self._current_user_id)
-                            return {"success": True, "message": "Asset deletion allowed"}
+                if get_permission_resolver().has_permission(
+                        self._current_user_id, PermissionType.DELETE_ASSET, admin_has_all=False):
+                    logger.debug("User %r allowed via RolePermission", self._current_user_id)
+                    return {"success": True, "message": "Asset deletion allowed"}
             except Exception as e:
-                logger.exception("Error checking RolePermission directly: %s", e)
+                logger.exception("Error checking RolePermission: %s", e)
 
             # Fall back to global toggle if no explicit permission found
             if self.settings_service.can_delete_asset():
@@ -842,12 +1210,15 @@ class AssetService:
                             desc = f"Soft-deleted asset: {old_vals.get('name')} (ID: {old_vals.get('asset_id')})"
                             if reason:
                                 desc = f"{desc} -- Reason: {reason}"
+                            old_changes, new_changes = self._audit_changes(
+                                old_vals, dict(old_vals, status=AssetStatus.RETIRED.value))
                             self.audit_service.log_action(
                                 action="ASSET_SOFT_DELETED",
                                 description=desc,
                                 table_name="assets",
                                 record_id=str(rid),
-                                old_values=old_vals
+                                old_values=old_changes,
+                                new_values=new_changes
                             )
                             logger.info("Soft-delete fallback committed for asset id=%r", rid)
                             return {"success": True, "message": "Asset retired (soft-deleted)"}
@@ -860,12 +1231,15 @@ class AssetService:
                 desc = f"Soft-deleted asset: {asset_data.get('name')} (ID: {asset_data.get('asset_id')})"
                 if reason:
                     desc = f"{desc} -- Reason: {reason}"
+                old_changes, new_changes = self._audit_changes(
+                    asset_data, dict(asset_data, status=AssetStatus.RETIRED.value))
                 self.audit_service.log_action(
                     action="ASSET_SOFT_DELETED",
                     description=desc,
                     table_name="assets",
                     record_id=str(asset_data.get('id') or aid),
-                    old_values=asset_data
+                    old_values=old_changes,
+                    new_values=new_changes
                 )
 
                 return {"success": True, "message": "Asset retired (soft-deleted)"}
@@ -878,51 +1252,296 @@ class AssetService:
         """Get an asset by its user-defined asset_id"""
         try:
             with get_db() as session:
-                asset = (session.query(Asset)
-                       .options(joinedload(Asset.category), joinedload(Asset.subcategory))
-                       .filter(Asset.asset_id == asset_id)
-                       .first())
-                return self._asset_to_dict(asset) if asset else None
+                row = query_asset_rows(session).filter(Asset.asset_id == asset_id).first()
+                return asset_row_to_dict(row) if row else None
         except Exception as e:
             print(f"Error getting asset by asset ID: {e}")
             return None
     
+    def get_assets_by_asset_ids(self, asset_ids: List[str], fields: Optional[List[str]] = None,
+                                session: Session = None) -> Dict[str, Any]:
+        """Fetch many assets by their user-defined asset_id in one query.
+
+        Ids are looked up BULK_CHUNK_SIZE at a time with asset_id IN (...).
+
+        Args:
+            asset_ids: User-defined asset ids; duplicates are ignored
+            fields: Only SELECT and return these columns (see query_assets)
+            session: Session to read through (a new one by default)
+
+        Returns:
+            Dict with items (asset dicts in request order) and missing
+            (asset ids that do not exist)
+
+        Raises:
+            ValueError: if a field is unknown
+        """
+        wanted = list(dict.fromkeys(asset_ids))
+        select = self._asset_select_fields(fields, 'asset_id')
+
+        def _run(s: Session) -> Dict[str, Any]:
+            found = {}
+            for start in range(0, len(wanted), BULK_CHUNK_SIZE):
+                chunk = wanted[start:start + BULK_CHUNK_SIZE]
+                rows = query_asset_rows(s, select).filter(Asset.asset_id.in_(chunk)).all()
+                for row in rows:
+                    found[row.asset_id] = self._sparse(row, select, fields)
+            return {
+                'items': [found[asset_id] for asset_id in wanted if asset_id in found],
+                'missing': [asset_id for asset_id in wanted if asset_id not in found]
+            }
+
+        if session is None:
+            with get_db() as s:
+                return _run(s)
+        return _run(session)
+
     def bulk_update_assets(self, asset_ids: List[int], update_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Bulk update multiple assets"""
+        """Apply the same changes to many assets in one transaction.
+
+        Runs one UPDATE ... WHERE id IN (...) per BULK_CHUNK_SIZE ids instead
+        of calling update_asset per asset, and writes one audit change-set
+        per asset in the same transaction.
+
+        Args:
+            asset_ids: Database ids of the assets to update
+            update_data: Column values to set (e.g. location, status)
+
+        Returns:
+            Dict with success, message, updated_count and errors (one
+            message per asset that was not updated)
+        """
         if not self.settings_service.can_bulk_operate():
             return {
                 "success": False,
                 "message": "Bulk operations are currently disabled by system settings"
             }
-        
+        permission_check = self.can_update_asset(None, update_data)
+        if not permission_check["success"]:
+            return permission_check
+
+        values, invalid = self._prepare_bulk_values(update_data)
+        if invalid:
+            return {"success": False, "message": "; ".join(invalid)}
+        if not values:
+            return {"success": False, "message": "No changes to apply"}
+
         try:
             with get_db() as session:
-                updated_count = 0
-                errors = []
-                
-                for asset_id in asset_ids:
-                    try:
-                        result = self.update_asset(asset_id, update_data)
-                        if result["success"]:
-                            updated_count += 1
-                        else:
-                            errors.append(f"Asset {asset_id}: {result['message']}")
-                    except Exception as e:
-                        errors.append(f"Asset {asset_id}: {str(e)}")
-                
-                return {
-                    "success": True,
-                    "message": f"Updated {updated_count} assets",
-                    "updated_count": updated_count,
-                    "errors": errors
-                }
-                
+                updated_count, errors = self._bulk_apply(
+                    session, asset_ids, values, "ASSET_UPDATED",
+                    lambda row: f"Bulk updated asset: {row.name} (ID: {row.asset_id})"
+                )
+                session.commit()
+
+            return {
+                "success": True,
+                "message": f"Updated {updated_count} assets",
+                "updated_count": updated_count,
+                "errors": errors
+            }
+
+        except Exception as e:
+            print(f"Error in bulk update: {e}")
+            return {
+                "success": False,
+                "message": "Bulk update failed; no assets were changed"
+            }
+
+    def bulk_soft_delete_assets(self, asset_ids: List[int], reason: Optional[str] = None) -> Dict[str, Any]:
+        """Retire (soft-delete) many assets in one transaction.
+
+        The set-based counterpart of delete_asset(permanent=False): assets
+        that are in use are skipped and reported in errors.
+
+        Returns:
+            Dict with success, message, deleted_count and errors
+        """
+        if not self.settings_service.can_bulk_operate():
+            return {
+                "success": False,
+                "message": "Bulk operations are currently disabled by system settings"
+            }
+        permission_check = self._check_delete_permission()
+        if not permission_check["success"]:
+            return permission_check
+
+        def describe(row):
+            desc = f"Soft-deleted asset: {row.name} (ID: {row.asset_id})"
+            return f"{desc} -- Reason: {reason}" if reason else desc
+
+        def check(row):
+            if row.status == AssetStatus.IN_USE:
+                return "Cannot delete assets that are currently in use"
+            return None
+
+        try:
+            with get_db() as session:
+                deleted_count, errors = self._bulk_apply(
+                    session, asset_ids, {'status': AssetStatus.RETIRED}, "ASSET_SOFT_DELETED",
+                    describe, check=check
+                )
+                session.commit()
+
+            return {
+                "success": True,
+                "message": f"Retired {deleted_count} assets",
+                "deleted_count": deleted_count,
+                "errors": errors
+            }
+
         except Exception as e:
+            print(f"Error in bulk delete: {e}")
             return {
                 "success": False,
-                "message": f"Error in bulk update: {str(e)}"
+                "message": "Bulk delete failed; no assets were changed"
             }
 
+    def _prepare_bulk_values(self, update_data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Validate bulk update values and convert them to the column types.
+
+        Values may come straight from JSON: dates and datetimes as ISO
+        strings, numbers as int/float/str, enums by value or name. NULL is
+        only accepted for nullable columns.
+
+        Returns:
+            (values, errors)
+        """
+        values, errors = {}, []
+        columns = Asset.__table__.columns
+        for key, value in (update_data or {}).items():
+            if key not in columns:
+                errors.append(f"Unknown field: {key}")
+            elif key in BULK_PROTECTED_FIELDS:
+                errors.append(f"Field cannot be bulk updated: {key}")
+            elif value is None:
+                if columns[key].nullable:
+                    values[key] = None
+                else:
+                    errors.append(f"Field cannot be empty: {key}")
+            else:
+                try:
+                    values[key] = self._convert_bulk_value(columns[key], value)
+                except (TypeError, ValueError, KeyError):
+                    errors.append(f"Invalid {key}: {value}")
+        return values, errors
+
+    @staticmethod
+    def _convert_bulk_value(column, value: Any) -> Any:
+        """Convert a (JSON) value to the Python type of an Asset column."""
+        python_type = column.type.python_type
+        if issubclass(python_type, Enum):
+            if isinstance(value, python_type):
+                return value
+            try:
+                return python_type(value)
+            except ValueError:
+                return python_type[value]
+        if python_type is datetime:
+            return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+        if python_type is date:
+            if isinstance(value, datetime):
+                return value.date()
+            return value if isinstance(value, date) else date.fromisoformat(str(value))
+        if python_type in (int, float) and isinstance(value, bool):
+            raise TypeError("boolean is not a number")
+        if python_type is int:
+            return int(str(value))  # rejects 2.5
+        if python_type is float:
+            return float(value)
+        if python_type is str:
+            if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+                raise TypeError("expected text")
+            return str(value)
+        return value
+
+    def _bulk_apply(self, session: Session, asset_ids: List[int], values: Dict[str, Any],
+                    action: str, describe, check=None) -> Tuple[int, List[str]]:
+        """Set `values` on the given assets and audit each change.
+
+        For each chunk of ids the current values of the affected columns are
+        read (locked with FOR UPDATE on PostgreSQL), then a single UPDATE
+        sets the new ones, returning them where the dialect supports
+        RETURNING. The audit records are written in `session`'s transaction.
+
+        Args:
+            check: Optional callable(row) returning an error message for
+                rows that must be skipped
+
+        Returns:
+            (number of assets updated, errors)
+        """
+        ids = []
+        for asset_id in asset_ids or []:
+            try:
+                asset_id = int(asset_id)
+            except (TypeError, ValueError):
+                continue
+            if asset_id not in ids:
+                ids.append(asset_id)
+
+        sql_values = dict(values)
+        if 'total_cost' in values or 'accumulated_depreciation' in values:
+            total_cost = values.get('total_cost', Asset.total_cost)
+            accumulated = values.get('accumulated_depreciation', Asset.accumulated_depreciation)
+            sql_values['net_book_value'] = total_cost - func.coalesce(accumulated, 0)
+        sql_values['updated_at'] = datetime.utcnow()
+
+        tracked = [name for name in sql_values if name != 'updated_at']
+        tracked_columns = [getattr(Asset, name) for name in tracked]
+        dialect = session.get_bind().dialect
+
+        updated_count, errors, entries = 0, [], []
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_CHUNK_SIZE]
+            old_query = (session.query(Asset.id, Asset.asset_id, Asset.name, *tracked_columns)
+                         .filter(Asset.id.in_(chunk)))
+            if dialect.name == 'postgresql':
+                old_query = old_query.with_for_update()
+            old_rows = {row.id: row for row in old_query}
+
+            target_ids = []
+            for asset_id in chunk:
+                row = old_rows.get(asset_id)
+                error = "Asset not found" if row is None else (check(row) if check else None)
+                if error:
+                    errors.append(f"Asset {asset_id}: {error}")
+                else:
+                    target_ids.append(asset_id)
+            if not target_ids:
+                continue
+
+            statement = (update(Asset)
+                         .where(Asset.id.in_(target_ids))
+                         .values(**sql_values)
+                         .execution_options(synchronize_session=False))
+            if dialect.update_returning:
+                new_rows = session.execute(statement.returning(Asset.id, *tracked_columns)).all()
+            else:
+                session.execute(statement)
+                new_rows = session.query(Asset.id, *tracked_columns).filter(Asset.id.in_(target_ids)).all()
+
+            for new_row in new_rows:
+                old_row = old_rows[new_row.id]
+                identity = {'id': old_row.id, 'asset_id': old_row.asset_id, 'name': old_row.name}
+                old_changes, new_changes = self._audit_changes(
+                    dict(identity, **{name: _audit_value(old_row._mapping[name]) for name in tracked}),
+                    dict(identity, **{name: _audit_value(new_row._mapping[name]) for name in tracked})
+                )
+                updated_count += 1
+                if old_changes or new_changes:
+                    entries.append({
+                        'action': action,
+                        'description': describe(old_row),
+                        'table_name': 'assets',
+                        'record_id': str(old_row.id),
+                        'old_values': old_changes,
+                        'new_values': new_changes,
+                    })
+
+        self.audit_service.log_actions(session, entries)
+        return updated_count, errors
+
     def restore_asset(self, asset_id: int) -> Dict[str, Any]:
         """Restore an asset previously marked retired/disposed by setting status to AVAILABLE and logging the action."""
         try:
@@ -941,18 +1560,30 @@ class AssetService:
                 session.commit()
 
                 # Audit log
+                old_changes, new_changes = self._audit_changes(
+                    old, dict(old, status=AssetStatus.AVAILABLE.value))
                 self.audit_service.log_action(
                     action="ASSET_RESTORED",
                     description=f"Restored asset: {old.get('name')} (ID: {old.get('asset_id')})",
                     table_name="assets",
                     record_id=str(asset_id),
-                    old_values=old
+                    old_values=old_changes,
+                    new_values=new_changes
                 )
 
                 return {"success": True, "message": "Asset restored"}
         except Exception as e:
             return {"success": False, "message": f"Error restoring asset: {str(e)}"}
     
+    def _audit_changes(self, old: Optional[Dict[str, Any]],
+                       new: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Reduce two _asset_to_dict snapshots to an audit change-set.
+
+        Permanent deletions still log the full snapshot, as it is the last
+        copy of the record.
+        """
+        return diff_values(old, new, keep=ASSET_IDENTITY_FIELDS, ignore=('updated_at',))
+
     def _asset_to_dict(self, asset: Asset) -> Dict[str, Any]:
         """Convert asset object to dictionary for audit logging"""
         # Read attributes defensively: some callers may pass detached instances
@@ -1036,5 +1667,7 @@ class AssetService:
             'asset_tag': _safe_getattr(asset, 'asset_tag'),
             'serial_number': _safe_getattr(asset, 'serial_number'),
             'model_number': _safe_getattr(asset, 'model_number'),
-            'remarks': _safe_getattr(asset, 'remarks')
+            'remarks': _safe_getattr(asset, 'remarks'),
+            'created_at': _safe_getattr(asset, 'created_at'),
+            'updated_at': _safe_getattr(asset, 'updated_at')
         }
@@ -0,0 +1,423 @@
+"""
+Monthly archive of old audit log records.
+
+audit_logs only ever grew, so inserts, searches and statistics slowed down
+with the age of the installation. AuditArchive.archive() moves records
+older than a cutoff out of the table into one gzip-compressed JSONL file
+per calendar month:
+
+    <AUDIT_ARCHIVE_DIR>/audit-2023-01.jsonl.gz
+    <AUDIT_ARCHIVE_DIR>/index.json
+
+index.json holds a small summary per month (file, record count,
+timestamp and id range, per-action counts) so readers can skip months
+that cannot match a query without opening them. Each batch is appended
+as a new gzip member and the index is replaced atomically before the
+rows are deleted from the database, so an interrupted run at worst leaves
+records in both places; ids already in a month file are skipped when the
+batch is retried.
+
+Reading the archive means decompressing and scanning whole months, so
+AuditService only continues into it when a query asks for archived
+records: filters with include_archived=True, or a date range / cursor
+that reaches back past the archive horizon (the newest archived record;
+see AuditArchive.reaches). Records from the archive carry
+'archived': True. Deletion records (ARCHIVE_RETAINED_ACTIONS) are never
+archived, since the Recently Deleted screen shows their reasons.
+run_scheduled_audit_archival() applies the audit_log_retention_days
+setting at most once a day and is started in the background on app
+start-up; scripts/archive_audit_logs.py runs it on demand.
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.config import Config
+from ..core.database import get_db
+from ..core.fulltext import search_terms
+from ..core.models import AuditLog
+from .audit_payload import decode_values
+
+ARCHIVE_BATCH_SIZE = 5000
+ARCHIVE_INDEX_FILE = 'index.json'
+
+# Decompressed months kept in memory while paging through the archive
+ARCHIVE_CACHED_MONTHS = 2
+
+# Kept in audit_logs past the retention period (deletion reasons)
+ARCHIVE_RETAINED_ACTIONS = ('ASSET_SOFT_DELETED', 'ASSET_PERMANENTLY_DELETED')
+
+# Used when the retention setting is missing or invalid
+DEFAULT_RETENTION_DAYS = 365
+
+_WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+ARCHIVED_COLUMNS = (
+    'id', 'action', 'table_name', 'record_id', 'description', 'old_values',
+    'new_values', 'user_id', 'username', 'ip_address', 'user_agent', 'timestamp',
+)
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+
+def _record_to_dict(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an archived record like AuditService._audit_log_to_dict."""
+    result = dict(record)
+    for key in ('old_values', 'new_values'):
+        result[key] = decode_values(record.get(key))
+    result['user'] = None
+    result['archived'] = True
+    return result
+
+
+class AuditArchive:
+    """Reads and writes the monthly audit archive in one directory."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or Config().AUDIT_ARCHIVE_DIR)
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_mtime = None
+        self._months: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+
+    # -- index -----------------------------------------------------------
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / ARCHIVE_INDEX_FILE
+
+    def index(self) -> Dict[str, Any]:
+        """Return the archive index ({'months': {...}, 'last_run': ...})."""
+        with self._lock:
+            try:
+                mtime = self.index_path.stat().st_mtime
+            except OSError:
+                return {'months': {}, 'last_run': None}
+            # Another process (the archive script) may have rewritten it
+            if self._index is None or mtime != self._index_mtime:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+                self._index_mtime = mtime
+            return self._index
+
+    def _save_index(self, index: Dict[str, Any]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+        self._index = index
+        self._index_mtime = self.index_path.stat().st_mtime
+
+    def total_count(self) -> int:
+        """Number of archived records."""
+        return sum(month['count'] for month in self.index()['months'].values())
+
+    def has_records(self) -> bool:
+        return bool(self.index()['months'])
+
+    def horizon(self) -> Optional[str]:
+        """Timestamp (ISO string) of the newest archived record, if any."""
+        stamps = [m['max_timestamp'] for m in self.index()['months'].values() if m['count']]
+        return max(stamps) if stamps else None
+
+    def reaches(self, filters: Optional[Dict[str, Any]] = None,
+                before: Optional[Tuple[datetime, int]] = None) -> bool:
+        """Whether a query with these filters (and cursor position) should
+        continue into the archive.
+
+        True when filters['include_archived'] is set, or when date_from,
+        date_to or the cursor lies at or before the archive horizon;
+        open-ended queries (e.g. a plain search) stay in the table.
+        """
+        filters = filters or {}
+        horizon = self.horizon()
+        if horizon is None:
+            return False
+        if filters.get('include_archived'):
+            return True
+        bounds = [_as_datetime(filters.get('date_from')), _as_datetime(filters.get('date_to')),
+                  before[0] if before else None]
+        return any(bound is not None and bound.isoformat() <= horizon for bound in bounds)
+
+    # -- writing ---------------------------------------------------------
+
+    def archive(self, cutoff: datetime, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+        """Move audit records with timestamp < `cutoff` into the archive.
+
+        Records with an action in ARCHIVE_RETAINED_ACTIONS stay in the table.
+
+        Returns:
+            Number of records archived
+        """
+        total = 0
+        checked_months = set()
+        with self._lock:
+            while True:
+                with get_db() as session:
+                    logs = (session.query(AuditLog)
+                            .filter(AuditLog.timestamp < cutoff,
+                                    AuditLog.action.notin_(ARCHIVE_RETAINED_ACTIONS))
+                            .order_by(AuditLog.timestamp, AuditLog.id)
+                            .limit(batch_size)
+                            .all())
+                    if not logs:
+                        break
+                    records = [self._log_to_record(log) for log in logs]
+                    self._append(records, checked_months)
+                    ids = [log.id for log in logs]
+                    session.query(AuditLog).filter(AuditLog.id.in_(ids)).delete(synchronize_session=False)
+                total += len(records)
+            index = dict(self.index(), last_run=datetime.utcnow().isoformat())
+            self._save_index(index)
+        return total
+
+    def _reindex_month(self, month: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild a month's index entry from its file."""
+        records = self._read_month(month, entry)
+        if not records:
+            return {'file': entry['file'], 'count': 0, 'actions': {}, 'min_timestamp': None,
+                    'max_timestamp': None, 'min_id': None, 'max_id': None}
+        actions: Dict[str, int] = {}
+        for record in records:
+            actions[record['action']] = actions.get(record['action'], 0) + 1
+        return {
+            'file': entry['file'], 'count': len(records), 'actions': actions,
+            'min_timestamp': records[-1]['timestamp'], 'max_timestamp': records[0]['timestamp'],
+            'min_id': min(r['id'] for r in records), 'max_id': max(r['id'] for r in records),
+        }
+
+    def _log_to_record(self, log: AuditLog) -> Dict[str, Any]:
+        record = {column: getattr(log, column) for column in ARCHIVED_COLUMNS}
+        record['timestamp'] = log.timestamp.isoformat()
+        return record
+
+    def _append(self, records: List[Dict[str, Any]], checked_months: set):
+        by_month: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_month.setdefault(record['timestamp'][:7], []).append(record)
+
+        index = json.loads(json.dumps(self.index()))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for month, month_records in by_month.items():
+            entry = index['months'].get(month) or {
+                'file': f'audit-{month}.jsonl.gz', 'count': 0, 'actions': {},
+                'min_timestamp': None, 'max_timestamp': None, 'min_id': None, 'max_id': None,
+            }
+            if month not in checked_months and (self.directory / entry['file']).exists():
+                # An interrupted run may have written records that were not
+                # deleted (or indexed); only the first batch per run can overlap
+                existing = {r['id'] for r in self._read_month(month, entry)}
+                if entry['count'] != len(existing):
+                    entry = self._reindex_month(month, entry)
+                month_records = [r for r in month_records if r['id'] not in existing]
+            checked_months.add(month)
+            index['months'][month] = entry
+            if not month_records:
+                continue
+
+            # Appending writes another gzip member; readers see one stream
+            payload = ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in month_records)
+            with open(self.directory / entry['file'], 'ab') as raw:
+                with gzip.GzipFile(fileobj=raw, mode='ab') as gz:
+                    gz.write(payload.encode('utf-8'))
+                raw.flush()
+                os.fsync(raw.fileno())
+
+            timestamps = [r['timestamp'] for r in month_records]
+            ids = [r['id'] for r in month_records]
+            if entry['count']:
+                timestamps += [entry['min_timestamp'], entry['max_timestamp']]
+                ids += [entry['min_id'], entry['max_id']]
+            entry['count'] += len(month_records)
+            entry['min_timestamp'], entry['max_timestamp'] = min(timestamps), max(timestamps)
+            entry['min_id'], entry['max_id'] = min(ids), max(ids)
+            for record in month_records:
+                entry['actions'][record['action']] = entry['actions'].get(record['action'], 0) + 1
+        self._save_index(index)
+
+    # -- reading ---------------------------------------------------------
+
+    def _read_month(self, month: str, entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return a month's records, newest first (cached)."""
+        path = self.directory / entry['file']
+        try:
+            stat = path.stat()
+        except OSError:
+            return []
+        key = (month, stat.st_size, stat.st_mtime_ns)
+        cached = self._months.get(key)
+        if cached is not None:
+            self._months.move_to_end(key)
+            return cached
+
+        records = {}
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record['id']] = record
+        ordered = sorted(records.values(), key=lambda r: (r['timestamp'], r['id']), reverse=True)
+
+        for stale in [k for k in self._months if k[0] == month]:
+            del self._months[stale]
+        self._months[key] = ordered
+        while len(self._months) > ARCHIVE_CACHED_MONTHS:
+            self._months.popitem(last=False)
+        return ordered
+
+    def _candidate_months(self, filters: Dict[str, Any], before: Optional[Tuple[datetime, int]]):
+        """Yield (month, entry) that may hold matches, newest month first."""
+        date_from = _as_datetime(filters.get('date_from'))
+        date_to = _as_datetime(filters.get('date_to'))
+        for month, entry in sorted(self.index()['months'].items(), reverse=True):
+            if not entry['count']:
+                continue
+            if date_from and entry['max_timestamp'] < date_from.isoformat():
+                continue
+            if date_to and entry['min_timestamp'] > date_to.isoformat():
+                continue
+            if before and entry['min_timestamp'] > before[0].isoformat():
+                continue
+            if filters.get('action') and filters['action'] not in entry['actions']:
+                continue
+            yield month, entry
+
+    def _matcher(self, filters: Dict[str, Any], before: Optional[Tuple[datetime, int]]):
+        date_from = _as_datetime(filters.get('date_from'))
+        date_to = _as_datetime(filters.get('date_to'))
+        date_from = date_from.isoformat() if date_from else None
+        date_to = date_to.isoformat() if date_to else None
+        before_key = (before[0].isoformat(), before[1]) if before else None
+        # Same semantics as the full-text index: every word is a prefix
+        words = [w for term in search_terms(filters.get('search')) for w in _WORD_PATTERN.findall(term.lower())]
+
+        def matches(record: Dict[str, Any]) -> bool:
+            if filters.get('action') and record['action'] != filters['action']:
+                return False
+            if filters.get('table_name') and record['table_name'] != filters['table_name']:
+                return False
+            if filters.get('record_id') is not None and record['record_id'] != str(filters['record_id']):
+                return False
+            if filters.get('user_id') and record['user_id'] != filters['user_id']:
+                return False
+            if date_from and record['timestamp'] < date_from:
+                return False
+            if date_to and record['timestamp'] > date_to:
+                return False
+            if before_key and (record['timestamp'], record['id']) >= before_key:
+                return False
+            if words:
+                text = ' '.join(record.get(k) or '' for k in ('description', 'action', 'username'))
+                text_words = _WORD_PATTERN.findall(text.lower())
+                return all(any(t.startswith(w) for t in text_words) for w in words)
+            return True
+
+        return matches
+
+    def iter_records(self, filters: Optional[Dict[str, Any]] = None,
+                     before: Optional[Tuple[datetime, int]] = None) -> Iterable[Dict[str, Any]]:
+        """Yield matching archived records as audit log dicts, newest first.
+
+        Args:
+            filters: get_audit_logs-style filters (action, table_name,
+                record_id, user_id, date_from, date_to, search)
+            before: only records strictly before this (timestamp, id)
+        """
+        filters = filters or {}
+        matches = self._matcher(filters, before)
+        with self._lock:
+            months = list(self._candidate_months(filters, before))
+        for month, entry in months:
+            with self._lock:
+                records = self._read_month(month, entry)
+            for record in records:
+                if matches(record):
+                    yield _record_to_dict(record)
+
+    def read(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+             offset: int = 0, before: Optional[Tuple[datetime, int]] = None) -> List[Dict[str, Any]]:
+        """Return matching archived records (newest first) as a list."""
+        results = []
+        skipped = 0
+        for record in self.iter_records(filters, before):
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(record)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+
+_archive: Optional[AuditArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_audit_archive() -> AuditArchive:
+    """Return the process-wide archive (Config().AUDIT_ARCHIVE_DIR by default)."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = AuditArchive()
+        return _archive
+
+
+def configure_audit_archive(directory=None) -> AuditArchive:
+    """Point the process-wide archive at `directory` (None: the configured default)."""
+    global _archive
+    with _archive_lock:
+        _archive = AuditArchive(directory)
+        return _archive
+
+
+def run_scheduled_audit_archival(force: bool = False, days: Optional[int] = None) -> int:
+    """Archive records past the audit_log_retention_days setting.
+
+    Runs at most once per (UTC) day unless `force` is set; `days`
+    overrides the retention setting.
+
+    Returns:
+        Number of records archived
+    """
+    from .audit_service import AuditService
+    from .settings_service import SettingsService
+
+    archive = get_audit_archive()
+    last_run = archive.index().get('last_run')
+    if not force and last_run and last_run[:10] == datetime.utcnow().date().isoformat():
+        return 0
+
+    if days is None:
+        try:
+            days = int(SettingsService().get_setting('SYSTEM_SETTINGS', 'audit_log_retention_days',
+                                                     DEFAULT_RETENTION_DAYS))
+        except (TypeError, ValueError):
+            days = DEFAULT_RETENTION_DAYS
+    days = max(days, 1)
+
+    audit_service = AuditService()
+    # Queued records must be in the table before it is archived
+    audit_service.flush()
+    count = archive.archive(datetime.utcnow() - timedelta(days=days))
+    if count:
+        audit_service.log_action(
+            action="AUDIT_ARCHIVED",
+            description=f"Archived {count} audit logs older than {days} days to {archive.directory}"
+        )
+    return count
@@ -0,0 +1,152 @@
+"""
+Compact audit log payloads.
+
+Asset audit records used to carry a full _asset_to_dict snapshot in both
+old_values and new_values, so an edit of one field stored ~30 columns
+twice. Callers now log change-sets instead:
+
+  - diff_values(old, new) keeps only the columns whose value changed (plus
+    a few identifying columns such as name / asset_id, so listings can
+    still label the record without reading its history)
+  - encode_values() serialises a change-set as JSON, tagging dates,
+    datetimes and decimals so they decode to the same types
+    ({"$date": "2024-01-31"}), and zlib-compresses payloads larger than
+    COMPRESS_THRESHOLD bytes ("z:" + base64)
+  - decode_values() reads every format, including the plain JSON written
+    before this change
+  - reconstruct_history() replays a record's audit entries oldest first
+    and returns the full before/after view for each of them, which is
+    what the audit entry dialog shows
+"""
+
+import base64
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Payloads at least this large (serialised JSON, bytes) are compressed
+COMPRESS_THRESHOLD = 512
+
+COMPRESSED_PREFIX = 'z:'
+
+# Asset columns written to every change-set so a single record stays readable
+ASSET_IDENTITY_FIELDS = ('id', 'asset_id', 'name')
+
+# Audit actions after which the record no longer exists
+REMOVAL_ACTIONS = ('ASSET_PERMANENTLY_DELETED', 'DELETE')
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'$date': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'$decimal': str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object {value!r} is not JSON serializable")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if '$datetime' in obj:
+            return datetime.fromisoformat(obj['$datetime'])
+        if '$date' in obj:
+            return date.fromisoformat(obj['$date'])
+        if '$decimal' in obj:
+            return Decimal(obj['$decimal'])
+    return obj
+
+
+def diff_values(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]],
+                keep: Iterable[str] = (), ignore: Iterable[str] = ()) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """Reduce two snapshots of a record to the columns that changed.
+
+    Args:
+        old: Values before the change (None for a new record)
+        new: Values after the change (None for a removed record)
+        keep: Columns to include in the new (or, if there is none, old)
+            change-set even when unchanged, e.g. identifying columns
+        ignore: Columns never recorded (e.g. updated_at)
+
+    Returns:
+        (old_changes, new_changes), each None when empty
+    """
+    old = old or {}
+    new = new or {}
+    ignore = set(ignore)
+    old_changes, new_changes = {}, {}
+    for key in list(old) + [k for k in new if k not in old]:
+        if key in ignore:
+            continue
+        before, after = old.get(key), new.get(key)
+        if before == after:
+            continue
+        if before is not None:
+            old_changes[key] = before
+        if after is not None or key in old:
+            new_changes[key] = after
+
+    target, source = (new_changes, new) if new else (old_changes, old)
+    for key in keep:
+        if source.get(key) is not None and key not in target:
+            target[key] = source[key]
+    return old_changes or None, new_changes or None
+
+
+def encode_values(values: Optional[Dict[str, Any]], compress_threshold: int = COMPRESS_THRESHOLD) -> Optional[str]:
+    """Serialise a change-set for the old_values / new_values columns."""
+    if not values:
+        return None
+    text = json.dumps(values, default=_encode_value, separators=(',', ':'))
+    if compress_threshold is not None and len(text) >= compress_threshold:
+        packed = base64.b64encode(zlib.compress(text.encode('utf-8'), 9)).decode('ascii')
+        if len(packed) + len(COMPRESSED_PREFIX) < len(text):
+            return COMPRESSED_PREFIX + packed
+    return text
+
+
+def decode_values(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Read an old_values / new_values column written in any format."""
+    if not text:
+        return None
+    if text.startswith(COMPRESSED_PREFIX):
+        text = zlib.decompress(base64.b64decode(text[len(COMPRESSED_PREFIX):])).decode('utf-8')
+    return json.loads(text, object_hook=_decode_object)
+
+
+def reconstruct_history(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rebuild full before/after views of one record from its audit entries.
+
+    Args:
+        entries: Audit log dicts for a single record (decoded old_values /
+            new_values), in any order
+
+    Returns:
+        The entries oldest first, each a copy with 'before' and 'after'
+        dicts added (None where the record did not exist). Columns that
+        were never changed after the oldest available entry are only
+        known from that entry onwards.
+    """
+    ordered = sorted(entries, key=lambda e: (str(e.get('timestamp') or ''), e.get('id') or 0))
+    state: Dict[str, Any] = {}
+    exists = False
+    history = []
+    for entry in ordered:
+        old = entry.get('old_values') if isinstance(entry.get('old_values'), dict) else {}
+        new = entry.get('new_values') if isinstance(entry.get('new_values'), dict) else {}
+        before = dict(state, **old)
+        after = dict(before, **new)
+        removed = (entry.get('action') or '').upper() in REMOVAL_ACTIONS
+        history.append(dict(
+            entry,
+            before=before if (exists or old) else None,
+            after=None if removed else after,
+        ))
+        state = {} if removed else after
+        exists = not removed
+    return history
@@ -0,0 +1,172 @@
+"""
+Daily audit statistics rollup.
+
+get_audit_statistics used to run six queries over audit_logs, two of them
+GROUP BYs over the last week, on every admin screen load. audit_daily_stats
+(AuditDailyStat) keeps one count per (UTC day, action, username) instead:
+
+  - add_to_rollup() is called in the same transaction that inserts audit
+    records (the batched writer and the synchronous log_action path), as
+    one upsert per distinct key in the batch
+  - cleanup_old_logs subtracts the records it deletes; archived records
+    stay counted, they still exist (see audit_archive)
+  - rebuild_audit_rollup() recounts the table from audit_logs and the
+    archive and records that it did so in a system_configuration marker
+    (ROLLUP_MARKER_CATEGORY / ROLLUP_MARKER_KEY); ensure_audit_rollup()
+    runs it once on any database without the marker (first start after
+    upgrading), and the add_audit_daily_stats migration runs it explicitly.
+    The marker, not an empty table, decides: audit records written after
+    the upgrade land in the rollup before anyone reads the statistics
+
+Statistics then come from a few hundred rows regardless of log size.
+"""
+
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..core.database import get_session_factory
+from ..core.models import AuditDailyStat, AuditLog, SystemConfiguration
+
+RollupKey = Tuple[date, str, str]
+
+# system_configuration row recording that the rollup has been built
+ROLLUP_MARKER_CATEGORY = 'SYSTEM_STATE'
+ROLLUP_MARKER_KEY = 'audit_daily_stats_built'
+
+_checked_factory = None
+_check_lock = threading.Lock()
+
+
+def _rollup_key(timestamp, action: str, username) -> RollupKey:
+    if isinstance(timestamp, datetime):
+        day = timestamp.date()
+    elif isinstance(timestamp, date):
+        day = timestamp
+    else:
+        day = date.fromisoformat(str(timestamp)[:10])
+    return day, action, username or ''
+
+
+def _apply_deltas(session: Session, deltas: Dict[RollupKey, int]):
+    """Add `deltas` to the rollup counts (one upsert per key)."""
+    rows = [{'day': day, 'action': action, 'username': username, 'count': count}
+            for (day, action, username), count in deltas.items() if count]
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        statement = upsert(AuditDailyStat)
+        statement = statement.on_conflict_do_update(
+            index_elements=['day', 'action', 'username'],
+            set_={'count': AuditDailyStat.count + statement.excluded.count}
+        )
+        session.execute(statement, rows)
+    else:
+        for row in rows:
+            updated = session.query(AuditDailyStat).filter(
+                AuditDailyStat.day == row['day'],
+                AuditDailyStat.action == row['action'],
+                AuditDailyStat.username == row['username']
+            ).update({AuditDailyStat.count: AuditDailyStat.count + row['count']},
+                     synchronize_session=False)
+            if not updated:
+                session.add(AuditDailyStat(**row))
+        session.flush()
+
+    if any(row['count'] < 0 for row in rows):
+        session.query(AuditDailyStat).filter(AuditDailyStat.count <= 0).delete(synchronize_session=False)
+
+
+def add_to_rollup(session: Session, records: Iterable[Dict[str, Any]]):
+    """Count freshly inserted audit records (dicts of AuditLog values)."""
+    deltas: Dict[RollupKey, int] = {}
+    for record in records:
+        key = _rollup_key(record.get('timestamp') or datetime.utcnow(), record['action'], record.get('username'))
+        deltas[key] = deltas.get(key, 0) + 1
+    _apply_deltas(session, deltas)
+
+
+def subtract_from_rollup(session: Session, logs_query):
+    """Uncount the audit records selected by `logs_query` (before deleting them)."""
+    grouped = logs_query.with_entities(
+        func.date(AuditLog.timestamp), AuditLog.action, AuditLog.username, func.count(AuditLog.id)
+    ).group_by(func.date(AuditLog.timestamp), AuditLog.action, AuditLog.username).all()
+    deltas: Dict[RollupKey, int] = {}
+    for day, action, username, count in grouped:
+        key = _rollup_key(day, action, username)
+        deltas[key] = deltas.get(key, 0) - count
+    _apply_deltas(session, deltas)
+
+
+def rebuild_audit_rollup(session: Session) -> int:
+    """Recount the rollup from audit_logs and the archive; returns rows written."""
+    from .audit_archive import get_audit_archive
+
+    session.query(AuditDailyStat).delete(synchronize_session=False)
+    deltas: Dict[RollupKey, int] = {}
+    grouped = session.query(
+        func.date(AuditLog.timestamp), AuditLog.action, AuditLog.username, func.count(AuditLog.id)
+    ).group_by(func.date(AuditLog.timestamp), AuditLog.action, AuditLog.username).all()
+    for day, action, username, count in grouped:
+        key = _rollup_key(day, action, username)
+        deltas[key] = deltas.get(key, 0) + count
+    for record in get_audit_archive().iter_records():
+        key = _rollup_key(record['timestamp'], record['action'], record.get('username'))
+        deltas[key] = deltas.get(key, 0) + 1
+    _apply_deltas(session, deltas)
+    _mark_rollup_built(session)
+    return len(deltas)
+
+
+def _rollup_marker(session: Session):
+    return session.query(SystemConfiguration).filter(
+        SystemConfiguration.category == ROLLUP_MARKER_CATEGORY,
+        SystemConfiguration.key == ROLLUP_MARKER_KEY
+    ).first()
+
+
+def _mark_rollup_built(session: Session):
+    built_at = datetime.utcnow().isoformat()
+    marker = _rollup_marker(session)
+    if marker is None:
+        session.add(SystemConfiguration(
+            category=ROLLUP_MARKER_CATEGORY,
+            key=ROLLUP_MARKER_KEY,
+            value=built_at,
+            data_type='string',
+            description='When audit_daily_stats was last rebuilt from the audit log',
+            is_system='true'
+        ))
+    else:
+        marker.value = built_at
+    session.flush()
+
+
+def ensure_audit_rollup(session: Session):
+    """Backfill the rollup once per database, unless it was already built."""
+    global _checked_factory
+    factory = get_session_factory()
+    if _checked_factory is factory:
+        return
+    with _check_lock:
+        if _checked_factory is factory:
+            return
+        if _rollup_marker(session) is None:
+            rebuild_audit_rollup(session)
+            session.commit()
+        _checked_factory = factory
+
+
+def invalidate_audit_rollup_check():
+    """Make the next ensure_audit_rollup() check the rebuild marker again."""
+    global _checked_factory
+    _checked_factory = None
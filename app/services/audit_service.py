@@ -1,11 +1,17 @@
+import base64
 import json
-from datetime import datetime, date
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy import desc, and_, or_, select, insert
 
 from ..core.database import get_db
-from ..core.models import AuditLog, User
+from ..core.fulltext import audit_search_subquery
+from ..core.models import AuditDailyStat, AuditLog, User
+from .audit_writer import get_audit_writer, flush_audit_writer
+from .audit_archive import get_audit_archive
+from .audit_payload import decode_values, encode_values
+from .audit_rollup import add_to_rollup, ensure_audit_rollup, subtract_from_rollup
 
 # Module-level globals to allow newly created AuditService instances to
 # pick up the current user context without requiring every caller to
@@ -13,6 +19,13 @@ from ..core.models import AuditLog, User
 _GLOBAL_AUDIT_USER_ID = None
 _GLOBAL_AUDIT_USERNAME = None
 
+# When True, log_action queues records for the batched background writer
+# instead of committing each one in its own session.
+_ASYNC_AUDIT_WRITES = True
+
+# Largest page query_audit_logs will return
+MAX_AUDIT_PAGE_SIZE = 500
+
 def set_global_audit_user(user_id: int, username: str):
     """Set the global audit user context for new AuditService instances."""
     global _GLOBAL_AUDIT_USER_ID, _GLOBAL_AUDIT_USERNAME
@@ -20,6 +33,32 @@ def set_global_audit_user(user_id: int, username: str):
     _GLOBAL_AUDIT_USERNAME = username
 
 
+def set_async_audit_writes(enabled: bool):
+    """Enable or disable batched background audit writes (enabled by default).
+
+    Disabling flushes anything already queued so ordering is preserved.
+    """
+    global _ASYNC_AUDIT_WRITES
+    if not enabled:
+        flush_audit_writer()
+    _ASYNC_AUDIT_WRITES = enabled
+
+
+def _encode_audit_cursor(timestamp: datetime, log_id: int) -> str:
+    """Encode the last (timestamp, id) of a page as an opaque, URL-safe cursor."""
+    payload = json.dumps({'t': timestamp.isoformat(), 'id': log_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def _decode_audit_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_audit_cursor."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        return datetime.fromisoformat(payload['t']), int(payload['id'])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
 class AuditService:
     def __init__(self):
         # Initialize from module-level globals so newly constructed instances
@@ -28,10 +67,16 @@ class AuditService:
         self._current_user_id = _GLOBAL_AUDIT_USER_ID
         self._current_username = _GLOBAL_AUDIT_USERNAME
 
-    def set_current_user(self, user_id: int, username: str):
-        """Set the current user for audit logging."""
+    def set_current_user(self, user_id: int, username: str, global_context: bool = True):
+        """Set the current user for audit logging.
+
+        With global_context (the default, for the GUI's signed-in user) it
+        also becomes the user of AuditService instances created later.
+        """
         self._current_user_id = user_id
         self._current_username = username
+        if not global_context:
+            return
         # Also update module-level globals so other AuditService instances
         # created later in the app can observe the same context.
         try:
@@ -57,7 +102,9 @@ class AuditService:
             description: Human-readable description of the action
             table_name: Database table affected (optional)
             record_id: ID of the record affected (optional)
-            old_values: Dictionary of old values for updates/deletes (optional)
+            old_values: Dictionary of old values for updates/deletes (optional);
+                prefer a change-set from audit_payload.diff_values over a
+                full snapshot
             new_values: Dictionary of new values for creates/updates (optional)
             user_id: ID of user who performed action (uses current user if not set)
             username: Username of user who performed action (uses current user if not set)
@@ -68,58 +115,86 @@ class AuditService:
             bool: True if logged successfully, False otherwise
         """
         try:
+            if not (user_id or self._current_user_id) or not (username or self._current_username):
+                print("Warning: No user information provided for audit log")
+
+            record = self._build_record(action, description, table_name, record_id,
+                                        old_values, new_values, user_id, username,
+                                        ip_address, user_agent)
+
+            if _ASYNC_AUDIT_WRITES:
+                # Queued for the batched background writer (see audit_writer)
+                get_audit_writer().submit(record)
+                return True
+
             with get_db() as session:
-                # Use provided user info or current user
-                log_user_id = user_id or self._current_user_id
-                log_username = username or self._current_username
-                
-                if not log_user_id or not log_username:
-                    print("Warning: No user information provided for audit log")
-                
-                # Convert values to JSON strings with proper date handling
-                old_values_json = json.dumps(old_values, default=self._json_serializer) if old_values else None
-                new_values_json = json.dumps(new_values, default=self._json_serializer) if new_values else None
-                
-                # Handle special case for admin user (id=0)
-                if log_user_id == 0:
-                    # For admin user, store audit log without user_id foreign key
-                    audit_log = AuditLog(
-                        action=action,
-                        table_name=table_name,
-                        record_id=str(record_id) if record_id is not None else None,
-                        description=description,
-                        old_values=old_values_json,
-                        new_values=new_values_json,
-                        user_id=None,  # Skip foreign key for admin
-                        username=log_username or "System Admin",
-                        ip_address=ip_address,
-                        user_agent=user_agent,
-                        timestamp=datetime.utcnow()
-                    )
-                else:
-                    # Normal user audit log
-                    audit_log = AuditLog(
-                        action=action,
-                        table_name=table_name,
-                        record_id=str(record_id) if record_id is not None else None,
-                        description=description,
-                        old_values=old_values_json,
-                        new_values=new_values_json,
-                        user_id=log_user_id,
-                        username=log_username,
-                        ip_address=ip_address,
-                        user_agent=user_agent,
-                        timestamp=datetime.utcnow()
-                    )
-                
-                session.add(audit_log)
+                session.add(AuditLog(**record))
+                add_to_rollup(session, [record])
                 session.commit()
                 return True
-                
+
         except Exception as e:
             print(f"Error logging audit action: {e}")
             return False
 
+    def log_actions(self, session: Session, entries: List[Dict[str, Any]]) -> int:
+        """
+        Write several audit records in the caller's transaction.
+
+        Used by set-based operations so the audit trail commits (or rolls
+        back) together with the change it describes: all records go in
+        with one multi-row INSERT, bypassing the background writer.
+
+        Args:
+            session: Session of the transaction making the change
+            entries: log_action keyword arguments, one dict per record
+
+        Returns:
+            int: Number of records written
+        """
+        records = [self._build_record(**entry) for entry in entries]
+        if not records:
+            return 0
+        session.execute(insert(AuditLog), records)
+        add_to_rollup(session, records)
+        return len(records)
+
+    def _build_record(self, action: str, description: str,
+                      table_name: Optional[str] = None, record_id: Optional[str] = None,
+                      old_values: Optional[Dict] = None, new_values: Optional[Dict] = None,
+                      user_id: Optional[int] = None, username: Optional[str] = None,
+                      ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> Dict[str, Any]:
+        """Build the AuditLog column values for one record."""
+        # Use provided user info or current user
+        log_user_id = user_id or self._current_user_id
+        log_username = username or self._current_username
+
+        record = {
+            'action': action,
+            'table_name': table_name,
+            'record_id': str(record_id) if record_id is not None else None,
+            'description': description,
+            # Typed JSON, compressed when large (see audit_payload)
+            'old_values': encode_values(old_values),
+            'new_values': encode_values(new_values),
+            'user_id': log_user_id,
+            'username': log_username,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'timestamp': datetime.utcnow()
+        }
+
+        # Handle special case for admin user (id=0)
+        if log_user_id == 0:
+            # For admin user, store audit log without user_id foreign key
+            record['user_id'] = None
+            record['username'] = log_username or "System Admin"
+        return record
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Wait until all queued audit records have been written."""
+        return flush_audit_writer(timeout)
+
     def get_audit_logs(self, limit: int = 100, offset: int = 0, 
                        filters: Dict = None) -> List[Dict[str, Any]]:
         """
@@ -131,81 +206,166 @@ class AuditService:
             filters: Dictionary of filters to apply
                 - action: Filter by action type
                 - table_name: Filter by table name
+                - record_id: Filter by affected record ID
                 - user_id: Filter by user ID
                 - date_from: Filter by start date
                 - date_to: Filter by end date
-                - search: Search in description
+                - search: Search description, action and username
+                  (full-text, prefix matching)
+                - include_archived: Continue into the audit archive once
+                  the table has no more matches
                 
         Returns:
-            List of audit log dictionaries
+            List of audit log dictionaries. Archived records follow the
+            table's when include_archived is set or date_from / date_to
+            reach back into the archive (see AuditArchive.reaches); prefer
+            query_audit_logs for paging through large logs
         """
+        # Make queued records visible to this read
+        self.flush()
         try:
             with get_db() as session:
-                query = session.query(AuditLog)
-                
-                if filters:
-                    if filters.get('action'):
-                        query = query.filter(AuditLog.action == filters['action'])
-                    
-                    if filters.get('table_name'):
-                        query = query.filter(AuditLog.table_name == filters['table_name'])
-                    
-                    if filters.get('user_id'):
-                        query = query.filter(AuditLog.user_id == filters['user_id'])
-                    
-                    if filters.get('date_from'):
-                        query = query.filter(AuditLog.timestamp >= filters['date_from'])
-                    
-                    if filters.get('date_to'):
-                        query = query.filter(AuditLog.timestamp <= filters['date_to'])
-                    
-                    if filters.get('search'):
-                        search_term = f"%{filters['search']}%"
-                        query = query.filter(
-                            or_(
-                                AuditLog.description.like(search_term),
-                                AuditLog.action.like(search_term),
-                                AuditLog.username.like(search_term)
-                            )
-                        )
-                
-                logs = query.order_by(desc(AuditLog.timestamp))\
+                query = self._apply_audit_filters(session, session.query(AuditLog), filters)
+                logs = query.order_by(desc(AuditLog.timestamp), desc(AuditLog.id))\
                            .offset(offset)\
                            .limit(limit)\
                            .all()
-                
-                return [self._audit_log_to_dict(log) for log in logs]
+                results = [self._audit_log_to_dict(log) for log in logs]
+
+                # Older records continue in the archive
+                archive = get_audit_archive()
+                if len(results) < limit and archive.reaches(filters):
+                    archive_offset = max(0, offset - query.count()) if offset and not logs else 0
+                    results += archive.read(filters, limit=limit - len(results), offset=archive_offset)
+                return results
                 
         except Exception as e:
             print(f"Error getting audit logs: {e}")
             return []
 
+    def query_audit_logs(self, filters: Dict = None, limit: int = 100,
+                         cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of audit logs, newest first, using keyset pagination.
+
+        Pages are read with a (timestamp, id) seek on ix_audit_logs_timestamp_id
+        instead of OFFSET, so deep pages cost the same as the first one.
+        Takes the same filters as get_audit_logs; ``search`` uses the
+        full-text index (prefix matching on description, action and
+        username). Past the oldest matching row in the table, pages
+        continue with archived records when include_archived is set or the
+        date range / cursor reaches back into the archive (see
+        AuditArchive.reaches).
+
+        Args:
+            filters: Dictionary of filters to apply (see get_audit_logs)
+            limit: Page size (capped at MAX_AUDIT_PAGE_SIZE)
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Dict with keys: items (list of audit log dicts), next_cursor
+            (str or None) and has_more (bool)
+
+        Raises:
+            ValueError: if the cursor is invalid
+        """
+        limit = max(1, min(int(limit), MAX_AUDIT_PAGE_SIZE))
+        position = _decode_audit_cursor(cursor) if cursor else None
+
+        # Make queued records visible to this read
+        self.flush()
+        try:
+            with get_db() as session:
+                query = self._apply_audit_filters(session, session.query(AuditLog), filters)
+                if position:
+                    last_timestamp, last_id = position
+                    query = query.filter(or_(
+                        AuditLog.timestamp < last_timestamp,
+                        and_(AuditLog.timestamp == last_timestamp, AuditLog.id < last_id)
+                    ))
+                # Fetch one extra row to learn whether another page exists
+                logs = query.order_by(desc(AuditLog.timestamp), desc(AuditLog.id))\
+                            .limit(limit + 1)\
+                            .all()
+                items = [self._audit_log_to_dict(log) for log in logs]
+
+            # Older records continue in the archive
+            archive = get_audit_archive()
+            if len(items) <= limit and archive.reaches(filters, position):
+                items += archive.read(filters, limit=limit + 1 - len(items), before=position)
+
+            has_more = len(items) > limit
+            items = items[:limit]
+            next_cursor = None
+            if has_more and items:
+                last = items[-1]
+                next_cursor = _encode_audit_cursor(datetime.fromisoformat(last['timestamp']), last['id'])
+            return {
+                'items': items,
+                'next_cursor': next_cursor,
+                'has_more': has_more
+            }
+
+        except Exception as e:
+            print(f"Error querying audit logs: {e}")
+            return {'items': [], 'next_cursor': None, 'has_more': False}
+
+    def _apply_audit_filters(self, session: Session, query, filters: Optional[Dict]):
+        """Apply get_audit_logs-style filters to an AuditLog query."""
+        if not filters:
+            return query
+
+        if filters.get('action'):
+            query = query.filter(AuditLog.action == filters['action'])
+        
+        if filters.get('table_name'):
+            query = query.filter(AuditLog.table_name == filters['table_name'])
+
+        if filters.get('record_id') is not None:
+            query = query.filter(AuditLog.record_id == str(filters['record_id']))
+        
+        if filters.get('user_id'):
+            query = query.filter(AuditLog.user_id == filters['user_id'])
+        
+        if filters.get('date_from'):
+            query = query.filter(AuditLog.timestamp >= filters['date_from'])
+        
+        if filters.get('date_to'):
+            query = query.filter(AuditLog.timestamp <= filters['date_to'])
+        
+        if filters.get('search'):
+            matches = audit_search_subquery(session, filters['search'])
+            if matches is not None:
+                query = query.filter(AuditLog.id.in_(select(matches.c.id)))
+            else:
+                search_term = f"%{filters['search']}%"
+                query = query.filter(
+                    or_(
+                        AuditLog.description.like(search_term),
+                        AuditLog.action.like(search_term),
+                        AuditLog.username.like(search_term)
+                    )
+                )
+        return query
+
     def get_user_activity(self, user_id: int, limit: int = 50) -> List[Dict[str, Any]]:
         """Get audit logs for a specific user."""
         filters = {'user_id': user_id}
         return self.get_audit_logs(limit=limit, filters=filters)
 
     def get_table_changes(self, table_name: str, record_id: str = None, 
-                         limit: int = 50) -> List[Dict[str, Any]]:
-        """Get audit logs for changes to a specific table or record."""
+                         limit: int = 50, include_archived: bool = False) -> List[Dict[str, Any]]:
+        """Get audit logs for changes to a specific table or record.
+
+        Records moved to the audit archive are only included with
+        include_archived=True (this scans the archived months).
+        """
         filters = {'table_name': table_name}
-        
-        try:
-            with get_db() as session:
-                query = session.query(AuditLog).filter(AuditLog.table_name == table_name)
-                
-                if record_id:
-                    query = query.filter(AuditLog.record_id == str(record_id))
-                
-                logs = query.order_by(desc(AuditLog.timestamp))\
-                           .limit(limit)\
-                           .all()
-                
-                return [self._audit_log_to_dict(log) for log in logs]
-                
-        except Exception as e:
-            print(f"Error getting table changes: {e}")
-            return []
+        if record_id:
+            filters['record_id'] = record_id
+        if include_archived:
+            filters['include_archived'] = True
+        return self.get_audit_logs(limit=limit, filters=filters)
 
     def get_recent_activity(self, hours: int = 24, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent activity within specified hours."""
@@ -226,71 +386,68 @@ class AuditService:
         return self.get_audit_logs(filters=filters)
 
     def get_audit_statistics(self) -> Dict[str, Any]:
-        """Get audit log statistics."""
+        """Get audit log statistics.
+
+        Served from the audit_daily_stats rollup (see audit_rollup), so
+        the cost does not grow with the log. "Week" figures cover the last
+        7 UTC calendar days including today.
+        """
+        # Make queued records visible to this read
+        self.flush()
         try:
             with get_db() as session:
                 from datetime import timedelta
-                from sqlalchemy import func
-                
-                now = datetime.utcnow()
-                today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                week_ago = now - timedelta(days=7)
-                
-                # Total logs
-                total_logs = session.query(AuditLog).count()
-                
-                # Today's activity
-                today_logs = session.query(AuditLog).filter(
-                    AuditLog.timestamp >= today
-                ).count()
-                
-                # This week's activity
-                week_logs = session.query(AuditLog).filter(
-                    AuditLog.timestamp >= week_ago
-                ).count()
-                
-                # Failed login attempts today
-                failed_logins_today = session.query(AuditLog).filter(
-                    and_(
-                        AuditLog.action == 'LOGIN_FAILED',
-                        AuditLog.timestamp >= today
-                    )
-                ).count()
-                
+                from sqlalchemy import func, case
+
+                ensure_audit_rollup(session)
+                today = datetime.utcnow().date()
+                week_start = today - timedelta(days=6)
+                count = AuditDailyStat.count
+
+                total_logs, today_logs, week_logs, failed_logins_today = session.query(
+                    func.coalesce(func.sum(count), 0),
+                    func.coalesce(func.sum(case((AuditDailyStat.day == today, count), else_=0)), 0),
+                    func.coalesce(func.sum(case((AuditDailyStat.day >= week_start, count), else_=0)), 0),
+                    func.coalesce(func.sum(case(
+                        (and_(AuditDailyStat.day == today, AuditDailyStat.action == 'LOGIN_FAILED'), count),
+                        else_=0)), 0)
+                ).one()
+
                 # Most active users (this week)
                 active_users = session.query(
-                    AuditLog.username,
-                    func.count(AuditLog.id).label('activity_count')
+                    AuditDailyStat.username,
+                    func.sum(count).label('activity_count')
                 ).filter(
                     and_(
-                        AuditLog.timestamp >= week_ago,
-                        AuditLog.username.isnot(None)
+                        AuditDailyStat.day >= week_start,
+                        AuditDailyStat.username != ''
                     )
-                ).group_by(AuditLog.username)\
+                ).group_by(AuditDailyStat.username)\
                 .order_by(desc('activity_count'))\
                 .limit(5).all()
                 
                 # Most common actions (this week)
                 common_actions = session.query(
-                    AuditLog.action,
-                    func.count(AuditLog.id).label('action_count')
+                    AuditDailyStat.action,
+                    func.sum(count).label('action_count')
                 ).filter(
-                    AuditLog.timestamp >= week_ago
-                ).group_by(AuditLog.action)\
+                    AuditDailyStat.day >= week_start
+                ).group_by(AuditDailyStat.action)\
                 .order_by(desc('action_count'))\
                 .limit(10).all()
                 
                 return {
-                    'total_logs': total_logs,
-                    'today_activity': today_logs,
-                    'week_activity': week_logs,
-                    'failed_logins_today': failed_logins_today,
+                    'total_logs': int(total_logs),
+                    'archived_logs': get_audit_archive().total_count(),
+                    'today_activity': int(today_logs),
+                    'week_activity': int(week_logs),
+                    'failed_logins_today': int(failed_logins_today),
                     'most_active_users': [
-                        {'username': user[0], 'count': user[1]} 
+                        {'username': user[0], 'count': int(user[1])} 
                         for user in active_users
                     ],
                     'common_actions': [
-                        {'action': action[0], 'count': action[1]} 
+                        {'action': action[0], 'count': int(action[1])} 
                         for action in common_actions
                     ]
                 }
@@ -299,6 +456,7 @@ class AuditService:
             print(f"Error getting audit statistics: {e}")
             return {
                 'total_logs': 0,
+                'archived_logs': 0,
                 'today_activity': 0,
                 'week_activity': 0,
                 'failed_logins_today': 0,
@@ -316,6 +474,8 @@ class AuditService:
         Returns:
             Number of logs deleted
         """
+        # Make queued records visible to this read
+        self.flush()
         try:
             with get_db() as session:
                 from datetime import timedelta
@@ -324,12 +484,12 @@ class AuditService:
                 
                 old_logs = session.query(AuditLog).filter(
                     AuditLog.timestamp < cutoff_date
-                ).all()
-                
-                count = len(old_logs)
+                )
                 
-                for log in old_logs:
-                    session.delete(log)
+                # Deleted records leave the statistics rollup too
+                ensure_audit_rollup(session)
+                subtract_from_rollup(session, old_logs)
+                count = old_logs.delete(synchronize_session=False)
                 
                 session.commit()
                 
@@ -362,8 +522,8 @@ class AuditService:
 
                 # Action details
                 'description': audit_log.description,  # Human-readable description
-                'old_values': json.loads(audit_log.old_values) if audit_log.old_values else None,
-                'new_values': json.loads(audit_log.new_values) if audit_log.new_values else None,
+                'old_values': decode_values(audit_log.old_values),
+                'new_values': decode_values(audit_log.new_values),
 
                 # User and session information
                 'user_id': audit_log.user_id,     # User who performed the action
@@ -402,12 +562,6 @@ class AuditService:
                 'timestamp': getattr(audit_log, 'timestamp', None).isoformat() if getattr(audit_log, 'timestamp', None) else None
             }
 
-    def _json_serializer(self, obj):
-        """JSON serializer for objects not serializable by default json code."""
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        raise TypeError(f"Object {obj} is not JSON serializable")
-
     def log_create(self, table_name: str, record_id: str, values: Dict[str, Any],
                   description: Optional[str] = None) -> bool:
         """Helper method for logging CREATE operations"""
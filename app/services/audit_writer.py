@@ -0,0 +1,188 @@
+"""
+Batched background writer for audit log records.
+
+AuditService.log_action used to open a session and commit once per call,
+which dominated write latency during bulk operations (imports, year-end
+processing). Records are now handed to a single worker thread that
+coalesces them and writes each batch with one multi-row INSERT (plus the
+matching audit_daily_stats upserts), flushing when `batch_size` records
+are pending or `flush_interval` seconds have passed since the first
+pending record.
+
+flush() blocks until everything submitted so far is written, so readers
+can get read-your-writes semantics; the app flushes on logout and the
+writer flushes itself at interpreter exit.
+"""
+
+import atexit
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from ..core.database import get_db_session
+from ..core.models import AuditLog
+from .audit_rollup import add_to_rollup
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds
+
+
+class _FlushMarker:
+    """Queue item asking the worker to write what it has and signal back."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _StopMarker(_FlushMarker):
+    """Flush marker that also ends the worker loop."""
+
+
+class AuditLogWriter:
+    """Queue + worker thread that writes audit records in batches."""
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written_count = 0
+        self.failed_count = 0
+
+    def submit(self, record: Dict[str, Any]):
+        """Queue one audit record (a dict of AuditLog column values)."""
+        self._ensure_started()
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until every record submitted before this call is written.
+
+        Returns False if the worker did not finish within `timeout`.
+        """
+        if not self.is_running():
+            return True
+        if threading.current_thread() is self._thread:
+            # Called from inside a write (should not happen); never deadlock
+            return False
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 10.0) -> bool:
+        """Flush pending records and stop the worker thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return True
+            marker = _StopMarker()
+            self._queue.put(marker)
+        finished = marker.done.wait(timeout)
+        thread.join(timeout)
+        with self._lock:
+            if self._thread is thread:
+                self._thread = None
+        return finished
+
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def _ensure_started(self):
+        if self.is_running():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="AuditLogWriter", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        batch: List[Dict[str, Any]] = []
+        while True:
+            # Wait indefinitely while idle, or until the current batch is due
+            timeout = self.flush_interval if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_batch(batch)
+                batch = []
+                continue
+
+            if isinstance(item, _FlushMarker):
+                self._write_batch(batch)
+                batch = []
+                item.done.set()
+                if isinstance(item, _StopMarker):
+                    return
+                continue
+
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch)
+                batch = []
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """Insert a batch in one statement; fall back to row-by-row on error."""
+        if not batch:
+            return
+        session = get_db_session()
+        try:
+            session.execute(insert(AuditLog), batch)
+            add_to_rollup(session, batch)
+            session.commit()
+            self.written_count += len(batch)
+            return
+        except Exception as e:
+            session.rollback()
+            print(f"Error writing audit batch of {len(batch)} records, retrying individually: {e}")
+        finally:
+            session.close()
+
+        # One bad record must not drop the rest of the batch
+        for record in batch:
+            session = get_db_session()
+            try:
+                session.execute(insert(AuditLog), [record])
+                add_to_rollup(session, [record])
+                session.commit()
+                self.written_count += 1
+            except Exception as e:
+                session.rollback()
+                self.failed_count += 1
+                print(f"Error logging audit action {record.get('action')}: {e}")
+            finally:
+                session.close()
+
+
+_writer: Optional[AuditLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditLogWriter:
+    """Return the process-wide audit writer, creating it on first use."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AuditLogWriter()
+    return _writer
+
+
+def flush_audit_writer(timeout: Optional[float] = 10.0) -> bool:
+    """Flush the process-wide writer if it has been started."""
+    writer = _writer
+    return writer.flush(timeout) if writer is not None else True
+
+
+def shutdown_audit_writer(timeout: Optional[float] = 10.0) -> bool:
+    """Flush and stop the process-wide writer if it has been started."""
+    writer = _writer
+    return writer.shutdown(timeout) if writer is not None else True
+
+
+atexit.register(shutdown_audit_writer)
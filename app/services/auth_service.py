@@ -8,6 +8,7 @@ from ..core.database import get_db
 from ..core.models import User, UserSession, AuditLog, Role, UserRole
 from .audit_service import AuditService
 from .config_service import ConfigService
+from .permission_cache import get_permission_resolver
 from passlib.context import CryptContext
 
 
@@ -442,37 +443,11 @@ class AuthService:
                 return True
 
         try:
-            with get_db() as session:
-                # For regular database users
-                user_id = self.get_current_user_id()
-                if user_id == 0:  # Default admin
-                    return True
-                    
-                user = session.query(User).filter(User.id == user_id).first()
-                if not user or not user.role:
-                    return False
-
-                # Admin has all permissions
-                if user.role.name == UserRole.ADMIN:
-                    return True
-
-                # Check specific permission
-                from ..core.models import PermissionType, RolePermission, Permission
-                
-                perm = session.query(Permission).filter(
-                    Permission.name == PermissionType(permission)
-                ).first()
-                
-                if not perm:
-                    return False
-
-                role_perm = session.query(RolePermission).filter(
-                    RolePermission.role_id == user.role.id,
-                    RolePermission.permission_id == perm.id,
-                    RolePermission.granted == "true"
-                ).first()
-
-                return role_perm is not None
+            # For regular database users: answered from cached role bitmasks
+            user_id = self.get_current_user_id()
+            if user_id == 0:  # Default admin
+                return True
+            return get_permission_resolver().has_permission(user_id, permission)
 
         except Exception as e:
             print(f"Permission check error: {e}")
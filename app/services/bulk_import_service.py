@@ -0,0 +1,272 @@
+"""
+Chunked bulk import of assets.
+
+The settings screen used to call AssetService.create_asset once per
+spreadsheet row, which meant one asset_id existence query per row (plus one
+per suffix tried), one transaction per row and one audit entry per row.
+BulkImportService processes records a chunk at a time instead:
+
+  1. every record in the chunk is normalized and validated up front,
+  2. asset_id collisions are resolved with a single IN query per chunk
+     (plus one query for existing "-N" suffixes, only when collisions exist),
+  3. the chunk is inserted with one executemany INSERT in one transaction,
+  4. one summarized ASSETS_IMPORTED audit entry is written for the chunk.
+
+If the chunk INSERT hits a constraint violation (e.g. a duplicate
+asset_tag) the chunk is retried row by row inside savepoints so only the
+offending rows fail.
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import insert, or_
+from sqlalchemy.exc import IntegrityError
+
+from ..core.database import get_db
+from ..core.models import Asset
+from .asset_service import AssetService
+from .audit_service import AuditService
+from .settings_service import SettingsService
+
+DEFAULT_IMPORT_CHUNK_SIZE = 500
+
+# Asset columns that are NOT NULL without a default
+REQUIRED_ASSET_FIELDS = (
+    'asset_id', 'name', 'description', 'category_id', 'acquisition_date',
+    'supplier', 'unit_cost', 'total_cost', 'net_book_value', 'location',
+)
+
+ProgressCallback = Callable[[int, int, int], None]
+
+
+def _chunks(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _column_defaults() -> Dict[str, Any]:
+    """Return {column: default spec} for Asset columns other than the PK.
+
+    executemany needs every parameter set to carry the same keys, so missing
+    values are filled with the column default (or None) before inserting.
+    """
+    defaults = {}
+    for column in Asset.__table__.columns:
+        if column.primary_key:
+            continue
+        defaults[column.name] = column.default
+    return defaults
+
+
+def _default_value(default) -> Any:
+    if default is None:
+        return None
+    if default.is_callable:
+        return default.arg(None)
+    if default.is_scalar:
+        return default.arg
+    return None
+
+
+class BulkImportService:
+    """Import many assets with one INSERT and one audit entry per chunk."""
+
+    def __init__(self, chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE):
+        self.chunk_size = max(1, int(chunk_size))
+        self.audit_service = AuditService()
+        self.settings_service = SettingsService()
+        self._column_defaults = _column_defaults()
+
+    def set_current_user(self, user_id: int, username: str):
+        """Set current user for audit logging"""
+        self.audit_service.set_current_user(user_id, username)
+
+    def import_assets(self, records: Iterable[Dict[str, Any]],
+                      progress_callback: Optional[ProgressCallback] = None,
+                      source: Optional[str] = None) -> Dict[str, Any]:
+        """Import asset records in chunks.
+
+        Args:
+            records: Asset dicts in the shape accepted by AssetService.create_asset
+            progress_callback: Called after each chunk as
+                callback(processed, imported, failed)
+            source: Optional label (e.g. the file name) recorded in the audit entries
+
+        Returns:
+            Dict with success, message, imported, failed and failed_rows. Each
+            failed row is {'index': position in `records`, 'asset_id', 'message'}.
+        """
+        if not self.settings_service.can_create_asset():
+            return {
+                "success": False,
+                "message": "Asset creation is currently disabled by system settings",
+                "imported": 0,
+                "failed": 0,
+                "failed_rows": [],
+            }
+
+        imported = 0
+        processed = 0
+        failed_rows: List[Dict[str, Any]] = []
+        assigned_ids: Set[str] = set()  # asset_ids used by earlier chunks
+
+        try:
+            for chunk in _chunks(records, self.chunk_size):
+                result = self._import_chunk(chunk, processed, assigned_ids, source)
+                imported += result["imported"]
+                failed_rows.extend(result["failed_rows"])
+                processed += len(chunk)
+                if progress_callback:
+                    progress_callback(processed, imported, len(failed_rows))
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error importing assets: {str(e)}",
+                "imported": imported,
+                "failed": len(failed_rows),
+                "failed_rows": failed_rows,
+            }
+
+        return {
+            "success": True,
+            "message": f"Imported {imported} assets, {len(failed_rows)} failed",
+            "imported": imported,
+            "failed": len(failed_rows),
+            "failed_rows": failed_rows,
+        }
+
+    def _import_chunk(self, chunk: List[Dict[str, Any]], offset: int,
+                      assigned_ids: Set[str], source: Optional[str]) -> Dict[str, Any]:
+        failed_rows: List[Dict[str, Any]] = []
+        valid: List[tuple] = []  # (index, mapping)
+
+        for position, record in enumerate(chunk):
+            index = offset + position
+            mapping, error = self._validate(dict(record))
+            if error:
+                failed_rows.append({"index": index, "asset_id": record.get('asset_id'), "message": error})
+            else:
+                valid.append((index, mapping))
+
+        if not valid:
+            return {"imported": 0, "failed_rows": failed_rows}
+
+        with get_db() as session:
+            self._resolve_asset_ids(session, [m for _, m in valid], assigned_ids)
+            inserted = self._insert(session, valid, failed_rows)
+
+        if inserted:
+            asset_ids = [m['asset_id'] for m in inserted]
+            description = f"Imported {len(inserted)} assets ({asset_ids[0]} .. {asset_ids[-1]})"
+            if source:
+                description += f" from {source}"
+            self.audit_service.log_action(
+                action="ASSETS_IMPORTED",
+                description=description,
+                table_name="assets",
+                new_values={
+                    "count": len(inserted),
+                    "failed": len(failed_rows),
+                    "source": source,
+                    "asset_ids": asset_ids,
+                },
+            )
+
+        return {"imported": len(inserted), "failed_rows": failed_rows}
+
+    def _validate(self, record: Dict[str, Any]):
+        """Normalize one record; return (mapping, None) or (None, error message)."""
+        mapping = AssetService.prepare_new_asset_data(record)
+        if mapping.get('asset_id') is not None:
+            mapping['asset_id'] = str(mapping['asset_id']).strip()
+        missing = [f for f in REQUIRED_ASSET_FIELDS if mapping.get(f) in (None, '')]
+        if missing:
+            return None, f"Missing required field(s): {', '.join(missing)}"
+        for field in ('unit_cost', 'total_cost'):
+            try:
+                mapping[field] = float(mapping[field])
+            except (TypeError, ValueError):
+                return None, f"Invalid {field}: {mapping[field]!r}"
+            if mapping[field] < 0:
+                return None, f"{field} cannot be negative"
+        for field in ('acquisition_date', 'expiry_date'):
+            value = mapping.get(field)
+            if isinstance(value, datetime):
+                value = value.date()
+            if value is not None and (value != value or not isinstance(value, date)):
+                # value != value catches NaN/NaT left by spreadsheet parsing
+                return None, f"Invalid {field}: {mapping.get(field)!r}"
+            mapping[field] = value
+
+        # Same key set for every row so the chunk goes out as one executemany
+        for name, default in self._column_defaults.items():
+            if name not in mapping:
+                mapping[name] = _default_value(default)
+        return mapping, None
+
+    @staticmethod
+    def _resolve_asset_ids(session, mappings: List[Dict[str, Any]], assigned_ids: Set[str]):
+        """Give colliding asset_ids a "-N" suffix, as create_asset does.
+
+        Collisions are checked against the database, earlier chunks of this
+        import and earlier rows of the same chunk.
+        """
+        wanted = {m['asset_id'] for m in mappings}
+        taken = {row[0] for row in session.query(Asset.asset_id).filter(Asset.asset_id.in_(wanted))}
+        taken |= assigned_ids & wanted
+
+        seen: Set[str] = set()
+        colliding_bases: Set[str] = set()
+        for mapping in mappings:
+            asset_id = mapping['asset_id']
+            if asset_id in taken or asset_id in seen:
+                colliding_bases.add(asset_id)
+            seen.add(asset_id)
+        if colliding_bases:
+            # Suffixes already in use for the colliding ids, in one query
+            taken |= {row[0] for row in session.query(Asset.asset_id).filter(
+                or_(*[Asset.asset_id.like(f"{base}-%") for base in colliding_bases]))}
+            taken |= {a for a in assigned_ids if any(a.startswith(f"{base}-") for base in colliding_bases)}
+
+        for mapping in mappings:
+            base = mapping['asset_id']
+            new_id = base
+            suffix = 0
+            while new_id in taken:
+                suffix += 1
+                new_id = f"{base}-{suffix}"
+            mapping['asset_id'] = new_id
+            taken.add(new_id)
+            assigned_ids.add(new_id)
+
+    @staticmethod
+    def _insert(session, valid: List[tuple], failed_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert the chunk in one statement; isolate bad rows on constraint errors."""
+        mappings = [m for _, m in valid]
+        try:
+            with session.begin_nested():
+                session.execute(insert(Asset), mappings)
+            return mappings
+        except IntegrityError as e:
+            print(f"Bulk insert of {len(mappings)} assets failed, retrying row by row: {e.orig}")
+
+        inserted = []
+        for index, mapping in valid:
+            try:
+                with session.begin_nested():
+                    session.execute(insert(Asset), [mapping])
+                inserted.append(mapping)
+            except IntegrityError as ie:
+                failed_rows.append({
+                    "index": index,
+                    "asset_id": mapping.get('asset_id'),
+                    "message": f"duplicate asset ID or constraint violation ({str(ie.orig)})",
+                })
+        return inserted
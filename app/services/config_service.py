@@ -13,6 +13,7 @@ import base64
 
 from ..core.database import get_db
 from ..core.models import SystemConfiguration
+from .settings_service import invalidate_settings_cache
 
 
 class ConfigService:
@@ -210,6 +211,8 @@ class ConfigService:
                 # Update cache
                 cache_key = f"{category}:{key}"
                 self._config_cache[cache_key] = value
+                # SettingsService reads the same table
+                invalidate_settings_cache()
                 
                 return True
                 
@@ -0,0 +1,141 @@
+"""
+Aggregate dashboard snapshot.
+
+The dashboard used to load every asset just to count them and sum their
+cost, then ran separate queries for the category charts and the activity
+list. DashboardSnapshot computes the same figures with a few SQL aggregates
+(totals, per-category and per-status breakdowns) and caches them per
+database, keyed on a data-version stamp:
+
+  - assets: row count, latest updated_at and highest id
+  - categories: row count, highest id and latest updated_at (see data_version)
+  - audit log: highest id (recent activity only)
+
+Every get() costs one stamp query; the aggregates are only recomputed when
+the asset/category part of the stamp moves, and recent activity only when
+new audit records were written. invalidate_dashboard_snapshot() forces a
+full reload (e.g. after changes made with raw SQL, which the stamp cannot see).
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from ..core.database import get_db, get_session_factory
+from ..core.models import Asset, AssetCategory, AssetStatus, AuditLog
+from .audit_service import AuditService
+from .data_version import asset_version_columns, category_version_columns
+
+# Window and size of the recent activity list
+DASHBOARD_RECENT_HOURS = 24
+DASHBOARD_RECENT_LIMIT = 10
+
+# Statuses that no longer count towards the register totals
+INACTIVE_STATUSES = (AssetStatus.RETIRED, AssetStatus.DISPOSED)
+
+
+class _DashboardCache:
+    def __init__(self, factory):
+        self.factory = factory
+        self.data_version: Optional[Tuple] = None
+        self.aggregates: Optional[Dict[str, Any]] = None
+        self.audit_version = None
+        self.recent: Optional[List[Dict[str, Any]]] = None
+
+
+_cache: Optional[_DashboardCache] = None
+_cache_lock = threading.Lock()
+
+
+def invalidate_dashboard_snapshot():
+    """Drop the cached snapshot; the next get() recomputes everything."""
+    global _cache
+    _cache = None
+
+
+def _data_version(session) -> Tuple[Tuple, Any]:
+    """Return (asset/category stamp, audit stamp) in a single round trip."""
+    row = session.query(
+        *asset_version_columns(),
+        *category_version_columns(),
+        select(func.max(AuditLog.id)).scalar_subquery(),
+    ).one()
+    return tuple(row[:-1]), row[-1]
+
+
+class DashboardSnapshot:
+    """Serves dashboard figures from version-stamped SQL aggregates."""
+
+    def __init__(self, audit_service: Optional[AuditService] = None):
+        self.audit_service = audit_service or AuditService()
+
+    def get(self) -> Dict[str, Any]:
+        """Return the current dashboard figures.
+
+        Keys: total_assets and total_value (active assets only),
+        total_categories, by_category ({name: {count, total_value,
+        total_depreciation, net_book_value}} over all assets), by_status
+        ({status value: count}), recent_activity (audit log dicts from the
+        last DASHBOARD_RECENT_HOURS, newest first) and version.
+        """
+        global _cache
+        # Queued audit records must be counted in the audit stamp
+        self.audit_service.flush()
+        factory = get_session_factory()
+        with _cache_lock:
+            cache = _cache
+            if cache is None or cache.factory is not factory:
+                cache = _cache = _DashboardCache(factory)
+            with get_db() as session:
+                data_version, audit_version = _data_version(session)
+                if cache.aggregates is None or cache.data_version != data_version:
+                    cache.aggregates = self._compute_aggregates(session)
+                    cache.data_version = data_version
+            if cache.recent is None or cache.audit_version != audit_version:
+                cache.recent = self.audit_service.get_recent_activity(
+                    hours=DASHBOARD_RECENT_HOURS, limit=DASHBOARD_RECENT_LIMIT)
+                cache.audit_version = audit_version
+            aggregates, recent = cache.aggregates, cache.recent
+
+        # The cached list may have aged; drop entries that left the window
+        cutoff = (datetime.utcnow() - timedelta(hours=DASHBOARD_RECENT_HOURS)).isoformat()
+        result = dict(aggregates)
+        result['by_category'] = {name: dict(stats) for name, stats in aggregates['by_category'].items()}
+        result['by_status'] = dict(aggregates['by_status'])
+        result['recent_activity'] = [log for log in recent if (log.get('timestamp') or '') >= cutoff]
+        result['version'] = (data_version, audit_version)
+        return result
+
+    def _compute_aggregates(self, session) -> Dict[str, Any]:
+        total_assets, total_value = session.query(
+            func.count(Asset.id), func.coalesce(func.sum(Asset.total_cost), 0)
+        ).filter(Asset.status.notin_(INACTIVE_STATUSES)).one()
+
+        category_rows = session.query(
+            AssetCategory.name,
+            func.count(Asset.id),
+            func.coalesce(func.sum(Asset.total_cost), 0),
+            func.coalesce(func.sum(Asset.accumulated_depreciation), 0)
+        ).outerjoin(Asset).group_by(AssetCategory.id, AssetCategory.name).all()
+        by_category = {}
+        for name, count, value, depreciation in category_rows:
+            by_category[name] = {
+                'count': count,
+                'total_value': float(value),
+                'total_depreciation': float(depreciation),
+                'net_book_value': float(value - depreciation)
+            }
+
+        status_rows = session.query(Asset.status, func.count(Asset.id)).group_by(Asset.status).all()
+        by_status = {status.value: count for status, count in status_rows if status is not None}
+
+        return {
+            'total_assets': int(total_assets or 0),
+            'total_value': float(total_value or 0),
+            'total_categories': len(by_category),
+            'by_category': by_category,
+            'by_status': by_status,
+            'generated_at': datetime.utcnow().isoformat(),
+        }
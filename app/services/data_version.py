@@ -0,0 +1,79 @@
+"""
+Data-version stamps for the asset register.
+
+A stamp is a small tuple read with a few aggregate subqueries in one
+round trip; it changes whenever the data it covers does:
+
+  - assets: row count, latest updated_at and highest id (any insert,
+    update or delete moves at least one of them)
+  - categories: row count, highest id and latest updated_at of both
+    asset_categories and asset_subcategories (renames move updated_at)
+
+Changes made with raw SQL that leave updated_at alone are not seen.
+Callers use stamps to cache computed payloads
+(VersionedCache) and as HTTP validators (ETag / Last-Modified on the
+assets API); DashboardSnapshot builds its stamp from the same subqueries.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from ..core.database import get_session_factory
+from ..core.models import Asset, AssetCategory, AssetSubCategory
+
+# Position of max(updated_at) in an asset stamp
+ASSET_UPDATED_AT = 1
+
+
+def asset_version_columns():
+    """Scalar subqueries making up the asset stamp."""
+    return (
+        select(func.count(Asset.id)).scalar_subquery(),
+        select(func.max(Asset.updated_at)).scalar_subquery(),
+        select(func.max(Asset.id)).scalar_subquery(),
+    )
+
+
+def category_version_columns():
+    """Scalar subqueries making up the category stamp."""
+    return tuple(
+        select(aggregate).scalar_subquery()
+        for model in (AssetCategory, AssetSubCategory)
+        for aggregate in (func.count(model.id), func.max(model.id), func.max(model.updated_at))
+    )
+
+
+def get_data_version(session) -> Dict[str, Tuple]:
+    """Return {'assets': stamp, 'categories': stamp} in a single round trip."""
+    assets = asset_version_columns()
+    row = session.query(*assets, *category_version_columns()).one()
+    return {'assets': tuple(row[:len(assets)]), 'categories': tuple(row[len(assets):])}
+
+
+class VersionedCache:
+    """Holds one computed value per data-version stamp.
+
+    get() returns the cached value while the stamp (and the database)
+    is unchanged and recomputes it otherwise.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._value = None
+
+    def get(self, version: Any, compute: Callable[[], Any]) -> Any:
+        key = (get_session_factory(), version)
+        with self._lock:
+            if self._key == key:
+                return self._value
+        value = compute()
+        with self._lock:
+            self._key, self._value = key, value
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._key = self._value = None
@@ -0,0 +1,308 @@
+"""
+Vectorized year-end depreciation engine.
+
+Year-end close: computes the same Dec 31 depreciation as
+DepreciationCalculator.calculate_depreciation_for_year (prorated first year,
+full straight-line years afterwards, clamped at the residual value, stopped
+once useful life is completed) but for every asset at once using NumPy
+arrays, so YearEndService can load the inputs with one SELECT and write the
+results back with one bulk UPDATE instead of mutating ORM objects one by one.
+
+Reports: calculate_depreciation_arrays is the array form of
+DepreciationMethod.calculate_depreciation (annual, accumulated and book
+value for many assets, each with its own method, in one pass).
+"""
+
+from datetime import date
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from ..core.models import Asset, AssetStatus, DepreciationMethod
+
+# Statuses that take part in year-end depreciation
+YEAR_END_STATUSES = (AssetStatus.AVAILABLE, AssetStatus.IN_USE, AssetStatus.MAINTENANCE)
+
+# Default residual value when an asset has none recorded (fraction of cost)
+DEFAULT_SALVAGE_RATE = 0.10
+
+STOP_NONE = 0
+STOP_LIFE_COMPLETED = 1
+STOP_RESIDUAL_REACHED = 2
+
+STOP_REASONS = {
+    STOP_NONE: None,
+    STOP_LIFE_COMPLETED: 'Useful life completed',
+    STOP_RESIDUAL_REACHED: 'Net book value has reached residual value',
+}
+
+# Integer codes used to select a depreciation method per array element
+_METHOD_CODES = {method: code for code, method in enumerate(DepreciationMethod)}
+
+# Columns loaded per asset, in row order
+_INPUT_COLUMNS = (
+    Asset.id, Asset.asset_id, Asset.name, Asset.total_cost, Asset.salvage_value,
+    Asset.useful_life, Asset.acquisition_date, Asset.depreciation_years_applied,
+    Asset.net_book_value, Asset.expiry_date,
+)
+
+
+def compute_year_end_depreciation(cost, residual_value, useful_life, purchase_month,
+                                  years_applied, net_book_value) -> Dict[str, np.ndarray]:
+    """Compute one Dec 31 depreciation step for many assets.
+
+    All arguments are equal-length arrays (or array-likes). The arithmetic
+    follows DepreciationCalculator.calculate_depreciation_for_year operation
+    for operation so results match the per-asset calculator exactly.
+
+    Returns:
+        Dict of arrays:
+            - depreciation: amount applied this year (0 where stopped)
+            - accumulated_depreciation: accumulated depreciation afterwards
+            - net_book_value: net book value afterwards
+            - stop_code: STOP_* code explaining a zero depreciation
+    """
+    cost = np.asarray(cost, dtype=float)
+    residual = np.asarray(residual_value, dtype=float)
+    life = np.asarray(useful_life, dtype=float)
+    month = np.asarray(purchase_month, dtype=float)
+    applied = np.asarray(years_applied, dtype=float)
+    nbv = np.asarray(net_book_value, dtype=float)
+
+    life_completed = applied >= life
+    residual_reached = ~life_completed & (nbv <= residual)
+    active = ~(life_completed | residual_reached)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yearly = np.where(life > 0, (cost - residual) / life, 0.0)
+    first_year = yearly / 12.0 * (12 - month + 1)
+    depreciation = np.where(applied == 0, first_year, yearly)
+
+    new_accumulated = (cost - nbv) + depreciation
+    new_nbv = cost - new_accumulated
+
+    # Don't let net book value go below residual value
+    clamp = new_nbv < residual
+    depreciation = np.where(clamp, nbv - residual, depreciation)
+    new_accumulated = np.where(clamp, cost - residual, new_accumulated)
+    new_nbv = np.where(clamp, residual, new_nbv)
+
+    stop_code = np.full(cost.shape, STOP_NONE, dtype=np.int8)
+    stop_code[life_completed] = STOP_LIFE_COMPLETED
+    stop_code[residual_reached] = STOP_RESIDUAL_REACHED
+
+    return {
+        'depreciation': np.where(active, depreciation, 0.0),
+        'accumulated_depreciation': np.where(active, new_accumulated, cost - nbv),
+        'net_book_value': np.where(active, new_nbv, nbv),
+        'stop_code': stop_code,
+    }
+
+
+def _method_code(method) -> int:
+    if not isinstance(method, DepreciationMethod):
+        try:
+            method = DepreciationMethod(method)
+        except ValueError:
+            raise ValueError(f"Unsupported depreciation method: {method}")
+    return _METHOD_CODES[method]
+
+
+def _geometric_accumulated(cost, rate, years):
+    """Array form of DepreciationMethod.geometric_accumulated_depreciation."""
+    q = 1 - rate
+    accumulated = cost * rate * (1 - q ** years) / (1 - q)
+    return np.where((years <= 0) | (rate == 0), 0.0, accumulated)
+
+
+def calculate_depreciation_arrays(methods: Union[DepreciationMethod, str, Sequence],
+                                  total_cost, useful_life, current_year=1,
+                                  salvage_value=0.0) -> Dict[str, np.ndarray]:
+    """Array form of DepreciationMethod.calculate_depreciation.
+
+    Args:
+        methods: One method (enum or value string) for every asset, or a
+            sequence with one method per asset
+        total_cost: Initial cost per asset
+        useful_life: Useful life in years per asset
+        current_year: Current year of depreciation (1-based) per asset
+        salvage_value: Salvage value per asset
+
+    Returns:
+        Dict with 'annual_depreciation', 'accumulated_depreciation' and
+        'current_book_value' arrays, matching the scalar method element-wise.
+    """
+    cost = np.asarray(total_cost, dtype=float)
+    life = np.asarray(useful_life, dtype=float)
+    year = np.asarray(current_year, dtype=float)
+    salvage = np.asarray(salvage_value, dtype=float)
+    cost, life, year, salvage = np.broadcast_arrays(cost, life, year, salvage)
+
+    if isinstance(methods, (DepreciationMethod, str)):
+        codes = np.full(cost.shape, _method_code(methods))
+    else:
+        codes = np.fromiter((_method_code(m) for m in methods), dtype=np.int64)
+        codes = np.broadcast_to(codes, cost.shape)
+
+    k = year - 1  # years already depreciated
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Straight line
+        sl_annual = (cost - salvage) / life
+        sl_accumulated = sl_annual * k
+
+        # Declining balance: geometric series, no floor on earlier years
+        db_rate = np.where(salvage > 0, 1 - (salvage / cost) ** (1 / life), 1 - (0.1 / cost) ** (1 / life))
+        db_book = cost - _geometric_accumulated(cost, db_rate, k)
+        db_annual = db_book * db_rate
+
+        # Double declining: geometric series floored at salvage value
+        ddb_rate = 2.0 / life
+        ddb_book = np.where(cost < salvage, cost,
+                            np.maximum(cost - _geometric_accumulated(cost, ddb_rate, k), salvage))
+        ddb_annual = ddb_book * ddb_rate
+
+        # Sum of years digits: arithmetic series of the year fractions
+        sum_of_years = life * (life + 1) / 2.0
+        depreciable = cost - salvage
+        syd_accumulated = depreciable * (k * life - k * (k - 1) / 2.0) / sum_of_years
+        syd_annual = depreciable * (life - k) / sum_of_years
+
+    # Declining methods never depreciate below salvage value in the current year
+    db_annual = np.where(db_book - db_annual < salvage, np.maximum(0, db_book - salvage), db_annual)
+    ddb_annual = np.where(ddb_book - ddb_annual < salvage, np.maximum(0, ddb_book - salvage), ddb_annual)
+
+    conditions = [codes == _METHOD_CODES[DepreciationMethod.STRAIGHT_LINE],
+                  codes == _METHOD_CODES[DepreciationMethod.DECLINING_BALANCE],
+                  codes == _METHOD_CODES[DepreciationMethod.DOUBLE_DECLINING],
+                  codes == _METHOD_CODES[DepreciationMethod.SUM_OF_YEARS]]
+    annual = np.select(conditions, [sl_annual, db_annual, ddb_annual, syd_annual])
+    accumulated = np.select(conditions, [sl_accumulated, cost - db_book, cost - ddb_book, syd_accumulated])
+    book_value = np.select(conditions, [cost - sl_accumulated, db_book, ddb_book, cost - syd_accumulated])
+
+    # Past useful life: fully depreciated down to salvage value
+    expired = year > life
+    annual = np.where(expired, 0.0, annual)
+    accumulated = np.where(expired, cost - salvage, accumulated)
+    book_value = np.where(expired, salvage, book_value)
+
+    # No useful life or cost: nothing to depreciate
+    invalid = (life <= 0) | (cost <= 0)
+    return {
+        'annual_depreciation': np.where(invalid, 0.0, annual),
+        'accumulated_depreciation': np.where(invalid, 0.0, accumulated),
+        'current_book_value': np.where(invalid, cost, book_value),
+    }
+
+
+def compute_year_end_expiry_years(acquisition_year, useful_life, evaluation_date: date) -> np.ndarray:
+    """Vectorized ExpiryCalculator.calculate_expiry_date_aligned_to_year_end.
+
+    Returns the expiry year for each asset (the expiry date is Dec 31 of it).
+    """
+    acquisition_year = np.asarray(acquisition_year, dtype=np.int64)
+    life = np.asarray(useful_life, dtype=float)
+    # Dec 31s passed between acquisition and evaluation, inclusive
+    last_dec31_year = evaluation_date.year if (evaluation_date.month, evaluation_date.day) == (12, 31) \
+        else evaluation_date.year - 1
+    dec31_count = np.clip(last_dec31_year - acquisition_year + 1, 0, None)
+    remaining = np.maximum(0, life - dec31_count)
+    return evaluation_date.year + np.floor(remaining).astype(np.int64)
+
+
+def load_year_end_inputs(session: Session, statuses: Sequence[AssetStatus] = YEAR_END_STATUSES) -> Dict[str, object]:
+    """Load the depreciation inputs for active assets into column arrays.
+
+    Assets without an acquisition date, useful life or total cost are
+    excluded, as the per-asset loop skipped them. A missing salvage value
+    defaults to DEFAULT_SALVAGE_RATE of cost and a missing
+    depreciation_years_applied to 0.
+    """
+    rows = session.execute(
+        select(*_INPUT_COLUMNS)
+        .where(Asset.status.in_(statuses))
+        .where(Asset.acquisition_date.isnot(None))
+        .where(Asset.useful_life.isnot(None), Asset.useful_life != 0)
+        .where(Asset.total_cost.isnot(None), Asset.total_cost != 0)
+        .order_by(Asset.id)
+    ).all()
+
+    if rows:
+        (ids, asset_ids, names, cost, salvage, life, acquired,
+         applied, nbv, expiry) = (list(col) for col in zip(*rows))
+    else:
+        ids, asset_ids, names, cost, salvage, life, acquired, applied, nbv, expiry = ([] for _ in range(10))
+
+    cost = np.array(cost, dtype=float)
+    salvage = np.array(salvage, dtype=float)  # None -> nan
+    salvage_missing = np.isnan(salvage)
+    salvage[salvage_missing] = cost[salvage_missing] * DEFAULT_SALVAGE_RATE
+    applied = np.array(applied, dtype=float)
+    applied[np.isnan(applied)] = 0
+
+    return {
+        'id': ids,
+        'asset_id': asset_ids,
+        'name': names,
+        'total_cost': cost,
+        'salvage_value': salvage,
+        'salvage_missing': salvage_missing,
+        'useful_life': np.array(life, dtype=np.int64),
+        'acquisition_month': np.fromiter((d.month for d in acquired), dtype=np.int64, count=len(acquired)),
+        'acquisition_year': np.fromiter((d.year for d in acquired), dtype=np.int64, count=len(acquired)),
+        'depreciation_years_applied': applied.astype(np.int64),
+        'net_book_value': np.array(nbv, dtype=float),
+        'expiry_date': expiry,
+    }
+
+
+def write_year_end_results(session: Session, inputs: Dict[str, object], result: Dict[str, np.ndarray],
+                           expiry_dates: List[date]) -> int:
+    """Write depreciated values back with one executemany UPDATE per key set.
+
+    Rows that received depreciation get new accumulated depreciation, net
+    book value, years applied and expiry date; rows whose salvage value was
+    defaulted get it persisted. Returns the number of rows written.
+    """
+    applied_mask = result['depreciation'] > 0
+    salvage_missing = inputs['salvage_missing']
+    ids = inputs['id']
+
+    depreciated = []
+    salvage_only = []
+    for i in np.flatnonzero(applied_mask | salvage_missing):
+        i = int(i)
+        if applied_mask[i]:
+            depreciated.append({
+                '_id': ids[i],
+                'accumulated_depreciation': float(result['accumulated_depreciation'][i]),
+                'net_book_value': float(result['net_book_value'][i]),
+                'depreciation_years_applied': int(inputs['depreciation_years_applied'][i]) + 1,
+                'expiry_date': expiry_dates[i],
+                'salvage_value': float(inputs['salvage_value'][i]),
+            })
+        else:
+            salvage_only.append({'_id': ids[i], 'salvage_value': float(inputs['salvage_value'][i])})
+
+    # Core UPDATE ... WHERE id = ? sent as one executemany per key set
+    table = Asset.__table__
+    if depreciated:
+        session.execute(
+            update(table).where(table.c.id == bindparam('_id')).values(
+                accumulated_depreciation=bindparam('accumulated_depreciation'),
+                net_book_value=bindparam('net_book_value'),
+                depreciation_years_applied=bindparam('depreciation_years_applied'),
+                expiry_date=bindparam('expiry_date'),
+                salvage_value=bindparam('salvage_value'),
+            ),
+            depreciated,
+        )
+    if salvage_only:
+        session.execute(
+            update(table).where(table.c.id == bindparam('_id')).values(
+                salvage_value=bindparam('salvage_value'),
+            ),
+            salvage_only,
+        )
+    return len(depreciated) + len(salvage_only)
@@ -1,7 +1,8 @@
 import csv
+import itertools
 import os
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable
 try:
     import docx.enum.text
 except:
@@ -10,7 +11,8 @@ except:
 try:
     import openpyxl
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
     from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except Exception:
@@ -35,6 +37,16 @@ except Exception:
     DOCX_AVAILABLE = False
 
 
+_NO_GROUP = object()
+
+# export_xlsx hands data with more rows than this to the write-only writer
+XLSX_WRITE_ONLY_THRESHOLD = 20000
+# Rows buffered by export_xlsx_stream to size the columns before writing
+XLSX_WIDTH_SAMPLE_ROWS = 200
+# Excel's row limit; longer exports continue on another sheet
+XLSX_MAX_SHEET_ROWS = 1048576
+
+
 def _is_grouped(data: Any) -> bool:
     return isinstance(data, dict)
 
@@ -80,6 +92,61 @@ def export_csv(data: Any, file_path: str, report_title: str = "Report") -> None:
                         writer.writerow(row)
 
 
+def export_csv_stream(rows: Iterable[Any], file_path: str, report_title: str = "Report",
+                      grouped: bool = False) -> int:
+    """Export rows to CSV as they are produced, in the same layout as export_csv.
+
+    `rows` is consumed once and never held in memory, so it can be a
+    generator over a database cursor (see report_rows.stream_report_csv).
+    Grouped rows are (group, row) pairs arriving group by group.
+
+    Returns:
+        Number of data rows written
+    """
+    rows = iter(rows)
+    try:
+        if not file_path:
+            raise ValueError("No file path specified")
+        first = next(rows, None)
+        if first is None:
+            raise ValueError("No data provided for export")
+    except ValueError as ve:
+        print(f"CSV Export Error: {ve}")
+        raise
+
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    count = 0
+    with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([f"{report_title} - Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}"])
+        writer.writerow([])
+
+        current_group = _NO_GROUP
+        fieldnames = None
+        for item in itertools.chain([first], rows):
+            if grouped:
+                group, row = item
+                if group != current_group:
+                    if current_group is not _NO_GROUP:
+                        writer.writerow([])
+                    writer.writerow([f"=== {group} ==="])
+                    current_group = group
+                    fieldnames = None
+            else:
+                row = item
+            if isinstance(row, dict):
+                if fieldnames is None:
+                    fieldnames = list(row.keys())
+                    writer.writerow(fieldnames)
+                writer.writerow([row.get(k, '') for k in fieldnames])
+            else:
+                writer.writerow(row)
+            count += 1
+        if grouped:
+            writer.writerow([])
+    return count
+
+
 def export_xlsx(data: Any, file_path: str, report_title: str = "Report") -> None:
     """Export data to XLSX with professional formatting, freeze panes, and auto-fit columns."""
     try:
@@ -98,6 +165,15 @@ def export_xlsx(data: Any, file_path: str, report_title: str = "Report") -> None
         export_csv(data, fallback, report_title)
         return
 
+    row_count = sum(len(rows) for rows in data.values()) if _is_grouped(data) else len(data)
+    if row_count > XLSX_WRITE_ONLY_THRESHOLD:
+        if _is_grouped(data):
+            rows = ((group, r) for group, group_rows in data.items() for r in group_rows)
+        else:
+            rows = data
+        export_xlsx_stream(rows, file_path, report_title, grouped=_is_grouped(data))
+        return
+
     wb = Workbook()
     ws = wb.active
     ws.title = report_title[:31]
@@ -220,6 +296,182 @@ def export_xlsx(data: Any, file_path: str, report_title: str = "Report") -> None
     wb.save(file_path)
 
 
+def _xlsx_named_styles():
+    """Named styles for export_xlsx_stream, matching the export_xlsx look.
+
+    Registered once per workbook, so each cell only carries a style name
+    instead of its own font / fill / border objects.
+    """
+    thin = Side(border_style='thin', color='D3D3D3')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    title = NamedStyle(name='report_title', font=Font(bold=True, color='2E86C1', size=14))
+    subtitle = NamedStyle(name='report_subtitle', font=Font(size=10, color='666666'))
+    header = NamedStyle(name='report_header', font=Font(bold=True, color='FFFFFF', size=11),
+                        fill=PatternFill(start_color='2E86C1', end_color='2E86C1', fill_type='solid'),
+                        alignment=Alignment(horizontal='center', vertical='center', wrap_text=True),
+                        border=border)
+    cell = NamedStyle(name='report_cell', border=border)
+    cell_float = NamedStyle(name='report_cell_float', border=border, number_format='0.00')
+    cell_int = NamedStyle(name='report_cell_int', border=border, number_format='0')
+    return [title, subtitle, header, cell, cell_float, cell_int]
+
+
+def _xlsx_cell_style(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'report_cell'
+    if isinstance(value, float):
+        return 'report_cell_float'
+    if isinstance(value, int):
+        return 'report_cell_int'
+    return 'report_cell'
+
+
+def _xlsx_column_widths(sample, grouped: bool):
+    """Column widths (12-50 characters) from the headers and first rows."""
+    widths = []
+
+    def measure(values):
+        for idx, val in enumerate(values):
+            if idx == len(widths):
+                widths.append(0)
+            if val is not None:
+                widths[idx] = max(widths[idx], len(str(val)))
+
+    for item in sample:
+        group, row = item if grouped else (None, item)
+        if grouped:
+            measure([group])
+        if isinstance(row, dict):
+            measure(row.keys())
+            measure(row.values())
+        else:
+            measure(row if isinstance(row, (list, tuple)) else [row])
+    return [min(max(w + 2, 12), 50) for w in widths]
+
+
+def export_xlsx_stream(rows: Iterable[Any], file_path: str, report_title: str = "Report",
+                       grouped: bool = False) -> int:
+    """Export rows to XLSX in constant memory, in the same layout as export_xlsx.
+
+    Uses an openpyxl write-only workbook: every row is serialised to the
+    sheet's temporary file as it is appended, so memory does not grow with
+    the number of rows. Styles are precomputed named styles applied by name.
+    Like export_csv_stream, `rows` is consumed once and grouped rows are
+    (group, row) pairs arriving group by group. Column widths are sized from
+    the first XLSX_WIDTH_SAMPLE_ROWS rows, and exports longer than Excel's
+    row limit continue on further sheets.
+
+    Returns:
+        Number of data rows written
+    """
+    rows = iter(rows)
+    try:
+        if not file_path:
+            raise ValueError("No file path specified for Excel export")
+        sample = list(itertools.islice(rows, XLSX_WIDTH_SAMPLE_ROWS))
+        if not sample:
+            raise ValueError("No data provided for Excel export")
+    except ValueError as ve:
+        print(f"Excel Export Error: {ve}")
+        raise
+
+    if not OPENPYXL_AVAILABLE:
+        print("Warning: openpyxl not available, falling back to CSV")
+        return export_csv_stream(itertools.chain(sample, rows), file_path.replace('.xlsx', '.csv'),
+                                 report_title, grouped=grouped)
+
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    wb = Workbook(write_only=True)
+    for style in _xlsx_named_styles():
+        wb.add_named_style(style)
+    widths = _xlsx_column_widths(sample, grouped)
+    max_cols = 10
+
+    def styled(ws, value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    # One styled cell per (column, style), reused for every row: append()
+    # serialises the row immediately, and looking a named style up for
+    # each new cell is the dominant cost on large exports
+    data_cells = {}
+
+    def data_cell(column, value):
+        key = (column, _xlsx_cell_style(value))
+        cell = data_cells.get(key)
+        if cell is None:
+            cell = data_cells[key] = styled(ws, None, key[1])
+        cell.value = value
+        return cell
+
+    def new_sheet(number):
+        title = report_title[:31] if number == 1 else f"{report_title[:26]} ({number})"
+        ws = wb.create_sheet(title=title)
+        # Write-only sheets take column and pane settings before the first row
+        for idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
+        ws.freeze_panes = 'A4'
+        ws.merged_cells.add(f"A1:{get_column_letter(max_cols)}1")
+        ws.merged_cells.add(f"A2:{get_column_letter(max_cols)}2")
+        ws.row_dimensions[1].height = 24
+        ws.row_dimensions[2].height = 16
+        ws.append([styled(ws, report_title, 'report_title')])
+        ws.append([styled(ws, f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                          'report_subtitle')])
+        ws.append([])
+        return ws
+
+    sheet_number = 1
+    ws = new_sheet(sheet_number)
+    written = 3
+    count = 0
+    current_group = _NO_GROUP
+    headers = None
+    for item in itertools.chain(sample, rows):
+        if grouped:
+            group, row = item
+        else:
+            group, row = None, item
+        starts_group = grouped and group != current_group
+        # The row plus any blank line, group label and header it needs
+        needed = 1 + (2 if starts_group else 0)
+        if isinstance(row, dict) and (headers is None or starts_group):
+            needed += 1
+        if written + needed > XLSX_MAX_SHEET_ROWS:
+            sheet_number += 1
+            ws = new_sheet(sheet_number)
+            data_cells.clear()
+            written = 3
+            if grouped and not starts_group:
+                ws.append([f"{group}"])
+                written += 1
+            headers = None
+        if starts_group:
+            if current_group is not _NO_GROUP and written > 3:
+                ws.append([])
+                written += 1
+            ws.append([f"{group}"])
+            written += 1
+            current_group = group
+            headers = None
+        if isinstance(row, dict):
+            if headers is None:
+                headers = list(row.keys())
+                ws.append([styled(ws, h, 'report_header') for h in headers])
+                written += 1
+            values = [row.get(h, '') for h in headers]
+            ws.append([data_cell(c, v) for c, v in enumerate(values)])
+        else:
+            ws.append([str(row)])
+        written += 1
+        count += 1
+
+    wb.save(file_path)
+    return count
+
+
 def export_pdf(data: Any, file_path: str, report_title: str = "Report") -> None:
     """Export data to PDF in A4 landscape format with professional styling."""
     try:
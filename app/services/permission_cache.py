@@ -0,0 +1,199 @@
+"""
+Cached role-permission resolver.
+
+Permission checks used to walk User -> Role -> Permission -> RolePermission
+with several queries for a single yes/no answer. The resolver materializes
+each role's granted permissions as a bitmask over PermissionType (one bit
+per member) and remembers each user's role, so a check is a dict lookup
+and a bitwise AND.
+
+Role masks are loaded for all roles with one query. User -> role entries
+are loaded on first use per user; the map is only touched under the lock,
+and a lookup that raced with an invalidation is not cached (a generation
+counter moves on every invalidation). Callers that change grants or role
+assignments invalidate the affected entries (RoleService.update_role_permissions,
+RoleService.update_user_role, UserService.update_user / update_user_permissions
+/ permanently_delete_user). Everything is also reloaded after
+PERMISSION_CACHE_TTL_SECONDS so changes made from other workstations are
+eventually seen, and whenever init_db switches databases.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from ..core.database import get_db, get_session_factory
+from ..core.models import Permission, PermissionType, Role, RolePermission, User, UserRole
+
+# Seconds before cached masks are reloaded from the database (None = never)
+PERMISSION_CACHE_TTL_SECONDS: Optional[float] = 60.0
+
+PERMISSION_BITS: Dict[PermissionType, int] = {perm: 1 << i for i, perm in enumerate(PermissionType)}
+ALL_PERMISSIONS_MASK = (1 << len(PERMISSION_BITS)) - 1
+
+_NO_USER = object()
+
+
+def permission_bit(permission: Union[PermissionType, str]) -> int:
+    """Return the bit for a PermissionType member, value ("Delete Asset") or name.
+
+    Raises:
+        ValueError: If the permission is unknown
+    """
+    if isinstance(permission, PermissionType):
+        return PERMISSION_BITS[permission]
+    try:
+        return PERMISSION_BITS[PermissionType(permission)]
+    except ValueError:
+        try:
+            return PERMISSION_BITS[PermissionType[permission]]
+        except KeyError:
+            raise ValueError(f"Unknown permission: {permission}")
+
+
+def mask_to_permissions(mask: int):
+    """Return the PermissionType members set in `mask`."""
+    return [perm for perm, bit in PERMISSION_BITS.items() if mask & bit]
+
+
+class PermissionResolver:
+    """Answers permission checks from cached per-role bitmasks."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._factory = None
+        self._loaded_at = 0.0
+        self._role_masks: Dict[int, int] = {}
+        self._admin_roles = frozenset()
+        self._user_roles: Dict[int, Optional[int]] = {}
+        # Bumped whenever user -> role entries are invalidated
+        self._user_generation = 0
+
+    def role_mask(self, role_id: Optional[int]) -> int:
+        """Bitmask of permissions granted to a role (0 for unknown roles)."""
+        if role_id is None:
+            return 0
+        self._ensure_loaded()
+        return self._role_masks.get(role_id, 0)
+
+    def is_admin_role(self, role_id: Optional[int]) -> bool:
+        self._ensure_loaded()
+        return role_id in self._admin_roles
+
+    def user_role_id(self, user_id: int) -> Optional[int]:
+        """Role id of a user (None if the user or role does not exist)."""
+        self._ensure_loaded()
+        with self._lock:
+            role_id = self._user_roles.get(user_id, _NO_USER)
+            generation = self._user_generation
+        if role_id is _NO_USER:
+            with get_db() as session:
+                row = session.query(User.role_id).filter(User.id == user_id).first()
+            role_id = row[0] if row else None
+            with self._lock:
+                # An invalidation during the lookup may make it stale
+                if generation == self._user_generation:
+                    self._user_roles[user_id] = role_id
+        return role_id
+
+    def has_permission(self, user_id: int, permission: Union[PermissionType, str],
+                       admin_has_all: bool = True) -> bool:
+        """Check whether a user's role grants `permission`.
+
+        Args:
+            user_id: User to check (0 is the built-in admin and always allowed)
+            permission: PermissionType member, value or name
+            admin_has_all: Treat the ADMIN role as having every permission
+
+        Raises:
+            ValueError: If the permission is unknown
+        """
+        bit = permission_bit(permission)
+        if user_id == 0:
+            return True
+        role_id = self.user_role_id(user_id)
+        if role_id is None:
+            return False
+        if admin_has_all and self.is_admin_role(role_id):
+            return True
+        return bool(self.role_mask(role_id) & bit)
+
+    def invalidate(self):
+        """Drop everything; the next check reloads role masks."""
+        with self._lock:
+            self._factory = None
+            self._user_roles = {}
+            self._user_generation += 1
+
+    def invalidate_role(self, role_id: int):
+        """Reload one role's mask after its grants changed (or it was removed)."""
+        with get_db() as session:
+            role = session.query(Role.name).filter(Role.id == role_id).first()
+            grants = (session.query(Permission.name)
+                      .join(RolePermission, RolePermission.permission_id == Permission.id)
+                      .filter(RolePermission.role_id == role_id, RolePermission.granted == "true")
+                      .all())
+        mask = 0
+        for (perm,) in grants:
+            mask |= PERMISSION_BITS[perm]
+        with self._lock:
+            if self._factory is not get_session_factory():
+                return  # not loaded; the next check loads everything
+            masks = dict(self._role_masks)
+            admin_roles = set(self._admin_roles)
+            admin_roles.discard(role_id)
+            if role is None:
+                masks.pop(role_id, None)
+            else:
+                masks[role_id] = mask
+                if role[0] == UserRole.ADMIN:
+                    admin_roles.add(role_id)
+            self._role_masks = masks
+            self._admin_roles = frozenset(admin_roles)
+
+    def invalidate_user(self, user_id: int):
+        """Forget a user's cached role after it changed or the user was removed."""
+        with self._lock:
+            self._user_roles.pop(user_id, None)
+            self._user_generation += 1
+
+    def _ensure_loaded(self):
+        factory = get_session_factory()
+        ttl = PERMISSION_CACHE_TTL_SECONDS
+        if self._factory is factory and factory is not None and (
+                ttl is None or time.monotonic() - self._loaded_at < ttl):
+            return
+        with self._lock:
+            if self._factory is factory and (ttl is None or time.monotonic() - self._loaded_at < ttl):
+                return
+            masks: Dict[int, int] = {}
+            with get_db() as session:
+                roles = session.query(Role.id, Role.name).all()
+                grants = (session.query(RolePermission.role_id, Permission.name)
+                          .join(Permission, RolePermission.permission_id == Permission.id)
+                          .filter(RolePermission.granted == "true")
+                          .all())
+            for role_id, _ in roles:
+                masks[role_id] = 0
+            for role_id, perm in grants:
+                masks[role_id] = masks.get(role_id, 0) | PERMISSION_BITS[perm]
+            self._role_masks = masks
+            self._admin_roles = frozenset(role_id for role_id, name in roles if name == UserRole.ADMIN)
+            self._user_roles = {}
+            self._user_generation += 1
+            self._loaded_at = time.monotonic()
+            self._factory = factory
+
+
+_resolver: Optional[PermissionResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_permission_resolver() -> PermissionResolver:
+    """Return the process-wide permission resolver."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = PermissionResolver()
+    return _resolver
@@ -0,0 +1,251 @@
+"""
+Row builders for the asset reports on the Reports screen.
+
+Each builder is a generator that turns asset dicts (the shape returned by
+AssetService) into report rows, one at a time, so the same code serves
+both the in-memory exports (PDF and DOCX build a list first) and the
+streaming CSV and XLSX exports, which pull assets from
+AssetService.iter_assets and write each row as soon as it is built.
+
+Grouped reports yield (group, row) pairs; iter_report_rows asks the
+database to order assets by the group key so each group arrives in one
+contiguous run.
+"""
+
+from collections import namedtuple
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .expiry_calculator import ExpiryCalculator
+
+ReportRow = Dict[str, Any]
+
+# builder: generator over asset dicts; group_by: iter_assets group key (None
+# for flat reports, whose builder yields rows instead of (group, row) pairs)
+ReportSpec = namedtuple('ReportSpec', 'builder group_by')
+
+
+def _format_date(value) -> Tuple[str, Any]:
+    """Return (YYYY-MM-DD string, date) for an ISO string or date value."""
+    if not value:
+        return '', None
+    try:
+        parsed = datetime.fromisoformat(value) if isinstance(value, str) else value
+        parsed = parsed.date() if isinstance(parsed, datetime) else parsed
+        return parsed.strftime('%Y-%m-%d'), parsed
+    except Exception:
+        return str(value), None
+
+
+def _category(asset: Dict[str, Any]) -> str:
+    return asset.get('category_name') or asset.get('category') or 'Unknown'
+
+
+def _years_owned(acq_date) -> float:
+    return (datetime.now().date() - acq_date).days / 365.25
+
+
+def all_assets_rows(assets: Iterable[Dict[str, Any]]) -> Iterator[ReportRow]:
+    """All assets with depreciation fields."""
+    for asset in assets:
+        acq_str, acq_date = _format_date(asset.get('acquisition_date'))
+        useful_life = asset.get('useful_life')
+
+        # Calculate remaining useful life using Dec 31 logic
+        remaining_life = useful_life
+        if acq_date and useful_life:
+            try:
+                remaining_life = ExpiryCalculator.calculate_remaining_useful_life(useful_life, acq_date)
+            except Exception:
+                remaining_life = useful_life
+
+        yield {
+            'Asset ID': asset.get('asset_id'),
+            'Name': asset.get('name'),
+            'Model Number': asset.get('model_number') or '',
+            'Serial Number': asset.get('serial_number') or '',
+            'Category': _category(asset),
+            'Department': asset.get('department') or 'Not Assigned',
+            'Acquisition Date': acq_str,
+            'Total Cost': float(asset.get('total_cost') or 0),
+            'Useful Life (Years)': useful_life or 0,
+            'Remaining Life (Years)': remaining_life or 0,
+            'Depreciation %': float(asset.get('depreciation_percentage') or 0),
+            'Status': asset.get('status') or 'Unknown'
+        }
+
+
+def category_rows(assets: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, ReportRow]]:
+    """(category, row) pairs."""
+    for asset in assets:
+        yield _category(asset), {
+            'Asset ID': asset.get('asset_id'),
+            'Name': asset.get('name'),
+            'Model Number': asset.get('model_number') or '',
+            'Serial Number': asset.get('serial_number') or '',
+            'Department': asset.get('department') or 'Not Assigned',
+            'Acquisition Date': _format_date(asset.get('acquisition_date'))[0],
+            'Total Cost': float(asset.get('total_cost') or 0),
+            'Status': asset.get('status') or 'Unknown'
+        }
+
+
+def department_rows(assets: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, ReportRow]]:
+    """(department, row) pairs."""
+    for asset in assets:
+        yield asset.get('department') or 'Not Assigned', {
+            'Asset ID': asset.get('asset_id'),
+            'Name': asset.get('name'),
+            'Model Number': asset.get('model_number') or '',
+            'Serial Number': asset.get('serial_number') or '',
+            'Category': _category(asset),
+            'Acquisition Date': _format_date(asset.get('acquisition_date'))[0],
+            'Total Cost': float(asset.get('total_cost') or 0),
+            'Status': asset.get('status') or 'Unknown'
+        }
+
+
+def depreciation_rows(assets: Iterable[Dict[str, Any]]) -> Iterator[ReportRow]:
+    """Straight-line depreciation to date; assets without cost, life or date are skipped."""
+    for asset in assets:
+        total_cost = asset.get('total_cost')
+        useful_life = asset.get('useful_life')
+        acq_date = _format_date(asset.get('acquisition_date'))[1]
+        if not (acq_date and total_cost and useful_life):
+            continue
+        try:
+            annual_depreciation = float(total_cost) / float(useful_life)
+            years_owned = _years_owned(acq_date)
+            accumulated_depreciation = min(annual_depreciation * years_owned, float(total_cost))
+            book_value = float(total_cost) - accumulated_depreciation
+        except Exception:
+            # skip problematic records
+            continue
+        yield {
+            'Asset ID': asset.get('asset_id'),
+            'Name': asset.get('name'),
+            'Model Number': asset.get('model_number'),
+            'Serial Number': asset.get('serial_number'),
+            'Original Cost': float(total_cost),
+            'Useful Life': useful_life,
+            'Annual Depreciation': round(annual_depreciation, 2),
+            'Accumulated Depreciation': round(accumulated_depreciation, 2),
+            'Book Value': round(book_value, 2),
+            'Years Owned': round(years_owned, 2)
+        }
+
+
+def valuation_rows(assets: Iterable[Dict[str, Any]]) -> Iterator[ReportRow]:
+    """Original cost against current book value, followed by a TOTAL row."""
+    total_original_cost = 0
+    total_book_value = 0
+    for asset in assets:
+        original_cost = float(asset.get('total_cost') or 0)
+        useful_life = asset.get('useful_life')
+        acq_date = _format_date(asset.get('acquisition_date'))[1]
+        book_value = original_cost
+
+        if acq_date and useful_life and original_cost > 0:
+            try:
+                annual_depreciation = original_cost / float(useful_life)
+                accumulated_depreciation = min(annual_depreciation * _years_owned(acq_date), original_cost)
+                book_value = original_cost - accumulated_depreciation
+            except Exception:
+                book_value = original_cost
+
+        total_original_cost += original_cost
+        total_book_value += book_value
+        yield {
+            'Asset ID': asset.get('asset_id'),
+            'Name': asset.get('name'),
+            'Model Number': asset.get('model_number'),
+            'Serial Number': asset.get('serial_number'),
+            'Category': _category(asset),
+            'Original Cost': original_cost,
+            'Current Book Value': round(book_value, 2),
+            'Depreciation': round(original_cost - book_value, 2)
+        }
+
+    # Add summary
+    yield {
+        'Asset ID': 'TOTAL',
+        'Name': 'Summary',
+        'Category': '',
+        'Original Cost': round(total_original_cost, 2),
+        'Current Book Value': round(total_book_value, 2),
+        'Depreciation': round(total_original_cost - total_book_value, 2)
+    }
+
+
+def maintenance_rows(assets: Iterable[Dict[str, Any]]) -> Iterator[ReportRow]:
+    """Maintenance schedule placeholder (there are no maintenance records yet)."""
+    for asset in assets:
+        yield {
+            'Asset ID': asset.get('asset_id'),
+            'Name': asset.get('name'),
+            'Model Number': asset.get('model_number') or '',
+            'Serial Number': asset.get('serial_number') or '',
+            'Category': _category(asset),
+            'Last Maintenance': 'N/A',  # Would come from maintenance records
+            'Next Maintenance Due': 'N/A',  # Would be calculated
+            'Maintenance Type': 'Routine',
+            'Status': asset.get('status') or 'Unknown'
+        }
+
+
+REPORT_SPECS = {
+    "All Assets Report": ReportSpec(all_assets_rows, None),
+    "Assets by Category": ReportSpec(category_rows, 'category'),
+    "Assets by Department": ReportSpec(department_rows, 'department'),
+    "Depreciation Report": ReportSpec(depreciation_rows, None),
+    "Asset Valuation Report": ReportSpec(valuation_rows, None),
+    "Maintenance Schedule": ReportSpec(maintenance_rows, None),
+}
+DEFAULT_REPORT = "All Assets Report"
+
+
+def iter_report_rows(report_type: str, asset_service=None,
+                     filters: Optional[Dict[str, Any]] = None) -> Tuple[bool, Iterator]:
+    """Stream the rows of a report straight from the database.
+
+    Args:
+        report_type: One of REPORT_SPECS (unknown types use DEFAULT_REPORT)
+        asset_service: AssetService to read through (a new one by default)
+        filters: AssetService filters
+
+    Returns:
+        (grouped, rows) where rows yields (group, row) pairs for grouped
+        reports and plain rows otherwise
+    """
+    if asset_service is None:
+        from .asset_service import AssetService
+        asset_service = AssetService()
+    spec = REPORT_SPECS.get(report_type, REPORT_SPECS[DEFAULT_REPORT])
+    assets = asset_service.iter_assets(filters=filters, group_by=spec.group_by)
+    return spec.group_by is not None, spec.builder(assets)
+
+
+def stream_report_csv(report_type: str, file_path: str, asset_service=None,
+                      filters: Optional[Dict[str, Any]] = None) -> int:
+    """Write a report to CSV while reading it, in constant memory.
+
+    Returns:
+        Number of rows written
+    """
+    from .export_method import export_csv_stream
+
+    grouped, rows = iter_report_rows(report_type, asset_service, filters)
+    return export_csv_stream(rows, file_path, report_type, grouped=grouped)
+
+
+def stream_report_xlsx(report_type: str, file_path: str, asset_service=None,
+                       filters: Optional[Dict[str, Any]] = None) -> int:
+    """Write a report to a write-only XLSX workbook while reading it.
+
+    Returns:
+        Number of rows written
+    """
+    from .export_method import export_xlsx_stream
+
+    grouped, rows = iter_report_rows(report_type, asset_service, filters)
+    return export_xlsx_stream(rows, file_path, report_type, grouped=grouped)
@@ -4,6 +4,7 @@ from datetime import datetime
 
 from ..core.database import get_db
 from ..core.models import Role, Permission, RolePermission, UserRole, PermissionType, User, UserSession
+from .permission_cache import get_permission_resolver
 
 
 class RoleService:
@@ -93,6 +94,7 @@ class RoleService:
                         continue
                 
                 session.commit()
+                get_permission_resolver().invalidate_role(role_id)
                 return True
             except Exception:
                 session.rollback()
@@ -104,30 +106,13 @@ class RoleService:
         if user_id == 0:
             return True
             
-        with get_db() as session:
-            try:
-                perm_type = PermissionType(permission)
-                user = session.query(User).filter(User.id == user_id).first()
-                if not user or not user.role:
-                    return False
-                
-                # Admin role has all permissions
-                if user.role.name == UserRole.ADMIN:
-                    return True
-                
-                # Check if user's role has the permission
-                role_perms = session.query(RolePermission).join(
-                    Permission
-                ).filter(
-                    RolePermission.role_id == user.role_id,
-                    Permission.name == perm_type,
-                    RolePermission.granted == "true"
-                ).first()
-                
-                return role_perms is not None
-            except (ValueError, Exception) as e:
-                print(f"Permission check error: {e}")
-                return False
+        try:
+            # Admin role has all permissions; others are checked against the
+            # role's cached permission bitmask
+            return get_permission_resolver().has_permission(user_id, permission)
+        except (ValueError, Exception) as e:
+            print(f"Permission check error: {e}")
+            return False
     
     def update_user_role(self, user_id: int, role_id: int) -> bool:
         """Update a user's role"""
@@ -144,6 +129,7 @@ class RoleService:
                 user.role_id = role.id
                 user.updated_at = datetime.utcnow()
                 session.commit()
+                get_permission_resolver().invalidate_user(user_id)
                 return True
             except Exception:
                 session.rollback()
@@ -181,6 +181,10 @@ class SessionService(QObject):
                 # Use AuthService to invalidate session
                 result = self.auth_service.logout(self._session_token)
                 
+                # Make sure this user's queued audit records are written before
+                # the session context is cleared
+                self.audit_service.flush()
+                
                 # Clear desktop session state
                 self._clear_session()
                 
@@ -1,16 +1,67 @@
+import copy
 import json
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-from ..core.database import get_db
+from sqlalchemy import func
+
+from ..core.database import get_db, get_session_factory
 from ..core.models import SystemConfiguration, User
 from .audit_service import AuditService
 
+# Settings are served from an in-process snapshot loaded with one query.
+# Writes through this service invalidate it; changes made by other
+# workstations are picked up by a cheap version check (row count and
+# latest updated_at) at most every SETTINGS_REVALIDATE_SECONDS. None
+# disables the check, so only local writes refresh the snapshot.
+SETTINGS_REVALIDATE_SECONDS: Optional[float] = 5.0
+
+_MISSING = object()
+
+
+class _SettingsSnapshot:
+    """Converted setting values for one database, plus its version stamp."""
+
+    def __init__(self, factory, values: Dict[Tuple[str, str], Any], version: Tuple):
+        self.factory = factory
+        self.values = values
+        self.version = version
+        self.checked_at = time.monotonic()
+
+
+_snapshot: Optional[_SettingsSnapshot] = None
+_snapshot_lock = threading.Lock()
+# Session factory whose default settings rows have already been ensured
+_defaults_initialized_for = None
+
+
+def invalidate_settings_cache():
+    """Drop the cached settings snapshot; the next lookup reloads it."""
+    global _snapshot
+    _snapshot = None
+
+
+def set_settings_revalidate_interval(seconds: Optional[float]):
+    """Set how often (in seconds) the snapshot is checked against the database."""
+    global SETTINGS_REVALIDATE_SECONDS
+    SETTINGS_REVALIDATE_SECONDS = seconds
+
+
+def _settings_version(session) -> Tuple:
+    count, latest = session.query(
+        func.count(SystemConfiguration.id), func.max(SystemConfiguration.updated_at)
+    ).one()
+    return count, latest
+
 
 class SettingsService:
     def __init__(self):
         self.audit_service = AuditService()
-        self._initialize_default_settings()
+        # Default rows only need to be ensured once per database
+        if _defaults_initialized_for is None or _defaults_initialized_for is not get_session_factory():
+            self._initialize_default_settings()
 
     def _initialize_default_settings(self):
         """Initialize default system settings if they don't exist."""
@@ -169,15 +220,12 @@ class SettingsService:
             }
         ]
 
+        global _defaults_initialized_for
         try:
             with get_db() as session:
+                existing = set(session.query(SystemConfiguration.category, SystemConfiguration.key))
                 for setting in default_settings:
-                    existing = session.query(SystemConfiguration).filter(
-                        SystemConfiguration.category == setting['category'],
-                        SystemConfiguration.key == setting['key']
-                    ).first()
-                    
-                    if not existing:
+                    if (setting['category'], setting['key']) not in existing:
                         config = SystemConfiguration(**setting)
                         session.add(config)
                 
@@ -195,11 +243,55 @@ class SettingsService:
                 except Exception:
                     # non-fatal
                     pass
+            _defaults_initialized_for = get_session_factory()
+            invalidate_settings_cache()
         except Exception as e:
             print(f"Error initializing default settings: {e}")
 
+    def _get_snapshot(self) -> Optional[_SettingsSnapshot]:
+        """Return a current settings snapshot, reloading it when stale."""
+        global _snapshot
+        factory = get_session_factory()
+        snapshot = _snapshot
+        if snapshot is not None and snapshot.factory is factory:
+            interval = SETTINGS_REVALIDATE_SECONDS
+            if interval is None or time.monotonic() - snapshot.checked_at < interval:
+                return snapshot
+
+        with _snapshot_lock:
+            snapshot = _snapshot
+            try:
+                with get_db() as session:
+                    if snapshot is not None and snapshot.factory is factory:
+                        # Cheap version check before reloading everything
+                        if _settings_version(session) == snapshot.version:
+                            snapshot.checked_at = time.monotonic()
+                            return snapshot
+
+                    rows = session.query(
+                        SystemConfiguration.category, SystemConfiguration.key,
+                        SystemConfiguration.value, SystemConfiguration.data_type,
+                        SystemConfiguration.updated_at
+                    ).all()
+            except Exception as e:
+                print(f"Error loading settings snapshot: {e}")
+                return None
+
+            values = {(r.category, r.key): self._convert_value(r.value, r.data_type) for r in rows}
+            latest = max((r.updated_at for r in rows if r.updated_at is not None), default=None)
+            _snapshot = _SettingsSnapshot(factory, values, (len(rows), latest))
+            return _snapshot
+
     def get_setting(self, category: str, key: str, default_value: Any = None) -> Any:
-        """Get a specific setting value."""
+        """Get a specific setting value (served from the cached snapshot)."""
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            value = snapshot.values.get((category, key), _MISSING)
+            if value is _MISSING:
+                return default_value
+            # json settings are mutable; never hand out the cached object
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
         try:
             with get_db() as session:
                 setting = session.query(SystemConfiguration).filter(
@@ -244,6 +336,7 @@ class SettingsService:
                     session.add(setting)
                 
                 session.commit()
+                invalidate_settings_cache()
                 
                 # Log the change
                 user = session.query(User).filter(User.id == updated_by_id).first()
@@ -330,6 +423,7 @@ class SettingsService:
                 setting.updated_by_id = updated_by_id
                 
                 session.commit()
+                invalidate_settings_cache()
                 
                 # Log the change
                 user = session.query(User).filter(User.id == updated_by_id).first()
@@ -453,3 +547,6 @@ class SettingsService:
             }
         except Exception as e:
             return {"success": False, "message": f"Error importing settings: {str(e)}"}
+        finally:
+            # set_setting already invalidates per row; also covers partial failures
+            invalidate_settings_cache()
@@ -12,6 +12,7 @@ from ..core.database import get_db
 from .audit_service import AuditService
 from .settings_service import SettingsService
 from .auth_service import AuthService
+from .permission_cache import get_permission_resolver
 
 
 class UserService:
@@ -341,6 +342,8 @@ class UserService:
                 if update_dict:
                     session.query(User).filter(User.id == user_id).update(update_dict, synchronize_session=False)
                 session.commit()
+                if 'role' in user_data:
+                    get_permission_resolver().invalidate_user(user_id)
                 # Debug: re-query in same session to confirm persistence
                 try:
                     persisted = session.query(User).filter(User.id == user_id).first()
@@ -520,6 +523,7 @@ class UserService:
                 # Finally delete the user row
                 session.delete(user)
                 session.commit()
+                get_permission_resolver().invalidate_user(user_id)
 
                 # Audit logging
                 try:
@@ -585,6 +589,7 @@ class UserService:
                     user.updated_at = datetime.utcnow()
                     
                     session.commit()
+                    get_permission_resolver().invalidate_user(user_id)
                     
                     # Audit logging
                     self.audit_service.log_action(
@@ -14,8 +14,11 @@ from sqlalchemy.orm import Session
 from app.core.models import Asset
 from app.core.database import get_db_session
 from app.services.audit_service import AuditService
-from app.services.expiry_calculator import ExpiryCalculator
-from app.services.depreciation_calculator import DepreciationCalculator
+from app.services.audit_payload import diff_values
+from app.services.depreciation_engine import (
+    YEAR_END_STATUSES, STOP_REASONS, compute_year_end_depreciation,
+    compute_year_end_expiry_years, load_year_end_inputs, write_year_end_results
+)
 
 
 class YearEndService:
@@ -29,21 +32,33 @@ class YearEndService:
         check_date = target_date or datetime.utcnow()
         return check_date.month == 12 and check_date.day == 31
     
-    def process_year_end_depreciation(self, session: Session = None) -> Dict[str, Any]:
+    def process_year_end_depreciation(self, session: Session = None,
+                                      processing_date: date = None) -> Dict[str, Any]:
         """
         Process year-end depreciation for all active assets.
         
         On December 31st, for each asset:
-        1. Reduce useful_life by 1 year
-        2. Recalculate expiry_date based on new remaining useful life
-        3. Apply annual depreciation to accumulated_depreciation
-        4. Update net_book_value
-        5. Record audit trail
+        1. Apply prorated first-year or full-year depreciation to accumulated_depreciation
+        2. Update net_book_value (never below the residual value)
+        3. Recalculate expiry_date aligned to Dec 31
+        4. Record audit trail
+        
+        The depreciation is computed for all assets at once by the vectorized
+        depreciation_engine and written back with a bulk UPDATE; the audit
+        records (one per asset that changed) are inserted in the same
+        transaction with AuditService.log_actions.
+        
+        Args:
+            session: Optional database session (a new one is opened if omitted)
+            processing_date: Date to process as (default: today); must be Dec 31
         
         Returns:
             Dictionary with processing results
         """
-        if not self.is_year_end():
+        today = processing_date or datetime.utcnow().date()
+        if isinstance(today, datetime):
+            today = today.date()
+        if not self.is_year_end(today):
             return {
                 "success": False,
                 "message": "Year-end processing only runs on December 31st",
@@ -56,110 +71,89 @@ class YearEndService:
             close_session = True
         
         try:
-            # Get all active assets
-            assets = session.query(Asset).filter(
-                Asset.status.in_(['Available', 'In Use', 'Under Maintenance'])
-            ).all()
+            # Load every active asset's inputs as column arrays
+            inputs = load_year_end_inputs(session)
+            result = compute_year_end_depreciation(
+                cost=inputs['total_cost'],
+                residual_value=inputs['salvage_value'],
+                useful_life=inputs['useful_life'],
+                purchase_month=inputs['acquisition_month'],
+                years_applied=inputs['depreciation_years_applied'],
+                net_book_value=inputs['net_book_value'],
+            )
+            expiry_years = compute_year_end_expiry_years(
+                inputs['acquisition_year'], inputs['useful_life'], today
+            )
+            year_end_dates = {}
+            expiry_dates = [
+                year_end_dates.setdefault(year, date(year, 12, 31)) for year in expiry_years.tolist()
+            ]
             
-            processed_count = 0
-            updated_assets = []
-            
-            today = datetime.utcnow().date()
+            write_year_end_results(session, inputs, result, expiry_dates)
             
-            for asset in assets:
-                try:
-                    old_values = {
-                        'useful_life': asset.useful_life,
-                        'expiry_date': asset.expiry_date.isoformat() if asset.expiry_date else None,
-                        'accumulated_depreciation': asset.accumulated_depreciation,
-                        'net_book_value': asset.net_book_value,
-                        'depreciation_years_applied': asset.depreciation_years_applied if hasattr(asset, 'depreciation_years_applied') else 0
-                    }
-                    
-                    # Skip if missing required data
-                    if not asset.acquisition_date or not asset.useful_life or not asset.total_cost:
-                        continue
-                    
-                    # Ensure salvage_value exists (default to 10% if not set)
-                    if not hasattr(asset, 'salvage_value') or asset.salvage_value is None:
-                        asset.salvage_value = asset.total_cost * 0.10
-                    
-                    # Ensure depreciation_years_applied exists
-                    if not hasattr(asset, 'depreciation_years_applied') or asset.depreciation_years_applied is None:
-                        asset.depreciation_years_applied = 0
-                    
-                    # Calculate depreciation using the new prorated logic
-                    depreciation_result = DepreciationCalculator.calculate_depreciation_for_year(
-                        cost=asset.total_cost,
-                        residual_value=asset.salvage_value,
-                        useful_life=asset.useful_life,
-                        purchase_date=asset.acquisition_date,
-                        depreciation_years_applied=asset.depreciation_years_applied,
-                        current_net_book_value=asset.net_book_value
-                    )
-                    
-                    # Only apply depreciation if should_continue is True or depreciation_to_apply > 0
-                    if depreciation_result['depreciation_to_apply'] > 0:
-                        # Apply the calculated depreciation
-                        asset.accumulated_depreciation = depreciation_result['new_accumulated_depreciation']
-                        asset.net_book_value = depreciation_result['new_net_book_value']
-                        asset.depreciation_years_applied += 1
-                        
-                        # Recalculate expiry date based on remaining useful life - aligned to Dec 31
-                        if asset.acquisition_date and asset.useful_life:
-                            new_expiry = ExpiryCalculator.calculate_expiry_date_aligned_to_year_end(
-                                asset.acquisition_date, 
-                                asset.useful_life,
-                                today
-                            )
-                            asset.expiry_date = new_expiry
-                    else:
-                        # Depreciation stopped - log the reason
-                        print(f"Asset {asset.asset_id}: Depreciation stopped - {depreciation_result['reason']}")
-                    
+            updated_assets = []
+            audit_entries = []
+            stopped_counts = {}
+            applied = result['depreciation'] > 0
+            for i in range(len(inputs['id'])):
+                old_expiry = inputs['expiry_date'][i]
+                old_years = int(inputs['depreciation_years_applied'][i])
+                old_values = {
+                    'useful_life': int(inputs['useful_life'][i]),
+                    'expiry_date': old_expiry.isoformat() if old_expiry else None,
+                    'accumulated_depreciation': float(inputs['total_cost'][i] - inputs['net_book_value'][i]),
+                    'net_book_value': float(inputs['net_book_value'][i]),
+                    'depreciation_years_applied': old_years
+                }
+                if applied[i]:
                     new_values = {
-                        'useful_life': asset.useful_life,
-                        'expiry_date': asset.expiry_date.isoformat() if asset.expiry_date else None,
-                        'accumulated_depreciation': asset.accumulated_depreciation,
-                        'net_book_value': asset.net_book_value,
-                        'depreciation_years_applied': asset.depreciation_years_applied
+                        'useful_life': old_values['useful_life'],
+                        'expiry_date': expiry_dates[i].isoformat(),
+                        'accumulated_depreciation': float(result['accumulated_depreciation'][i]),
+                        'net_book_value': float(result['net_book_value'][i]),
+                        'depreciation_years_applied': old_years + 1
                     }
-                    
-                    # 5. Record audit trail
-                    self.audit_service.log_action(
-                        action='YEAR_END_DEPRECIATION',
-                        table_name='assets',
-                        record_id=str(asset.id),
-                        description=f'Year-end depreciation update for asset {asset.asset_id} (Year {asset.depreciation_years_applied})',
-                        old_values=str(old_values),
-                        new_values=str(new_values)
-                    )
-                    
-                    depreciation_applied = depreciation_result['depreciation_to_apply'] if depreciation_result['depreciation_to_apply'] > 0 else 0
-                    
-                    updated_assets.append({
-                        'asset_id': asset.asset_id,
-                        'asset_name': asset.name,
-                        'old_useful_life': old_values['useful_life'],
-                        'new_useful_life': asset.useful_life,
-                        'old_expiry_date': old_values['expiry_date'],
-                        'new_expiry_date': new_values['expiry_date'],
-                        'depreciation_applied': depreciation_applied,
-                        'depreciation_years_applied': asset.depreciation_years_applied,
-                        'is_first_year': asset.depreciation_years_applied == 1,
-                        'stopped': depreciation_result['depreciation_to_apply'] == 0,
-                        'stop_reason': depreciation_result.get('reason')
+                    stop_reason = None
+                else:
+                    new_values = old_values
+                    stop_reason = STOP_REASONS[int(result['stop_code'][i])]
+                    stopped_counts[stop_reason] = stopped_counts.get(stop_reason, 0) + 1
+                
+                # Audit trail: only the columns that changed, skipping
+                # assets that no longer depreciate
+                old_changes, new_changes = diff_values(old_values, new_values) if applied[i] else (None, None)
+                if old_changes or new_changes:
+                    audit_entries.append({
+                        'action': 'YEAR_END_DEPRECIATION',
+                        'table_name': 'assets',
+                        'record_id': str(inputs['id'][i]),
+                        'description': f"Year-end depreciation update for asset {inputs['asset_id'][i]} (Year {new_values['depreciation_years_applied']})",
+                        'old_values': old_changes,
+                        'new_values': new_changes
                     })
-                    
-                    processed_count += 1
-                    
-                except Exception as e:
-                    print(f"Error processing asset {asset.asset_id}: {e}")
-                    continue
+                
+                updated_assets.append({
+                    'asset_id': inputs['asset_id'][i],
+                    'asset_name': inputs['name'][i],
+                    'old_useful_life': old_values['useful_life'],
+                    'new_useful_life': new_values['useful_life'],
+                    'old_expiry_date': old_values['expiry_date'],
+                    'new_expiry_date': new_values['expiry_date'],
+                    'depreciation_applied': float(result['depreciation'][i]),
+                    'depreciation_years_applied': new_values['depreciation_years_applied'],
+                    'is_first_year': new_values['depreciation_years_applied'] == 1,
+                    'stopped': not applied[i],
+                    'stop_reason': stop_reason
+                })
             
-            # Commit changes
+            # The audit trail commits together with the depreciation
+            self.audit_service.log_actions(session, audit_entries)
             session.commit()
             
+            for reason, count in stopped_counts.items():
+                print(f"{count} assets: Depreciation stopped - {reason}")
+            
+            processed_count = len(updated_assets)
             return {
                 "success": True,
                 "message": f"Year-end depreciation processed for {processed_count} assets",
@@ -211,7 +205,7 @@ class YearEndService:
         try:
             # Get all active assets
             assets = session.query(Asset).filter(
-                Asset.status.in_(['Available', 'In Use', 'Under Maintenance'])
+                Asset.status.in_(YEAR_END_STATUSES)
             ).all()
             
             total_assets = len(assets)
@@ -235,11 +229,12 @@ class YearEndService:
             if close_session:
                 session.close()
     
-    def manually_trigger_year_end(self, session: Session = None) -> Dict[str, Any]:
+    def manually_trigger_year_end(self, session: Session = None,
+                                  processing_date: date = None) -> Dict[str, Any]:
         """
         Manually trigger year-end processing (for testing or administrative purposes)
         
         Returns:
             Processing results
         """
-        return self.process_year_end_depreciation(session)
+        return self.process_year_end_depreciation(session, processing_date)
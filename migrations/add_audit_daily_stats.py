@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Migration: Add the audit_daily_stats rollup table
+
+Creates audit_daily_stats (counts per UTC day, action and username),
+fills it from audit_logs and the audit archive and records the rebuild in
+system_configuration. The application keeps it current from then on. If
+the migration is not run, the first statistics read or log cleanup does
+the same backfill (on databases without the rebuild marker).
+
+Usage:
+    python migrations/add_audit_daily_stats.py [up|down]
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.config import Config
+from app.core.models import AuditDailyStat
+from app.services.audit_rollup import rebuild_audit_rollup
+
+
+def migrate_up(engine):
+    """Create and populate the rollup table"""
+    AuditDailyStat.__table__.create(bind=engine, checkfirst=True)
+    print("✓ audit_daily_stats table is in place")
+
+    session = sessionmaker(bind=engine)()
+    try:
+        rows = rebuild_audit_rollup(session)
+        session.commit()
+        print(f"✓ Rebuilt audit_daily_stats ({rows} rows)")
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def migrate_down(engine):
+    """Rollback: Drop the rollup table"""
+    AuditDailyStat.__table__.drop(bind=engine, checkfirst=True)
+    print("✓ Dropped audit_daily_stats")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "up"
+    engine = create_engine(Config().DATABASE_URL, echo=False)
+
+    if action == "up":
+        print("Running migration: Add audit_daily_stats")
+        migrate_up(engine)
+    elif action == "down":
+        print("Running migration rollback: Drop audit_daily_stats")
+        migrate_down(engine)
+    else:
+        print(f"Unknown action: {action}")
+        sys.exit(1)
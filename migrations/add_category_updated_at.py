@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Migration: Add updated_at to asset_categories and asset_subcategories
+
+The data-version stamp (app/services/data_version.py) includes the latest
+category and subcategory updated_at, so renames invalidate cached payloads
+and API ETags. Existing rows keep NULL until they are next updated.
+
+Usage:
+    python migrations/add_category_updated_at.py [up|down]
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, inspect, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.config import Config
+
+CATEGORY_TABLES = ('asset_categories', 'asset_subcategories')
+
+
+def migrate_up(engine):
+    """Add the updated_at columns"""
+    inspector = inspect(engine)
+    for table in CATEGORY_TABLES:
+        columns = [col['name'] for col in inspector.get_columns(table)]
+        if 'updated_at' in columns:
+            print(f"✓ {table}.updated_at already exists")
+            continue
+        timestamp_type = 'TIMESTAMP' if engine.dialect.name == 'postgresql' else 'DATETIME'
+        with engine.begin() as conn:
+            conn.execute(text(f'ALTER TABLE {table} ADD COLUMN updated_at {timestamp_type}'))
+        print(f"✓ Added updated_at column to {table}")
+
+
+def migrate_down(engine):
+    """Rollback: Remove the updated_at columns"""
+    inspector = inspect(engine)
+    for table in CATEGORY_TABLES:
+        columns = [col['name'] for col in inspector.get_columns(table)]
+        if 'updated_at' not in columns:
+            print(f"✓ {table}.updated_at does not exist")
+            continue
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table} DROP COLUMN updated_at'))
+            print(f"✓ Removed updated_at column from {table}")
+        except Exception as e:
+            print(f"⚠ Could not drop {table}.updated_at: {e}")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "up"
+    engine = create_engine(Config().DATABASE_URL, echo=False)
+
+    if action == "up":
+        print("Running migration: Add category updated_at columns")
+        migrate_up(engine)
+    elif action == "down":
+        print("Running migration rollback: Remove category updated_at columns")
+        migrate_down(engine)
+    else:
+        print(f"Unknown action: {action}")
+        sys.exit(1)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Migration: Add the full-text asset and audit log search indexes
+
+init_db creates the indexes on start-up; this migration does the same for a
+database without starting the application, and can roll it back.
+
+  SQLite      assets_fts / audit_logs_fts FTS5 external-content tables +
+              <table>_fts_ai/ad/au triggers, populated from the existing
+              rows ('rebuild')
+  PostgreSQL  ix_assets_search / ix_audit_logs_search GIN indexes on
+              to_tsvector('simple', ...)
+
+Usage:
+    python migrations/add_fulltext_search.py [up|down]
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.config import Config
+from app.core.fulltext import drop_fulltext_indexes, ensure_fulltext_indexes
+
+
+def migrate_up(engine):
+    """Create the search indexes and populate them"""
+    if ensure_fulltext_indexes(engine):
+        print("✓ Full-text asset and audit log search indexes are in place")
+    else:
+        print(f"✗ Full-text search is not supported on {engine.dialect.name}; LIKE search stays in use")
+
+
+def migrate_down(engine):
+    """Rollback: Drop the search indexes"""
+    drop_fulltext_indexes(engine)
+    print("✓ Dropped full-text search indexes")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "up"
+    engine = create_engine(Config().DATABASE_URL, echo=False)
+
+    if action == "up":
+        print("Running migration: Add full-text search")
+        migrate_up(engine)
+    elif action == "down":
+        print("Running migration rollback: Drop full-text search")
+        migrate_down(engine)
+    else:
+        print(f"Unknown action: {action}")
+        sys.exit(1)
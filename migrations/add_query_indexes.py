@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Migration: Add indexes for hot asset, audit log and session queries
+
+New databases get these indexes from the model definitions (create_all);
+this migration adds them to existing databases. Indexes:
+
+  assets
+    ix_assets_created_at            (created_at, id)            default list order / keyset cursor
+    ix_assets_status_created_at     (status, created_at, id)    status filters (incl. Recently Deleted)
+    ix_assets_category_created_at   (category_id, created_at, id) category pages
+    ix_assets_acquisition_date      (acquisition_date, id)      date range filter / sort
+    ix_assets_expiry_date           (expiry_date)               expiry filters, summary counts
+    ix_assets_department            (department)
+    ix_assets_location              (location)
+    ix_assets_updated_at            (updated_at)                data-version stamp (API ETags, caches)
+  audit_logs
+    ix_audit_logs_timestamp_id      (timestamp, id)             recent activity, date filters, keyset cursor
+    ix_audit_logs_table_record_action (table_name, record_id, action, timestamp)
+  user_sessions
+    ix_user_sessions_user_active    (user_id, is_active)        login / logout / force logout
+    ix_user_sessions_active_last_activity (is_active, last_activity) expiry sweep
+
+Superseded indexes are dropped when present:
+
+  ix_audit_logs_timestamp           (timestamp), replaced by ix_audit_logs_timestamp_id
+
+Usage:
+    python migrations/add_query_indexes.py [up|down]
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, inspect
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.config import Config
+from app.core.models import Asset, AuditLog, UserSession
+
+QUERY_INDEX_TABLES = (Asset.__table__, AuditLog.__table__, UserSession.__table__)
+
+QUERY_INDEX_NAMES = (
+    'ix_assets_created_at',
+    'ix_assets_status_created_at',
+    'ix_assets_category_created_at',
+    'ix_assets_acquisition_date',
+    'ix_assets_expiry_date',
+    'ix_assets_department',
+    'ix_assets_location',
+    'ix_assets_updated_at',
+    'ix_audit_logs_timestamp_id',
+    'ix_audit_logs_table_record_action',
+    'ix_user_sessions_user_active',
+    'ix_user_sessions_active_last_activity',
+)
+
+# (table name, index name) of earlier versions of the indexes above
+SUPERSEDED_INDEXES = (
+    ('audit_logs', 'ix_audit_logs_timestamp'),
+)
+
+
+def query_indexes():
+    """Return the (table, Index) pairs managed by this migration (from the models)."""
+    by_name = {index.name: (table, index) for table in QUERY_INDEX_TABLES for index in table.indexes}
+    return [by_name[name] for name in QUERY_INDEX_NAMES]
+
+
+def drop_superseded_indexes(engine, inspector):
+    """Drop earlier versions of the query indexes that are still present"""
+    for table_name, index_name in SUPERSEDED_INDEXES:
+        existing = {ix['name'] for ix in inspector.get_indexes(table_name)}
+        if index_name not in existing:
+            continue
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f'DROP INDEX {index_name}')
+        print(f"✓ Dropped superseded {index_name}")
+
+
+def migrate_up(engine):
+    """Create any missing query indexes"""
+    inspector = inspect(engine)
+    drop_superseded_indexes(engine, inspector)
+    for table, index in query_indexes():
+        existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+        if index.name in existing:
+            print(f"✓ {index.name} already exists")
+            continue
+        index.create(bind=engine)
+        print(f"✓ Created {index.name} on {table.name}({', '.join(c.name for c in index.columns)})")
+
+    # Refresh planner statistics so the new indexes are considered
+    with engine.begin() as conn:
+        if engine.dialect.name == 'sqlite':
+            conn.exec_driver_sql('ANALYZE')
+        elif engine.dialect.name == 'postgresql':
+            for table in QUERY_INDEX_TABLES:
+                conn.exec_driver_sql(f'ANALYZE {table.name}')
+    print("✓ Updated planner statistics")
+
+
+def migrate_down(engine):
+    """Rollback: Drop the query indexes"""
+    inspector = inspect(engine)
+    for table, index in query_indexes():
+        existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+        if index.name not in existing:
+            print(f"✓ {index.name} does not exist")
+            continue
+        index.drop(bind=engine)
+        print(f"✓ Dropped {index.name}")
+    drop_superseded_indexes(engine, inspector)
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "up"
+    engine = create_engine(Config().DATABASE_URL, echo=False)
+
+    if action == "up":
+        print("Running migration: Add query indexes")
+        migrate_up(engine)
+    elif action == "down":
+        print("Running migration rollback: Drop query indexes")
+        migrate_down(engine)
+    else:
+        print(f"Unknown action: {action}")
+        sys.exit(1)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Migration: Backfill assets.created_at and make it NOT NULL
+
+created_at is the default keyset sort key of AssetService.query_assets. A
+NULL value compares as unknown in the keyset predicate, so assets with no
+created_at dropped out of every page after the first. Existing NULLs are
+filled from updated_at, falling back to the time of the migration.
+
+PostgreSQL also gets the NOT NULL constraint. SQLite cannot add a
+constraint to an existing column; there the backfill is all that runs and
+the application default keeps new rows populated.
+
+Usage:
+    python migrations/backfill_asset_created_at.py [up|down]
+"""
+
+import os
+import sys
+from datetime import datetime
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.config import Config
+
+
+def backfill_created_at(conn) -> int:
+    """Fill NULL assets.created_at values; return the number of rows updated."""
+    result = conn.execute(
+        text('UPDATE assets SET created_at = COALESCE(updated_at, :now) WHERE created_at IS NULL'),
+        {'now': datetime.utcnow()},
+    )
+    return result.rowcount
+
+
+def migrate_up(engine):
+    """Backfill created_at and add the NOT NULL constraint where supported"""
+    with engine.begin() as conn:
+        updated = backfill_created_at(conn)
+        print(f"✓ Backfilled created_at on {updated} asset(s)")
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text('ALTER TABLE assets ALTER COLUMN created_at SET NOT NULL'))
+            print("✓ assets.created_at is now NOT NULL")
+        else:
+            print(f"⚠ {engine.dialect.name} cannot add NOT NULL to an existing column; backfill only")
+
+
+def migrate_down(engine):
+    """Rollback: Drop the NOT NULL constraint (backfilled values are kept)"""
+    if engine.dialect.name != 'postgresql':
+        print("✓ Nothing to roll back")
+        return
+    with engine.begin() as conn:
+        conn.execute(text('ALTER TABLE assets ALTER COLUMN created_at DROP NOT NULL'))
+    print("✓ assets.created_at is nullable again")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "up"
+    engine = create_engine(Config().DATABASE_URL, echo=False)
+
+    if action == "up":
+        print("Running migration: Backfill assets.created_at")
+        migrate_up(engine)
+    elif action == "down":
+        print("Running migration rollback: Allow NULL assets.created_at")
+        migrate_down(engine)
+    else:
+        print(f"Unknown action: {action}")
+        sys.exit(1)
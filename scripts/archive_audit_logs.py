@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Archive old audit log records into monthly compressed files.
+
+Moves audit_logs rows older than --days (default: the
+audit_log_retention_days setting) into <dir>/audit-YYYY-MM.jsonl.gz and
+updates <dir>/index.json. Archived records stay readable through
+AuditService. The app runs the same job in the background on start-up,
+at most once a day.
+
+Usage:
+    python scripts/archive_audit_logs.py [--days 365] [--dir PATH] [--url URL]
+"""
+
+import argparse
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import database
+from app.core.config import Config
+from app.services.audit_archive import configure_audit_archive, run_scheduled_audit_archival
+from app.services.audit_service import AuditService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, help='archive records older than this many days')
+    parser.add_argument('--dir', help='archive directory (default: AUDIT_ARCHIVE_DIR)')
+    parser.add_argument('--url', help='database URL (default: DATABASE_URL)')
+    args = parser.parse_args()
+
+    config = Config()
+    database.init_db(args.url or config.DATABASE_URL)
+    archive = configure_audit_archive(args.dir)
+
+    count = run_scheduled_audit_archival(force=True, days=args.days)
+    # Write the AUDIT_ARCHIVED record before exiting
+    AuditService().flush()
+
+    print(f"✓ Archived {count} audit log records to {archive.directory}")
+    for month, entry in sorted(archive.index()['months'].items()):
+        print(f"  {month}: {entry['count']:>8} records  {entry['file']}")
+
+
+if __name__ == "__main__":
+    main()
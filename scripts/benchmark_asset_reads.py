@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark asset list reads: ORM hydration vs column projection.
+
+Seeds a throwaway SQLite database with N assets (default 100,000) and
+measures rows/sec for:
+  1. ORM:         session.query(Asset) + joinedload(category, subcategory)
+                  + AssetService._asset_to_dict (the pre-projection read path)
+  2. projection:  query_asset_rows + asset_row_to_dict (dicts, as returned by
+                  get_all_assets / query_assets)
+  3. rows:        AssetService.get_asset_rows (AssetRow namedtuples only)
+
+Usage:
+    python scripts/benchmark_asset_reads.py [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import joinedload
+
+from app.core import database
+from app.core.models import Asset, AssetCategory, AssetSubCategory, AssetStatus, DepreciationMethod
+from app.services.asset_projection import query_asset_rows, asset_row_to_dict
+from app.services.asset_service import AssetService
+
+
+def seed(count: int):
+    """Insert `count` assets spread over a few categories using executemany."""
+    with database.get_db() as session:
+        categories = [AssetCategory(name=f"Category {i}") for i in range(8)]
+        session.add_all(categories)
+        session.flush()
+        subcategories = [AssetSubCategory(name=f"Sub {c.id}", category_id=c.id) for c in categories]
+        session.add_all(subcategories)
+        session.flush()
+
+        now = datetime.utcnow()
+        rows = []
+        for i in range(count):
+            cat = categories[i % len(categories)]
+            sub = subcategories[i % len(subcategories)]
+            rows.append({
+                'asset_id': f"BENCH-{i:07d}",
+                'name': f"Asset {i}",
+                'description': "Benchmark asset",
+                'category_id': cat.id,
+                'subcategory_id': sub.id,
+                'acquisition_date': date(2015, 1, 1) + timedelta(days=i % 3000),
+                'expiry_date': date(2030, 12, 31),
+                'supplier': "Bench Supplier",
+                'quantity': 1,
+                'unit_cost': 1000.0 + i,
+                'total_cost': 1000.0 + i,
+                'useful_life': 5,
+                'depreciation_method': DepreciationMethod.STRAIGHT_LINE,
+                'accumulated_depreciation': 0.0,
+                'net_book_value': 1000.0 + i,
+                'location': f"Site {i % 20}",
+                'department': f"Dept {i % 10}",
+                'status': AssetStatus.AVAILABLE,
+                'created_at': now - timedelta(seconds=i),
+                'updated_at': now,
+            })
+        session.bulk_insert_mappings(Asset, rows)
+
+
+def read_orm(svc: AssetService):
+    with database.get_db() as session:
+        rows = (session.query(Asset)
+                .options(joinedload(Asset.category), joinedload(Asset.subcategory))
+                .order_by(Asset.created_at.desc())
+                .all())
+        return [svc._asset_to_dict(a) for a in rows]
+
+
+def read_projection(svc: AssetService):
+    with database.get_db() as session:
+        rows = query_asset_rows(session).order_by(Asset.created_at.desc()).all()
+        return [asset_row_to_dict(r) for r in rows]
+
+
+def read_rows(svc: AssetService):
+    return svc.get_asset_rows()
+
+
+def measure(label: str, fn, svc: AssetService, repeat: int):
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(fn(svc))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<12} {count:>9,} rows  {best:8.3f} s  {count / best:>12,.0f} rows/sec")
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000, help='number of assets to seed')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per variant (best time is reported)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_db(f"sqlite:///{os.path.join(tmp, 'bench.sqlite')}")
+        print(f"Seeding {args.rows:,} assets...")
+        seed(args.rows)
+        svc = AssetService()
+
+        orm = measure("ORM", read_orm, svc, args.repeat)
+        proj = measure("projection", read_projection, svc, args.repeat)
+        rows = measure("rows", read_rows, svc, args.repeat)
+        print(f"\nprojection speed-up: {proj / orm:.1f}x   rows speed-up: {rows / orm:.1f}x")
+        database._Session.remove()
+
+
+if __name__ == "__main__":
+    main()
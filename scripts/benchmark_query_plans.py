@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Benchmark hot queries with and without the query indexes.
+
+Seeds a throwaway SQLite database (or uses --url, which must point at a
+scratch database: indexes are dropped and re-created) with N assets and
+audit log / session rows, then runs the list, filter, summary, Recently
+Deleted, audit and session queries used by the services twice:
+
+  1. after migrations/add_query_indexes.py down (no secondary indexes)
+  2. after migrations/add_query_indexes.py up
+
+For every case it prints the best time of --repeat runs and the query plan
+(EXPLAIN QUERY PLAN on SQLite, EXPLAIN on PostgreSQL) of the SQL the
+service actually executed, so plan changes (SCAN -> SEARCH USING INDEX,
+Seq Scan -> Index Scan) are visible.
+
+Usage:
+    python scripts/benchmark_query_plans.py [--rows 100000] [--repeat 3] [--url URL]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Add the project root (and migrations) to the Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'migrations'))
+
+from sqlalchemy import event, insert
+
+from app.core import database
+from app.core.models import (
+    Asset, AssetCategory, AssetStatus, AuditLog, DepreciationMethod, Role, User, UserSession
+)
+from app.services.asset_service import AssetService
+from app.services.audit_service import AuditService
+
+STATUSES = [AssetStatus.AVAILABLE, AssetStatus.IN_USE, AssetStatus.MAINTENANCE,
+            AssetStatus.RETIRED, AssetStatus.DISPOSED]
+
+
+def seed(count: int):
+    """Insert `count` assets, 2 audit records per asset and some sessions."""
+    with database.get_db() as session:
+        categories = [AssetCategory(name=f"Category {i}") for i in range(20)]
+        session.add_all(categories)
+        role_id = session.query(Role.id).first()[0]
+        users = [User(name=f"User {i}", email=f"user{i}@example.com", password_hash="x", role_id=role_id)
+                 for i in range(50)]
+        session.add_all(users)
+        session.flush()
+
+        now = datetime.utcnow()
+        assets = []
+        for i in range(count):
+            # Most assets are active; a small share is retired/disposed
+            status = STATUSES[i % 3] if i % 50 else STATUSES[3 + (i // 50) % 2]
+            assets.append({
+                'asset_id': f"IDX-{i:07d}",
+                'name': f"Asset {i}",
+                'description': "Benchmark asset",
+                'category_id': categories[i % len(categories)].id,
+                'acquisition_date': date(2010, 1, 1) + timedelta(days=i % 5000),
+                'expiry_date': date(2024, 1, 1) + timedelta(days=i % 4000),
+                'supplier': "Bench Supplier",
+                'quantity': 1,
+                'unit_cost': 1000.0 + i,
+                'total_cost': 1000.0 + i,
+                'useful_life': 5,
+                'depreciation_method': DepreciationMethod.STRAIGHT_LINE,
+                'accumulated_depreciation': 0.0,
+                'net_book_value': 1000.0 + i,
+                'location': f"Site {i % 200}",
+                'department': f"Dept {i % 40}",
+                'status': status,
+                'created_at': now - timedelta(seconds=i),
+                'updated_at': now - timedelta(seconds=i % 10000),
+            })
+        session.execute(insert(Asset), assets)
+
+        actions = ['ASSET_CREATED', 'ASSET_UPDATED', 'ASSET_SOFT_DELETED', 'LOGIN']
+        logs = [{
+            'action': actions[i % len(actions)],
+            'table_name': 'assets' if i % 4 != 3 else 'users',
+            'record_id': str(i // 2 + 1),
+            'description': f"Benchmark audit record {i}",
+            'username': f"user{i % 50}",
+            'timestamp': now - timedelta(seconds=30 * i),
+        } for i in range(count * 2)]
+        session.execute(insert(AuditLog), logs)
+
+        sessions = [{
+            'user_id': users[i % len(users)].id,
+            'session_token': f"token-{i}",
+            'is_active': "Active" if i % 20 == 0 else "Expired",
+            'login_time': now - timedelta(minutes=i),
+            'last_activity': now - timedelta(minutes=i),
+        } for i in range(max(count // 10, 100))]
+        session.execute(insert(UserSession), sessions)
+
+
+def recently_deleted_assets():
+    with database.get_db() as session:
+        return (session.query(Asset)
+                .filter(Asset.status.in_([AssetStatus.RETIRED, AssetStatus.DISPOSED]))
+                .order_by(Asset.updated_at.desc())
+                .all())
+
+
+def deletion_reason(record_id: int):
+    with database.get_db() as session:
+        return session.query(AuditLog).filter(
+            AuditLog.table_name == 'assets',
+            AuditLog.record_id == str(record_id),
+            AuditLog.action.in_(['ASSET_SOFT_DELETED', 'ASSET_PERMANENTLY_DELETED'])
+        ).order_by(AuditLog.timestamp.desc()).first()
+
+
+def active_sessions(user_id: int):
+    with database.get_db() as session:
+        return session.query(UserSession).filter(
+            UserSession.user_id == user_id,
+            UserSession.is_active == "Active"
+        ).all()
+
+
+def cases(count: int):
+    svc = AssetService()
+    audit = AuditService()
+    return [
+        ("asset list, first page", lambda: svc.query_assets(limit=100)),
+        ("category page", lambda: svc.query_assets(
+            {'category_name': 'Category 7', 'include_retired': True}, limit=100)),
+        ("status filter", lambda: svc.query_assets({'status': 'In Use'}, limit=100)),
+        ("department filter", lambda: svc.query_assets({'department': 'Dept 13'}, limit=100)),
+        ("location filter", lambda: svc.query_assets({'location': 'Site 42'}, limit=100)),
+        ("acquisition range", lambda: svc.query_assets(
+            {'date_from': '2012-03-01', 'date_to': '2012-03-10'}, sort='acquisition_date', limit=100)),
+        ("expiry range", lambda: svc.query_assets(
+            {'expiry_from': '2025-01-01', 'expiry_to': '2025-01-05'}, limit=100)),
+        ("category summary", lambda: svc.get_asset_summary({'category_name': 'Category 7'})),
+        ("recently deleted", recently_deleted_assets),
+        ("deletion reason", lambda: deletion_reason(count // 3)),
+        ("recent activity", lambda: audit.get_recent_activity(hours=24, limit=10)),
+        ("user sessions", lambda: active_sessions(7)),
+    ]
+
+
+class StatementRecorder:
+    """Remembers the first SQL statement (and parameters) run by a case."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statement = None
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.statement is None:
+            self.statement = (statement, parameters)
+
+    def close(self):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def explain(engine, statement, parameters):
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == 'sqlite' else "EXPLAIN "
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+    if engine.dialect.name == 'sqlite':
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def run_cases(engine, count: int, repeat: int):
+    results = {}
+    for label, fn in cases(count):
+        recorder = StatementRecorder(engine)
+        try:
+            fn()
+        finally:
+            recorder.close()
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        plan = explain(engine, *recorder.statement) if recorder.statement else []
+        results[label] = (best, plan)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000, help='number of assets to seed')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case (best time is reported)')
+    parser.add_argument('--url', help='scratch database URL (default: temporary SQLite file)')
+    args = parser.parse_args()
+
+    import add_query_indexes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.init_db(args.url or f"sqlite:///{os.path.join(tmp, 'bench.sqlite')}")
+        engine = database.get_session_factory().bind
+        print(f"Seeding {args.rows:,} assets...")
+        seed(args.rows)
+
+        print("\nDropping query indexes...")
+        add_query_indexes.migrate_down(engine)
+        before = run_cases(engine, args.rows, args.repeat)
+        print("\nCreating query indexes...")
+        add_query_indexes.migrate_up(engine)
+        after = run_cases(engine, args.rows, args.repeat)
+
+        print(f"\n{'case':<24}{'no indexes':>12}{'indexed':>12}{'speed-up':>10}")
+        for label, (old_time, _) in before.items():
+            new_time = after[label][0]
+            print(f"{label:<24}{old_time * 1000:>10.2f}ms{new_time * 1000:>10.2f}ms{old_time / new_time:>9.1f}x")
+
+        print("\nQuery plans (before -> after):")
+        for label, (_, old_plan) in before.items():
+            print(f"\n{label}")
+            for line in old_plan:
+                print(f"  - {line}")
+            for line in after[label][1]:
+                print(f"  + {line}")
+        database._Session.remove()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark XLSX report exports: regular openpyxl Workbook vs write-only.
+
+Writes N synthetic "All Assets Report" rows (12 columns) with:
+  1. workbook:    export_xlsx building a regular Workbook in memory, cell
+                  by cell (the pre-streaming path; forced for every size)
+  2. write-only:  export_xlsx_stream fed from a generator, with named styles
+                  (what the Reports screen uses)
+
+Each run happens in a fresh child process so its peak RSS can be reported.
+The in-memory workbook is skipped above --workbook-limit rows, since at 1M
+rows it needs several GB and many minutes.
+
+Usage:
+    python scripts/benchmark_xlsx_export.py [--rows 100000 1000000] [--workbook-limit 100000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import export_method
+
+STATUSES = ("Available", "In Use", "Under Maintenance", "Retired")
+
+
+def generate_rows(count: int):
+    """Yield `count` rows shaped like report_rows.all_assets_rows output."""
+    start = date(2015, 1, 1)
+    for i in range(count):
+        yield {
+            'Asset ID': f"BENCH-{i:07d}",
+            'Name': f"Asset {i}",
+            'Model Number': f"M-{i % 500}",
+            'Serial Number': f"SN{i:09d}",
+            'Category': f"Category {i % 8}",
+            'Department': f"Dept {i % 10}",
+            'Acquisition Date': (start + timedelta(days=i % 3000)).strftime('%Y-%m-%d'),
+            'Total Cost': 1000.0 + i,
+            'Useful Life (Years)': 5,
+            'Remaining Life (Years)': i % 6,
+            'Depreciation %': round((i % 100) * 1.01, 2),
+            'Status': STATUSES[i % len(STATUSES)],
+        }
+
+
+def run_workbook(count: int, path: str):
+    export_method.XLSX_WRITE_ONLY_THRESHOLD = float('inf')
+    export_method.export_xlsx(list(generate_rows(count)), path, "All Assets Report")
+
+
+def run_write_only(count: int, path: str):
+    export_method.export_xlsx_stream(generate_rows(count), path, "All Assets Report")
+
+
+VARIANTS = {'workbook': run_workbook, 'write-only': run_write_only}
+
+
+def _child(variant: str, count: int, path: str, results):
+    start = time.perf_counter()
+    VARIANTS[variant](count, path)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is reported in kilobytes on Linux
+    results.put((elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+def measure(variant: str, count: int, tmp: str):
+    path = os.path.join(tmp, f"{variant}-{count}.xlsx")
+    results = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_child, args=(variant, count, path, results))
+    proc.start()
+    elapsed, peak_mb = results.get()
+    proc.join()
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    os.remove(path)
+    print(f"{variant:<11} {count:>10,} rows  {elapsed:8.2f} s  {count / elapsed:>10,.0f} rows/sec  "
+          f"peak RSS {peak_mb:8.1f} MB  file {size_mb:6.1f} MB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000],
+                        help='row counts to export')
+    parser.add_argument('--workbook-limit', type=int, default=100_000,
+                        help='largest row count to run through the in-memory workbook')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.rows:
+            baseline = measure('workbook', count, tmp) if count <= args.workbook_limit else None
+            streamed = measure('write-only', count, tmp)
+            if baseline:
+                print(f"  write-only speed-up: {baseline / streamed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Load-test the assets API with concurrent clients.
+
+Seeds a throwaway SQLite database with N assets, serves app.api.main with
+uvicorn in a child process and drives it with C concurrent clients for a
+fixed time, cycling through a mix of requests (asset pages, search,
+single asset, health check). It reports throughput and latency
+percentiles for:
+  1. inline:    service calls made directly from the async routes, which
+                block the event loop (the behaviour before the API thread
+                pool; emulated by running AsyncService calls inline)
+  2. pooled:    service calls awaited on the bounded API thread pool
+
+--db-latency adds a fixed delay to every SQL statement in the server, to
+stand in for the network round trip to a remote database server (the
+default deployment talks to PostgreSQL over the network; the local SQLite
+file answers in microseconds and mostly measures Python CPU time).
+
+Usage:
+    python scripts/load_test_api.py [--rows 20000] [--clients 32] [--duration 10] [--db-latency 5]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from app.core import database
+from app.core import models  # noqa: F401  (registers tables before init_db)
+from scripts.benchmark_asset_reads import seed
+
+REQUESTS = (
+    "/assets/?limit=100",
+    "/assets/search?q=Asset&limit=20",
+    "/assets/?limit=20&department=Dept%203",
+    "/assets/BENCH-0000042",
+    "/health",
+)
+
+
+def serve(db_url: str, port: int, mode: str, db_latency: float):
+    """Run the API in this (child) process."""
+    import uvicorn
+    from sqlalchemy import event
+
+    database.init_db(db_url)
+    if db_latency:
+        event.listen(database.get_session_factory().bind, "before_cursor_execute",
+                     lambda *args: time.sleep(db_latency))
+    from app.api import concurrency
+    from app.api.endpoints import assets as assets_endpoint
+    from app.api.main import app
+
+    if mode == "inline":
+        async def run_inline(fn, *args, **kwargs):
+            return fn(*args, **kwargs)
+        concurrency.run_sync = run_inline
+        assets_endpoint.run_sync = run_inline
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_until_up(base_url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("API server did not start")
+
+
+async def drive(base_url: str, clients: int, duration: float):
+    latencies = {path: [] for path in REQUESTS}
+    errors = 0
+    stop_at = time.monotonic() + duration
+
+    async def client_loop(offset: int, client: httpx.AsyncClient):
+        nonlocal errors
+        i = offset
+        while time.monotonic() < stop_at:
+            path = REQUESTS[i % len(REQUESTS)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies[path].append(time.perf_counter() - start)
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        await asyncio.gather(*(client_loop(n, client) for n in range(clients)))
+    return latencies, errors
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(mode: str, db_url: str, clients: int, duration: float, db_latency: float):
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(db_url, port, mode, db_latency), daemon=True)
+    server.start()
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        asyncio.run(wait_until_up(base_url))
+        latencies, errors = asyncio.run(drive(base_url, clients, duration))
+    finally:
+        server.terminate()
+        server.join()
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"\n{mode}: {total:,} requests in {duration:.0f} s = {total / duration:,.1f} req/s, {errors} errors")
+    for path, values in latencies.items():
+        if values:
+            print(f"  {path:<34} n={len(values):>6,}  p50 {percentile(values, 50) * 1000:8.1f} ms  "
+                  f"p95 {percentile(values, 95) * 1000:8.1f} ms  mean {statistics.mean(values) * 1000:8.1f} ms")
+    return total / duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20_000, help='number of assets to seed')
+    parser.add_argument('--clients', type=int, default=32, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per mode')
+    parser.add_argument('--db-latency', type=float, default=0,
+                        help='milliseconds added to every SQL statement (emulated network round trip)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{os.path.join(tmp, 'load.sqlite')}"
+        database.init_db(db_url)
+        print(f"Seeding {args.rows:,} assets...")
+        seed(args.rows)
+        database._Session.remove()
+
+        latency = args.db_latency / 1000
+        inline = run("inline", db_url, args.clients, args.duration, latency)
+        pooled = run("pooled", db_url, args.clients, args.duration, latency)
+        print(f"\npooled / inline throughput: {pooled / inline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+# add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core import database
+from app.core import models  # noqa: F401  (registers tables before init_db)
+from app.services import audit_archive
+from app.services.audit_writer import flush_audit_writer
+
+
+@pytest.fixture
+def isolated_db(tmp_path):
+    """Point the application at a fresh SQLite file for one test.
+
+    The previously configured session factory is restored afterwards so
+    tests that initialise the shared tests/test_db.sqlite at import time
+    keep working regardless of test order. Audit archives go to a
+    temporary directory as well.
+    """
+    previous = database._Session
+    previous_archive = audit_archive._archive
+    database.init_db(f"sqlite:///{tmp_path / 'test.sqlite'}")
+    audit_archive.configure_audit_archive(tmp_path / 'audit_archive')
+    try:
+        yield database
+    finally:
+        # Queued audit records must land in this test's database
+        flush_audit_writer()
+        try:
+            database._Session.remove()
+        except Exception:
+            pass
+        database._Session = previous
+        audit_archive._archive = previous_archive
+
+
+class StatementRecorder(list):
+    """The SQL statements executed inside ``with recorder:`` blocks.
+
+    Entering a block clears the statements recorded so far.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.recording = False
+
+    def on_execute(self, conn, cursor, statement, *args):
+        if self.recording:
+            self.append(statement)
+
+    def __enter__(self):
+        self.clear()
+        self.recording = True
+        return self
+
+    def __exit__(self, *exc):
+        self.recording = False
+
+
+@pytest.fixture
+def sql_statements(isolated_db):
+    """Record the SQL sent to the isolated database (see StatementRecorder)."""
+    recorder = StatementRecorder()
+    engine = isolated_db.get_session_factory().bind
+    event.listen(engine, "before_cursor_execute", recorder.on_execute)
+    try:
+        yield recorder
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder.on_execute)
@@ -0,0 +1,64 @@
+import asyncio
+from datetime import date
+
+import httpx
+
+from app.api.main import app
+from app.core.models import Asset, AssetCategory, AssetStatus, AuditLog
+from app.services.audit_service import AuditService
+from app.services.settings_service import SettingsService
+
+
+def _send(*requests):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.request(method, path, json=body) for method, path, body in requests]
+    return asyncio.run(scenario())
+
+
+def _seed(database):
+    with database.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        assets = [Asset(asset_id=f"B-{i}", name=f"Desk {i}", description="Desk", category_id=cat.id,
+                        acquisition_date=date(2023, 1, 1), supplier="S", unit_cost=10, total_cost=10,
+                        net_book_value=10, location="HQ",
+                        status=AssetStatus.IN_USE if i == 0 else AssetStatus.AVAILABLE)
+                  for i in range(3)]
+        session.add_all(assets)
+        session.flush()
+        return [a.id for a in assets]
+
+
+def test_bulk_update_and_delete_endpoints(isolated_db):
+    ids = _seed(isolated_db)
+    SettingsService().set_setting("CRUD_RESTRICTIONS", "allow_bulk_operations", "true", updated_by_id=None)
+
+    updated, null_location, bad_date, deleted = _send(
+        ("PATCH", "/assets/bulk", {"ids": ids, "changes": {"acquisition_date": "2024-01-01",
+                                                           "total_cost": "12.5", "quantity": 4}}),
+        ("PATCH", "/assets/bulk", {"ids": ids, "changes": {"location": None}}),
+        ("PATCH", "/assets/bulk", {"ids": ids, "changes": {"acquisition_date": "soon"}}),
+        ("POST", "/assets/bulk/delete", {"ids": ids[:2], "reason": "Replaced"}),
+    )
+
+    assert updated.status_code == 200 and updated.json()["count"] == 3
+    assert null_location.status_code == 400
+    assert null_location.json()["detail"] == "Field cannot be empty: location"
+    assert bad_date.status_code == 400 and "acquisition_date" in bad_date.json()["detail"]
+    assert "SQL" not in null_location.text + bad_date.text
+
+    # Asset 0 is in use and is skipped; the API runs as its service identity
+    assert deleted.status_code == 200, deleted.text
+    assert deleted.json()["count"] == 1 and len(deleted.json()["errors"]) == 1
+
+    AuditService().flush()
+    with isolated_db.get_db() as session:
+        rows = {a.id: a for a in session.query(Asset)}
+        assert rows[ids[2]].acquisition_date == date(2024, 1, 1)
+        assert rows[ids[2]].net_book_value == 12.5 and rows[ids[2]].quantity == 4
+        assert rows[ids[1]].status == AssetStatus.RETIRED and rows[ids[2]].location == "HQ"
+        log = session.query(AuditLog).filter(AuditLog.action == "ASSET_SOFT_DELETED").one()
+        assert log.username == "API" and log.description.endswith("Reason: Replaced")
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from app.api import concurrency
+from app.api.endpoints import assets as assets_endpoint
+from app.api.main import app
+
+
+def test_slow_service_calls_do_not_block_the_event_loop(isolated_db, monkeypatch):
+    threads = set()
+
+    def slow_search(q, limit=50):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.3)
+        return []
+
+    monkeypatch.setattr(assets_endpoint.asset_service, "search_assets", slow_search)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            start = time.perf_counter()
+            searches = [asyncio.create_task(client.get("/assets/search", params={"q": "x"}))
+                        for _ in range(4)]
+            await asyncio.sleep(0.05)
+            health = await client.get("/health")
+            health_latency = time.perf_counter() - start
+            responses = await asyncio.gather(*searches)
+            return health, health_latency, responses, time.perf_counter() - start
+
+    health, health_latency, responses, elapsed = asyncio.run(scenario())
+    assert health.status_code == 200 and health_latency < 0.25
+    assert [r.status_code for r in responses] == [200] * 4
+    # The four searches ran side by side on the API pool, not one after another
+    assert elapsed < 0.9
+    assert threads and all(name.startswith("api-worker") for name in threads)
+    concurrency.shutdown_api_executor()
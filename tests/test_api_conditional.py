@@ -0,0 +1,68 @@
+import asyncio
+from datetime import date
+
+import httpx
+
+from app.api.endpoints import assets as assets_endpoint
+from app.api.main import app
+from app.core.models import Asset, AssetCategory
+from app.services.asset_service import AssetService
+
+
+def _get(*requests):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.get(path, headers=headers) for path, headers in requests]
+    return asyncio.run(scenario())
+
+
+def test_conditional_get_and_statistics_cache(isolated_db, monkeypatch):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        session.add_all([
+            Asset(asset_id=f"A-{i:03}", name=f"Asset {i}", description="d", category_id=cat.id,
+                  acquisition_date=date(2020, 1, 1), supplier="S", unit_cost=10, total_cost=10,
+                  net_book_value=10, location="HQ")
+            for i in range(5)
+        ])
+
+    computed = []
+    by_status = AssetService.get_assets_by_status
+    monkeypatch.setattr(assets_endpoint.asset_service, "get_assets_by_status",
+                        lambda: computed.append(1) or by_status(assets_endpoint.asset_service))
+
+    listing, stats, categories = _get(("/assets/", {}), ("/assets/statistics", {}), ("/assets/categories", {}))
+    assert stats.status_code == 200 and stats.json()["by_status"] == {"Available": 5}
+    assert categories.status_code == 200 and categories.json()[0]["name"] == "IT"
+    assert listing.headers["Last-Modified"].endswith("GMT")
+
+    etags = {name: r.headers["ETag"] for name, r in
+             (("/assets/", listing), ("/assets/statistics", stats), ("/assets/categories", categories))}
+    repeat = _get(*[(path, {"If-None-Match": etag}) for path, etag in etags.items()])
+    assert [r.status_code for r in repeat] == [304, 304, 304]
+    assert repeat[0].content == b"" and repeat[0].headers["ETag"] == etags["/assets/"]
+
+    # Other filters are another representation; unconditional reads hit the cache
+    other, stats_again = _get(("/assets/?limit=2", {"If-None-Match": etags["/assets/"]}), ("/assets/statistics", {}))
+    assert other.status_code == 200 and stats_again.json() == stats.json()
+    assert len(computed) == 1
+
+    asset_id = listing.json()[0]["id"]
+    assert AssetService().update_asset(asset_id, {"location": "Annex"})["success"]
+    after = _get(*[(path, {"If-None-Match": etag}) for path, etag in etags.items()])
+    assert [r.status_code for r in after] == [200, 200, 200]
+    assert after[0].json()[0]["location"] == "Annex"
+    assert len(computed) == 2
+
+    # Renaming a category changes the listing's category_name and /categories
+    etags = {name: r.headers["ETag"] for name, r in
+             (("/assets/", after[0]), ("/assets/categories", after[2]))}
+    with isolated_db.get_db() as session:
+        session.query(AssetCategory).one().name = "Computers"
+    renamed = _get(*[(path, {"If-None-Match": etag}) for path, etag in etags.items()])
+    assert [r.status_code for r in renamed] == [200, 200]
+    assert renamed[0].json()[0]["category_name"] == "Computers"
+    assert renamed[1].json()[0]["name"] == "Computers"
@@ -0,0 +1,55 @@
+import asyncio
+import json
+from datetime import date
+
+import httpx
+from app.api.endpoints import assets as assets_endpoint
+from app.api.main import app
+from app.core.models import Asset, AssetCategory
+
+
+def _send(*requests):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.request(method, path, params=params, json=body)
+                    for method, path, params, body in requests]
+    return asyncio.run(scenario())
+
+
+def test_sparse_fieldsets_and_batch_get(isolated_db, sql_statements, monkeypatch):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        session.add_all([
+            Asset(asset_id=f"A-{i:03}", name=f"Asset {i}", description="d", category_id=cat.id,
+                  acquisition_date=date(2020, 1, 1), supplier="S", unit_cost=10 + i, total_cost=10 + i,
+                  net_book_value=10, location="HQ")
+            for i in range(5)
+        ])
+
+    with sql_statements:
+        page, = _send(("GET", "/assets/", {"fields": "asset_id,total_cost", "sort": "asset_id", "limit": 2}, None))
+    assert page.json() == [{"asset_id": "A-000", "total_cost": 10.0}, {"asset_id": "A-001", "total_cost": 11.0}]
+    assert "X-Next-Cursor" in page.headers and "ETag" in page.headers
+    listing_sql = next(s for s in sql_statements if "assets.total_cost" in s)
+    assert "asset_categories" not in listing_sql and "assets.description" not in listing_sql
+
+    nxt, stream, batch, sparse_batch, bad_field, too_many = _send(
+        ("GET", "/assets/", {"fields": "name", "sort": "asset_id", "limit": 2,
+                             "cursor": page.headers["X-Next-Cursor"]}, None),
+        ("GET", "/assets/stream", {"fields": "asset_id,category_name", "sort": "asset_id"}, None),
+        ("POST", "/assets/batch-get", None, {"asset_ids": ["A-003", "nope", "A-001", "A-003"]}),
+        ("POST", "/assets/batch-get", None, {"asset_ids": ["A-004"], "fields": ["name"]}),
+        ("GET", "/assets/", {"fields": "colour"}, None),
+        ("POST", "/assets/batch-get", None, {"asset_ids": ["x"] * (assets_endpoint.ASSET_BATCH_GET_LIMIT + 1)}),
+    )
+    assert nxt.json() == [{"name": "Asset 2"}, {"name": "Asset 3"}]
+    assert json.loads(stream.text.splitlines()[0]) == {"asset_id": "A-000", "category_name": "IT"}
+    body = batch.json()
+    assert [a["asset_id"] for a in body["items"]] == ["A-003", "A-001"] and body["missing"] == ["nope"]
+    assert body["items"][0]["category_name"] == "IT" and len(body["items"][0]) == 28
+    assert sparse_batch.json() == {"items": [{"asset_id": "A-004", "name": "Asset 4"}], "missing": []}
+    assert bad_field.status_code == 400 and "colour" in bad_field.json()["detail"]
+    assert too_many.status_code == 400
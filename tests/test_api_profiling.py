@@ -0,0 +1,45 @@
+import asyncio
+import re
+
+import httpx
+
+from app.api.main import app
+from app.api.profiling import MetricsRegistry, RequestTiming, metrics_registry
+
+
+def _get(*paths):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.get(path) for path in paths]
+    return asyncio.run(scenario())
+
+
+def test_server_timing_header_and_metrics_endpoint(isolated_db):
+    metrics_registry.reset()
+    listing, health, metrics = _get("/assets/?limit=5", "/health", "/admin/metrics")
+
+    timing = listing.headers["Server-Timing"]
+    queries = int(re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', timing).group(1))
+    assert queries >= 1
+    assert "serialize;dur=" in timing and "total;dur=" in timing
+    assert 'desc="0 queries"' in health.headers["Server-Timing"]
+
+    assert metrics.headers["content-type"].startswith("text/plain")
+    text = metrics.text
+    assert 'api_request_duration_seconds_count{method="GET",route="/assets/"} 1' in text
+    assert 'api_request_duration_seconds{method="GET",route="/health",quantile="0.99"}' in text
+    assert f'api_request_db_queries_total{{method="GET",route="/assets/"}} {queries}' in text
+
+
+def test_metrics_registry_quantiles():
+    registry = MetricsRegistry(sample_size=100)
+    timing = RequestTiming()
+    timing.queries = 2
+    for ms in range(1, 201):
+        registry.observe("GET", "/assets/", ms / 1000, timing)
+
+    stats = registry.snapshot()[("GET", "/assets/")]
+    assert stats["count"] == 200 and stats["queries"] == 400
+    # Percentiles cover the most recent sample_size requests (101..200 ms)
+    assert stats["quantiles"] == {0.5: 0.151, 0.95: 0.195, 0.99: 0.199}
@@ -0,0 +1,49 @@
+import asyncio
+import json
+from datetime import date
+
+import httpx
+
+from app.api.main import app
+from app.api.streaming import ndjson_chunks
+from app.api.utils import ASSET_RESPONSE_FIELDS
+from app.core.models import Asset, AssetCategory
+
+
+def _get(*requests):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.get(path, params=params) for path, params in requests]
+    return asyncio.run(scenario())
+
+
+def test_assets_stream_as_ndjson(isolated_db):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        session.add_all([
+            Asset(asset_id=f"A-{i:03}", name=f"Asset {i}", description="d", category_id=cat.id,
+                  acquisition_date=date(2020, 1, 1), supplier="S", unit_cost=10, total_cost=10,
+                  net_book_value=10, location="HQ", department="IT" if i % 3 else "Finance")
+            for i in range(30)
+        ])
+
+    streamed, page, finance, bad = _get(
+        ("/assets/stream", {"sort": "asset_id"}),
+        ("/assets/", {"sort": "asset_id", "limit": 1000}),
+        ("/assets/stream", {"department": "Finance"}),
+        ("/assets/stream", {"sort": "colour"}),
+    )
+    assert streamed.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in streamed.text.splitlines()]
+    assert [r["asset_id"] for r in rows] == [r["asset_id"] for r in page.json()]
+    assert tuple(rows[0]) == ASSET_RESPONSE_FIELDS and rows[0]["category_name"] == "IT"
+    assert len(finance.text.splitlines()) == 10
+    assert bad.status_code == 400
+
+
+def test_ndjson_chunks():
+    chunks = list(ndjson_chunks(({'n': i, 'x': 'y'} for i in range(5)), fields=('n',), chunk_rows=2))
+    assert chunks == [b'{"n":0}\n{"n":1}\n', b'{"n":2}\n{"n":3}\n', b'{"n":4}\n']
@@ -0,0 +1,62 @@
+from datetime import date
+
+from app.core.models import Asset, AssetCategory, AssetStatus, AuditLog
+from app.services import asset_service as asset_service_module
+from app.services.asset_service import AssetService
+from app.services.audit_service import AuditService, set_global_audit_user
+from app.services.settings_service import SettingsService
+
+
+def _seed(database, count):
+    with database.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        assets = [Asset(asset_id=f"A-{i:03}", name=f"Chair {i}", description="Chair", category_id=cat.id,
+                        acquisition_date=date(2023, 1, 1), supplier="S", unit_cost=10, total_cost=10,
+                        accumulated_depreciation=2, net_book_value=8, location="HQ",
+                        status=AssetStatus.IN_USE if i == 0 else AssetStatus.AVAILABLE)
+                  for i in range(count)]
+        session.add_all(assets)
+        session.flush()
+        return [a.id for a in assets]
+
+
+def test_bulk_update_and_soft_delete_are_set_based(isolated_db, sql_statements, monkeypatch):
+    monkeypatch.setattr(asset_service_module, "BULK_CHUNK_SIZE", 10)
+    ids = _seed(isolated_db, 25)
+    service = AssetService()
+    assert service.bulk_update_assets(ids, {'location': 'Annex'})['success'] is False
+
+    SettingsService().set_setting("CRUD_RESTRICTIONS", "allow_bulk_operations", "true", updated_by_id=None)
+    service.set_current_user(0, 'admin')
+    try:
+        with sql_statements:
+            result = service.bulk_update_assets(ids + [9999], {'location': 'Annex', 'total_cost': 20})
+
+        assert result['updated_count'] == 25
+        assert result['errors'] == ["Asset 9999: Asset not found"]
+        # One UPDATE per chunk of ids and a single audit INSERT, not a session per asset
+        assert sum(s.startswith("UPDATE assets") for s in sql_statements) == 3
+        assert sum(s.startswith("INSERT INTO audit_logs") for s in sql_statements) == 1
+
+        with isolated_db.get_db() as session:
+            assert {(a.location, a.net_book_value) for a in session.query(Asset)} == {('Annex', 18.0)}
+
+        logs = AuditService().get_audit_logs(filters={'action': 'ASSET_UPDATED'})
+        assert len(logs) == 25
+        assert logs[0]['old_values'] == {'location': 'HQ', 'total_cost': 10.0, 'net_book_value': 8.0}
+        assert logs[0]['new_values']['net_book_value'] == 18.0
+
+        assert "Unknown field" in service.bulk_update_assets(ids, {'colour': 'red'})['message']
+        assert service.bulk_update_assets(ids, {'asset_id': 'X'})['success'] is False
+
+        result = service.bulk_soft_delete_assets(ids, reason="Office closed")
+        assert result['deleted_count'] == 24
+        assert result['errors'] == [f"Asset {ids[0]}: Cannot delete assets that are currently in use"]
+        with isolated_db.get_db() as session:
+            assert session.query(Asset).filter(Asset.status == AssetStatus.RETIRED).count() == 24
+            retired = session.query(AuditLog).filter(AuditLog.action == 'ASSET_SOFT_DELETED').all()
+            assert len(retired) == 24 and "Reason: Office closed" in retired[0].description
+    finally:
+        set_global_audit_user(None, None)
@@ -0,0 +1,50 @@
+from datetime import date
+
+from sqlalchemy.orm import joinedload
+
+from app.core.models import Asset, AssetCategory, AssetSubCategory, AssetStatus, DepreciationMethod
+from app.services.asset_projection import AssetRow, asset_row_to_dict
+from app.services.asset_service import AssetService
+
+
+def test_projection_matches_orm_conversion(isolated_db):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="Vehicles")
+        session.add(cat)
+        session.flush()
+        sub = AssetSubCategory(name="Trucks", category_id=cat.id)
+        session.add(sub)
+        session.flush()
+        session.add_all([
+            Asset(asset_id="PRJ-1", name="Truck", description="Delivery truck",
+                  category_id=cat.id, subcategory_id=sub.id,
+                  acquisition_date=date(2022, 5, 1), expiry_date=date(2027, 12, 31),
+                  supplier="Motors", quantity=1, unit_cost=5000, total_cost=5000,
+                  useful_life=5, depreciation_method=DepreciationMethod.STRAIGHT_LINE,
+                  accumulated_depreciation=1000, net_book_value=4000, location="Depot",
+                  status=AssetStatus.IN_USE, asset_tag="TAG-1", model_number="M1"),
+            # No subcategory / optional fields left empty
+            Asset(asset_id="PRJ-2", name="Van", description="Van", category_id=cat.id,
+                  acquisition_date=date(2023, 1, 1), supplier="Motors",
+                  unit_cost=300, total_cost=300, net_book_value=300, location="Depot"),
+        ])
+
+    svc = AssetService()
+    with isolated_db.get_db() as session:
+        expected = {
+            a.asset_id: svc._asset_to_dict(a)
+            for a in session.query(Asset).options(
+                joinedload(Asset.category), joinedload(Asset.subcategory)
+            )
+        }
+
+    page = svc.query_assets(limit=None)
+    assert {a["asset_id"]: a for a in page["items"]} == expected
+
+    rows = svc.get_asset_rows(sort="asset_id")
+    assert all(isinstance(r, AssetRow) for r in rows)
+    assert rows[0].category_name == "Vehicles" and rows[0].subcategory_name == "Trucks"
+    assert rows[1].subcategory_name is None
+    assert asset_row_to_dict(rows[0]) == expected["PRJ-1"]
+
+    assert svc.get_asset_by_asset_id("PRJ-1") == expected["PRJ-1"]
@@ -0,0 +1,88 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core.models import Asset, AssetCategory, AssetStatus
+from app.services.asset_service import ASSET_SORT_KEYS, AssetService
+
+
+def _seed_assets(db, count=25):
+    """Insert `count` assets split across two categories with distinct timestamps."""
+    base = datetime(2024, 1, 1)
+    with db.get_db() as session:
+        it = AssetCategory(name="IT Equipment")
+        furniture = AssetCategory(name="Furniture")
+        session.add_all([it, furniture])
+        session.flush()
+        for i in range(count):
+            session.add(Asset(
+                asset_id=f"QA-{i:03d}",
+                name=f"Asset {i:03d}",
+                description="query test asset",
+                category_id=it.id if i % 2 == 0 else furniture.id,
+                acquisition_date=date(2020, 1, 1) + timedelta(days=30 * i),
+                supplier="UnitTest",
+                unit_cost=100.0 + i,
+                total_cost=100.0 + i,
+                net_book_value=100.0 + i,
+                location="HQ" if i < 10 else "Branch",
+                department="Finance",
+                status=AssetStatus.RETIRED if i == 24 else AssetStatus.AVAILABLE,
+                # Several assets share a timestamp to exercise the id tie-breaker
+                created_at=base + timedelta(hours=i // 3),
+            ))
+
+
+def test_keyset_pages_cover_all_rows_once(isolated_db):
+    _seed_assets(isolated_db)
+    svc = AssetService()
+
+    seen = []
+    cursor = None
+    while True:
+        page = svc.query_assets(limit=7, cursor=cursor)
+        seen.extend(a["asset_id"] for a in page["items"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            assert cursor is None
+            break
+
+    # 24 active assets (QA-024 is retired), newest first, no duplicates
+    assert len(seen) == 24
+    assert len(set(seen)) == 24
+    assert seen == [a["asset_id"] for a in svc.get_all_assets()]
+
+
+def test_filters_and_sort_are_pushed_down(isolated_db):
+    _seed_assets(isolated_db)
+    svc = AssetService()
+
+    it_assets = svc.query_assets(filters={"category_name": "IT Equipment"}, limit=None)["items"]
+    assert it_assets and all(a["category_name"] == "IT Equipment" for a in it_assets)
+
+    hq = svc.query_assets(filters={"location": "HQ"}, sort="total_cost", limit=None)["items"]
+    assert [a["asset_id"] for a in hq] == [f"QA-{i:03d}" for i in range(10)]
+
+    ranged = svc.query_assets(
+        filters={"date_from": "2020-01-15", "date_to": date(2020, 3, 31)}, limit=None
+    )["items"]
+    assert sorted(a["asset_id"] for a in ranged) == ["QA-001", "QA-002", "QA-003"]
+
+    retired = svc.query_assets(filters={"status": "Retired"}, limit=None)["items"]
+    assert [a["asset_id"] for a in retired] == ["QA-024"]
+
+    assert len(svc.get_all_assets(skip=20, limit=10)) == 4
+
+
+def test_invalid_sort_and_cursor_are_rejected(isolated_db):
+    svc = AssetService()
+    with pytest.raises(ValueError):
+        svc.query_assets(sort="remarks")
+    with pytest.raises(ValueError):
+        svc.query_assets(cursor="not-a-cursor")
+
+
+def test_sort_keys_are_not_nullable():
+    # A NULL sort value would drop the row out of the keyset predicate
+    nullable = [key for key, column in ASSET_SORT_KEYS.items() if column.nullable]
+    assert nullable == []
@@ -0,0 +1,87 @@
+from datetime import date
+
+from app.core.fulltext import drop_fulltext_indexes, ensure_fulltext_indexes
+from app.core.models import Asset, AssetCategory
+from app.services.asset_service import AssetService
+
+
+def _asset(asset_id, category_id, name, description="", **kw):
+    return Asset(asset_id=asset_id, name=name, description=description, category_id=category_id,
+                 acquisition_date=date(2023, 1, 1), supplier="S", unit_cost=10, total_cost=10,
+                 net_book_value=10, location=kw.pop('location', "HQ"), **kw)
+
+
+def _seed(database):
+    with database.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        session.add_all([
+            _asset("LT-001", cat.id, "Dell Latitude laptop", asset_tag="TAG-9"),
+            _asset("LT-002", cat.id, "Lenovo ThinkPad", "Spare laptop for visitors"),
+            _asset("CH-020", cat.id, "Office chair"),
+            _asset("CH-021", cat.id, "Office chair", location="Annex"),
+            _asset("CH-102", cat.id, "Meeting chair"),
+        ])
+
+
+def test_prefix_search_is_ranked_and_uses_index(isolated_db, sql_statements):
+    _seed(isolated_db)
+    service = AssetService()
+
+    with sql_statements:
+        results = service.search_assets("lapt")
+    # The name match outranks the description-only match
+    assert [r['asset_id'] for r in results] == ["LT-001", "LT-002"]
+    assert any("assets_fts MATCH" in s for s in sql_statements)
+    assert not any("LIKE" in s for s in sql_statements)
+
+    assert sorted(r['asset_id'] for r in service.search_assets("CH-02")) == ["CH-020", "CH-021"]
+    assert [r['asset_id'] for r in service.search_assets("chair annex")] == ["CH-021"]
+    assert [r['asset_id'] for r in service.search_assets("tag-9")] == ["LT-001"]
+    assert len(service.search_assets("chair", limit=2)) == 2
+    assert service.search_assets('"') == []
+
+
+def test_index_follows_updates_and_deletes(isolated_db):
+    _seed(isolated_db)
+    service = AssetService()
+    with isolated_db.get_db() as session:
+        chair = session.query(Asset).filter(Asset.asset_id == "CH-020").one()
+        chair.name = "Standing desk"
+        session.delete(session.query(Asset).filter(Asset.asset_id == "LT-002").one())
+
+    assert [r['asset_id'] for r in service.search_assets("standing")] == ["CH-020"]
+    assert "CH-020" not in [r['asset_id'] for r in service.search_assets("office")]
+    assert service.search_assets("thinkpad") == []
+
+
+def test_like_fallback_and_rebuild(isolated_db):
+    _seed(isolated_db)
+    engine = isolated_db.get_session_factory().bind
+    service = AssetService()
+
+    drop_fulltext_indexes(engine)
+    assert [r['asset_id'] for r in service.search_assets("CH-1")] == ["CH-102"]
+
+    # Re-creating the index indexes existing rows
+    assert ensure_fulltext_indexes(engine)
+    assert [r['asset_id'] for r in service.search_assets("meeting")] == ["CH-102"]
+
+
+def test_query_assets_search_filter_uses_index(isolated_db, sql_statements):
+    _seed(isolated_db)
+    service = AssetService()
+
+    with sql_statements:
+        page = service.query_assets(filters={"search": "CH-02"}, limit=None)
+    assert sorted(a['asset_id'] for a in page['items']) == ["CH-020", "CH-021"]
+    assert any("assets_fts MATCH" in s for s in sql_statements)
+    assert not any("lower(assets." in s for s in sql_statements)
+
+    # Category names still match, as a prefix
+    assert len(service.query_assets(filters={"search": "it"}, limit=None)['items']) == 5
+
+    drop_fulltext_indexes(isolated_db.get_session_factory().bind)
+    page = service.query_assets(filters={"search": "H-1"}, limit=None)
+    assert [a['asset_id'] for a in page['items']] == ["CH-102"]
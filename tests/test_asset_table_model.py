@@ -0,0 +1,74 @@
+import os
+from datetime import date, timedelta
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+from PySide6.QtCore import QModelIndex, Qt
+
+from app.core.models import Asset, AssetCategory, AssetStatus
+from app.gui.views.asset_table_model import AssetTableModel
+from app.services.asset_service import AssetService
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _seed(db, count):
+    today = date.today()
+    with db.get_db() as session:
+        cat = AssetCategory(name="Laptops")
+        session.add(cat)
+        session.flush()
+        session.add_all([
+            Asset(asset_id=f"LT-{i:04d}", name=f"Laptop {i:04d}", description="model test",
+                  category_id=cat.id, acquisition_date=date(2022, 1, 1), supplier="S",
+                  unit_cost=100.0 + i, total_cost=100.0 + i, net_book_value=100.0 + i,
+                  location="HQ" if i % 2 else "", department="Finance",
+                  expiry_date=today - timedelta(days=1) if i < 3 else today + timedelta(days=10 if i < 5 else 400),
+                  status=AssetStatus.IN_USE)
+            for i in range(count)
+        ])
+
+
+def test_model_pages_rows_in_on_demand(isolated_db, qapp):
+    _seed(isolated_db, 250)
+    model = AssetTableModel(AssetService(), page_size=100)
+    model.set_query(None, "asset_id")
+
+    assert model.rowCount() == 100
+    assert model.canFetchMore(QModelIndex())
+    model.fetchMore(QModelIndex())
+    model.fetchMore(QModelIndex())
+    assert model.rowCount() == 250
+    assert not model.canFetchMore(QModelIndex())
+
+    first = model.index(0, 0)
+    assert model.data(first) == "LT-0000"
+    assert model.data(first, Qt.UserRole) == model.asset_at(0).id
+    assert model.data(model.index(0, 4)) == "Finance"
+    assert model.data(model.index(1, 4)) == "HQ"
+    assert model.data(model.index(0, 5)) == "Laptops"
+    assert model.data(model.index(0, 8)) == "₦100.00"
+    assert model.data(model.index(0, 9)) == "In Use"
+
+    model.sort(8, Qt.DescendingOrder)
+    assert model.rowCount() == 100
+    assert model.data(model.index(0, 0)) == "LT-0249"
+
+    model.set_search("lt-012")
+    assert model.rowCount() == 10
+    assert not model.canFetchMore(QModelIndex())
+
+
+def test_summary_is_aggregated_in_sql(isolated_db):
+    _seed(isolated_db, 12)
+    summary = AssetService().get_asset_summary({'category_name': "Laptops"})
+    assert summary['total'] == 12
+    assert summary['total_value'] == pytest.approx(sum(100.0 + i for i in range(12)))
+    assert summary['highest_name'] == "Laptop 0011"
+    assert summary['expired'] == 3
+    assert summary['expiring_soon'] == 2
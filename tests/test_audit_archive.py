@@ -0,0 +1,131 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app.core.models import AuditLog
+from app.services.audit_archive import get_audit_archive, run_scheduled_audit_archival
+from app.services.audit_service import AuditService
+
+
+def _seed(database):
+    """40 records from Jan-Feb 2023 plus 10 recent ones."""
+    old = datetime(2023, 1, 20, 9, 0)
+    now = datetime.utcnow()
+    rows = [{
+        'action': 'LOGIN_FAILED' if i % 10 == 0 else 'ASSET_UPDATED',
+        'table_name': 'assets',
+        'record_id': str(i),
+        'description': f"Old change {i}",
+        'new_values': json.dumps({'n': i}),
+        'username': 'bob',
+        'timestamp': old + timedelta(days=i),
+    } for i in range(40)]
+    rows += [{
+        'action': 'ASSET_UPDATED',
+        'table_name': 'assets',
+        'record_id': str(100 + i),
+        'description': f"Recent change {i}",
+        'username': 'bob',
+        'timestamp': now - timedelta(hours=i),
+    } for i in range(10)]
+    with database.get_db() as session:
+        session.execute(insert(AuditLog), rows)
+
+
+def test_archive_moves_old_records_into_monthly_files(isolated_db):
+    _seed(isolated_db)
+    service = AuditService()
+    before = service.get_audit_logs(limit=100)
+
+    archive = get_audit_archive()
+    assert archive.archive(datetime(2024, 1, 1), batch_size=15) == 40
+    with isolated_db.get_db() as session:
+        assert session.query(AuditLog).count() == 10
+
+    months = archive.index()['months']
+    assert sorted(months) == ['2023-01', '2023-02']
+    assert months['2023-01']['count'] + months['2023-02']['count'] == 40
+    assert months['2023-01']['actions']['LOGIN_FAILED'] == 2
+    with gzip.open(archive.directory / months['2023-02']['file'], 'rt') as f:
+        assert len(f.readlines()) == months['2023-02']['count']
+
+    # Open-ended reads stay in the table and never open a month file
+    archive._months.clear()
+    assert len(service.get_audit_logs(limit=100)) == 10
+    assert service.get_audit_logs(filters={'action': 'LOGIN_FAILED'}) == []
+    page = service.query_audit_logs({'search': 'change'}, limit=20)
+    assert len(page['items']) == 10 and not page['has_more']
+    assert not archive._months
+
+    # With include_archived, reads continue from the table into the archive
+    archived = {'include_archived': True}
+    after = service.get_audit_logs(limit=100, filters=archived)
+    assert [log['id'] for log in after] == [log['id'] for log in before]
+    assert after[-1]['new_values'] == {'n': 0} and after[-1]['archived'] is True
+
+    seen, cursor = [], None
+    while True:
+        page = service.query_audit_logs(archived, limit=7, cursor=cursor)
+        seen += [log['id'] for log in page['items']]
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert seen == [log['id'] for log in before]
+
+    assert [log['id'] for log in service.get_audit_logs(limit=5, offset=12, filters=archived)] == \
+        [log['id'] for log in before[12:17]]
+    failed = service.get_audit_logs(filters={'action': 'LOGIN_FAILED', **archived})
+    assert [log['record_id'] for log in failed] == ['30', '20', '10', '0']
+    # A date range reaching back past the archive horizon reads it as well
+    failed = service.get_audit_logs(filters={'action': 'LOGIN_FAILED', 'date_from': datetime(2023, 2, 1)})
+    assert [log['record_id'] for log in failed] == ['30', '20']
+    # Archived records match search terms as word prefixes, like the index
+    assert [log['record_id'] for log in service.get_audit_logs(filters={'search': 'change 3', **archived})] == \
+        ['103'] + [str(i) for i in range(39, 29, -1)] + ['3']
+    assert len(service.get_table_changes('assets', '3')) == 0
+    assert len(service.get_table_changes('assets', '3', include_archived=True)) == 1
+
+    stats = service.get_audit_statistics()
+    assert stats['archived_logs'] == 40
+    assert stats['total_logs'] == 50
+
+
+def test_interrupted_archive_run_is_not_duplicated(isolated_db):
+    _seed(isolated_db)
+    archive = get_audit_archive()
+    archive.archive(datetime(2023, 2, 1))
+    january = archive.index()['months']['2023-01']['count']
+
+    # Simulate a run that wrote a record but died before deleting it
+    record = AuditService().get_audit_logs(filters={'date_to': datetime(2023, 1, 25)})[0]
+    with isolated_db.get_db() as session:
+        session.add(AuditLog(id=record['id'], action=record['action'], table_name='assets',
+                             record_id=record['record_id'], description=record['description'],
+                             username='bob', timestamp=datetime.fromisoformat(record['timestamp'])))
+
+    # The leftover row leaves the table but is not written twice
+    assert archive.archive(datetime(2024, 1, 1)) == 29
+    assert archive.index()['months']['2023-01']['count'] == january
+    assert archive.total_count() == 40
+    assert len(archive.read()) == 40
+
+
+def test_scheduled_archival_uses_retention_setting_once_a_day(isolated_db):
+    _seed(isolated_db)
+    assert run_scheduled_audit_archival() == 40
+    assert run_scheduled_audit_archival() == 0
+    archived = AuditService().get_audit_logs(filters={'action': 'AUDIT_ARCHIVED'})
+    assert len(archived) == 1 and "40 audit logs older than 365 days" in archived[0]['description']
+
+
+def test_deletion_records_are_not_archived(isolated_db):
+    _seed(isolated_db)
+    with isolated_db.get_db() as session:
+        session.add(AuditLog(action='ASSET_SOFT_DELETED', table_name='assets', record_id='7',
+                             description="Broken beyond repair", timestamp=datetime(2023, 1, 2)))
+    assert get_audit_archive().archive(datetime(2024, 1, 1)) == 40
+    with isolated_db.get_db() as session:
+        kept = session.query(AuditLog).filter(AuditLog.action == 'ASSET_SOFT_DELETED').one()
+        assert kept.description == "Broken beyond repair"
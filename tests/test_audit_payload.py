@@ -0,0 +1,77 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.core.models import AuditLog, AssetCategory
+from app.services.asset_service import AssetService
+from app.services.audit_payload import (
+    COMPRESSED_PREFIX, decode_values, diff_values, encode_values, reconstruct_history
+)
+from app.services.audit_service import AuditService, set_global_audit_user
+
+
+def test_change_sets_are_typed_and_compressed():
+    old = {'id': 7, 'name': 'Laptop', 'location': 'HQ', 'remarks': None, 'updated_at': 1}
+    new = dict(old, location='Annex', remarks='Moved', updated_at=2)
+    assert diff_values(old, new, keep=('id', 'name'), ignore=('updated_at',)) == \
+        ({'location': 'HQ'}, {'location': 'Annex', 'remarks': 'Moved', 'id': 7, 'name': 'Laptop'})
+    assert diff_values(old, dict(old)) == (None, None)
+
+    values = {'acquired': date(2023, 1, 31), 'at': datetime(2023, 1, 31, 8, 30),
+              'cost': Decimal('10.50'), 'name': 'Laptop'}
+    assert decode_values(encode_values(values)) == values
+
+    large = {f'field_{i}': 'x' * 20 for i in range(50)}
+    encoded = encode_values(large)
+    assert encoded.startswith(COMPRESSED_PREFIX) and len(encoded) < len(json.dumps(large)) / 4
+    assert decode_values(encoded) == large
+
+    # Records written before change-sets still read back
+    assert decode_values(json.dumps({'name': 'Laptop'})) == {'name': 'Laptop'}
+
+
+def test_asset_audit_logs_change_sets_and_history_is_reconstructed(isolated_db):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="IT")
+        session.add(cat)
+        session.flush()
+        category_id = cat.id
+
+    service = AssetService()
+    service.set_current_user(0, 'admin')
+    try:
+        created = service.create_asset({
+            'asset_id': 'LT-001', 'name': 'Laptop', 'description': 'Dell', 'category_id': category_id,
+            'acquisition_date': date(2023, 1, 1), 'supplier': 'S', 'quantity': 1, 'unit_cost': 900,
+            'total_cost': 900, 'net_book_value': 900, 'location': 'HQ', 'useful_life': 4,
+        })
+        assert created['success'], created
+        asset_id = created['asset']['id']
+        assert service.update_asset(asset_id, {'location': 'Annex'})['success']
+        assert service.delete_asset(asset_id, reason='Broken')['success']
+        assert service.restore_asset(asset_id)['success']
+    finally:
+        set_global_audit_user(None, None)
+
+    logs = AuditService().get_audit_logs(filters={'table_name': 'assets', 'record_id': asset_id})
+    by_action = {log['action']: log for log in logs}
+    update = by_action['ASSET_UPDATED']
+    assert update['old_values'] == {'location': 'HQ'}
+    assert update['new_values'] == {'location': 'Annex', 'id': asset_id, 'asset_id': 'LT-001', 'name': 'Laptop'}
+    assert by_action['ASSET_SOFT_DELETED']['new_values']['status'] == 'Retired'
+    assert by_action['ASSET_CREATED']['new_values']['acquisition_date'] == '2023-01-01'
+    assert isinstance(by_action['ASSET_CREATED']['new_values']['created_at'], datetime)
+
+    # Each change-set is a fraction of a full snapshot
+    with isolated_db.get_db() as session:
+        row = session.query(AuditLog).filter(AuditLog.action == 'ASSET_UPDATED').one()
+        assert len(row.old_values) + len(row.new_values) < 120
+
+    history = reconstruct_history(logs)
+    assert [entry['action'] for entry in history] == \
+        ['ASSET_CREATED', 'ASSET_UPDATED', 'ASSET_SOFT_DELETED', 'ASSET_RESTORED']
+    assert history[0]['before'] is None
+    assert history[1]['before']['location'] == 'HQ' and history[1]['after']['location'] == 'Annex'
+    assert history[1]['after']['description'] == 'Dell'
+    assert history[2]['before']['status'] == 'Available' and history[2]['after']['status'] == 'Retired'
+    assert history[3]['after'] == dict(history[2]['after'], status='Available')
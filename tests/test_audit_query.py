@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.core.fulltext import drop_fulltext_indexes
+from app.core.models import AuditLog
+from app.services.audit_service import AuditService
+
+
+def _seed(database, count=25):
+    now = datetime(2024, 6, 1, 12, 0)
+    with database.get_db() as session:
+        session.execute(insert(AuditLog), [{
+            'action': 'ASSET_UPDATED' if i % 2 else 'LOGIN_SUCCESS',
+            'table_name': 'assets' if i % 2 else 'users',
+            'record_id': str(i),
+            'description': f"Updated laptop LT-{i:03d}" if i % 2 else f"User alice{i} logged in",
+            'username': 'bob' if i % 3 else 'carol',
+            # Pairs of records share a timestamp so the id tie-breaker matters
+            'timestamp': now - timedelta(minutes=i // 2),
+        } for i in range(count)])
+
+
+def test_keyset_pages_cover_log_without_offset(isolated_db, sql_statements):
+    _seed(isolated_db)
+    service = AuditService()
+    expected = [log['id'] for log in service.get_audit_logs(limit=100)]
+
+    with sql_statements:
+        seen, cursor = [], None
+        while True:
+            page = service.query_audit_logs(limit=10, cursor=cursor)
+            seen += [log['id'] for log in page['items']]
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+
+    assert seen == expected and len(seen) == 25
+    # Later pages seek past the previous (timestamp, id) instead of skipping rows
+    assert sum("audit_logs.timestamp < ?" in s for s in sql_statements) == 2
+    assert page['has_more'] is False
+
+    with pytest.raises(ValueError):
+        service.query_audit_logs(cursor="not-a-cursor")
+
+
+def test_search_uses_fulltext_index(isolated_db, sql_statements):
+    _seed(isolated_db)
+    service = AuditService()
+
+    with sql_statements:
+        page = service.query_audit_logs({'search': 'lapt LT-01'}, limit=3)
+    assert [log['record_id'] for log in page['items']] == ['11', '13', '15']
+    assert any("audit_logs_fts MATCH" in s for s in sql_statements)
+
+    rest = service.query_audit_logs({'search': 'lapt LT-01'}, limit=3, cursor=page['next_cursor'])
+    assert [log['record_id'] for log in rest['items']] == ['17', '19']
+    assert len(service.get_audit_logs(filters={'search': 'carol', 'table_name': 'users'})) == 5
+
+    # Same results through the LIKE fallback
+    drop_fulltext_indexes(isolated_db.get_session_factory().bind)
+    assert len(service.get_audit_logs(filters={'search': 'carol', 'table_name': 'users'})) == 5
@@ -0,0 +1,60 @@
+import time
+from datetime import datetime
+
+from app.core.models import AuditLog
+from app.services.audit_service import AuditService
+from app.services.audit_writer import AuditLogWriter, get_audit_writer
+
+
+def _count_logs(db, action):
+    with db.get_db() as session:
+        return session.query(AuditLog).filter(AuditLog.action == action).count()
+
+
+def test_log_action_is_queued_and_flushed_in_batches(isolated_db):
+    svc = AuditService()
+    svc.set_current_user(0, "System Admin")
+    writer = get_audit_writer()
+    written_before = writer.written_count
+
+    for i in range(250):
+        assert svc.log_action(
+            action="BULK_TEST",
+            description=f"record {i}",
+            table_name="assets",
+            record_id=i,
+            new_values={"n": i},
+        ) is True
+
+    assert svc.flush() is True
+    assert _count_logs(isolated_db, "BULK_TEST") == 250
+    assert writer.written_count - written_before == 250
+
+    # Readers flush implicitly, so they see records logged just before
+    svc.log_action(action="READ_YOUR_WRITES", description="latest")
+    logs = svc.get_audit_logs(limit=1)
+    assert logs[0]["action"] == "READ_YOUR_WRITES"
+    assert logs[0]["username"] == "System Admin" and logs[0]["user_id"] is None
+
+
+def test_writer_flushes_on_size_and_time_thresholds(isolated_db):
+    writer = AuditLogWriter(batch_size=5, flush_interval=0.05)
+    try:
+        record = {"action": "THRESHOLD_TEST", "description": "x"}
+        for _ in range(5):
+            writer.submit(dict(record, timestamp=datetime.utcnow()))
+        # Size threshold reached: written without an explicit flush
+        deadline = time.time() + 5
+        while writer.written_count < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        assert writer.written_count == 5
+
+        writer.submit(dict(record, timestamp=datetime.utcnow()))
+        deadline = time.time() + 5
+        while writer.written_count < 6 and time.time() < deadline:
+            time.sleep(0.01)
+        assert writer.written_count == 6
+        assert _count_logs(isolated_db, "THRESHOLD_TEST") == 6
+    finally:
+        assert writer.shutdown() is True
+    assert not writer.is_running()
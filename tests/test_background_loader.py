@@ -0,0 +1,93 @@
+import os
+import threading
+from datetime import date
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+import shiboken6
+from PySide6.QtCore import QObject
+
+from app.core.models import Asset, AssetCategory
+from app.gui.views.asset_table_model import AssetTableModel
+from app.gui.workers import BackgroundLoader, get_loader_pool
+from app.services.asset_service import AssetService
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_result_is_delivered_on_gui_thread(qapp):
+    loader = BackgroundLoader()
+    seen = {}
+    loader.start(lambda x: (x * 2, threading.get_ident()), 21,
+                 on_result=lambda value: seen.update(value=value, thread=threading.get_ident()))
+    assert loader.wait(5000)
+    value, worker_thread = seen["value"]
+    assert value == 42
+    assert worker_thread != threading.get_ident()
+    assert seen["thread"] == threading.get_ident()
+    assert not loader.is_loading()
+
+    errors = []
+    loader.start(lambda: 1 / 0, on_result=lambda v: pytest.fail("no result expected"),
+                 on_error=errors.append)
+    loader.wait(5000)
+    assert errors and "division" in errors[0]
+
+
+def test_stale_loads_are_discarded(qapp):
+    loader = BackgroundLoader()
+    release = threading.Event()
+    results = []
+
+    def slow(value):
+        release.wait(5)
+        return value
+
+    loader.start(slow, "stale", on_result=results.append)
+    loader.start(slow, "fresh", on_result=results.append)
+    release.set()
+    loader.wait(5000)
+    assert results == ["fresh"]
+
+    # Destroying the owning widget cancels what is still pending
+    owner = QObject()
+    owned = BackgroundLoader(owner)
+    release.clear()
+    owned.start(slow, "orphan", on_result=results.append)
+    shiboken6.delete(owner)
+    release.set()
+    get_loader_pool().waitForDone(5000)
+    QtWidgets.QApplication.processEvents()
+    assert results == ["fresh"]
+
+
+def test_model_pages_load_in_background(isolated_db, qapp):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="Chairs")
+        session.add(cat)
+        session.flush()
+        session.add_all([
+            Asset(asset_id=f"CH-{i:03d}", name=f"Chair {i}", description="", category_id=cat.id,
+                  acquisition_date=date(2023, 1, 1), supplier="S", unit_cost=10, total_cost=10,
+                  net_book_value=10, location="HQ")
+            for i in range(30)
+        ])
+
+    loader = BackgroundLoader()
+    model = AssetTableModel(AssetService(), page_size=20, loader=loader)
+    model.set_query({'category_name': "Chairs"}, "asset_id")
+    assert model.is_loading() and model.rowCount() == 0
+    loader.wait(5000)
+    assert model.rowCount() == 20
+
+    # Changing the query while a page is loading drops that page
+    model.fetchMore()
+    model.set_search("CH-02")
+    loader.wait(5000)
+    assert [model.asset_at(i).asset_id for i in range(model.rowCount())] == [f"CH-02{i}" for i in range(10)]
+    assert not model.canFetchMore()
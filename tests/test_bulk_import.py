@@ -0,0 +1,72 @@
+import json
+from datetime import date, datetime
+
+from app.core.models import Asset, AssetCategory, AssetStatus, AuditLog, DepreciationMethod
+from app.services.audit_writer import flush_audit_writer
+from app.services.bulk_import_service import BulkImportService
+
+
+def _record(asset_id, category_id, **extra):
+    record = {
+        'asset_id': asset_id,
+        'name': f"Imported {asset_id}",
+        'description': "bulk import test",
+        'category_id': category_id,
+        'acquisition_date': datetime(2023, 4, 1),
+        'supplier': "Not Specified",
+        'location': "HQ",
+        'total_cost': 500.0,
+        'unit_cost': 500.0,
+    }
+    record.update(extra)
+    return record
+
+
+def test_import_resolves_collisions_and_audits_per_chunk(isolated_db):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="Imported Assets")
+        session.add(cat)
+        session.flush()
+        cat_id = cat.id
+        session.add_all([
+            Asset(asset_id=aid, name=aid, description="existing", category_id=cat_id,
+                  acquisition_date=date(2020, 1, 1), supplier="S", unit_cost=1,
+                  total_cost=1, net_book_value=1, location="HQ")
+            for aid in ("IMP-1", "IMP-1-1")
+        ])
+
+    records = [
+        _record("IMP-1", cat_id, status="In Use", depreciation_method="Straight Line"),
+        _record("IMP-2", cat_id, status="not a status"),
+        _record("IMP-2", cat_id),             # duplicate within the same chunk
+        _record("IMP-3", cat_id, supplier=None),   # fails validation
+        _record("IMP-2", cat_id),             # duplicate across chunks
+    ]
+    progress = []
+    svc = BulkImportService(chunk_size=3)
+    result = svc.import_assets(records, progress_callback=lambda *args: progress.append(args),
+                               source="assets.xlsx")
+
+    assert result["success"]
+    assert result["imported"] == 4
+    assert [(f["index"], f["asset_id"]) for f in result["failed_rows"]] == [(3, "IMP-3")]
+    assert progress == [(3, 3, 0), (5, 4, 1)]
+
+    with isolated_db.get_db() as session:
+        imported = {a.asset_id: a for a in session.query(Asset).filter(Asset.description == "bulk import test")}
+        assert sorted(imported) == ["IMP-1-2", "IMP-2", "IMP-2-1", "IMP-2-2"]
+        first = imported["IMP-1-2"]
+        assert first.status == AssetStatus.IN_USE
+        assert first.depreciation_method == DepreciationMethod.STRAIGHT_LINE
+        assert first.acquisition_date == date(2023, 4, 1)
+        assert first.net_book_value == 500.0
+        assert first.quantity == 1 and first.created_at is not None
+        assert imported["IMP-2"].status == AssetStatus.AVAILABLE
+
+    flush_audit_writer()
+    with isolated_db.get_db() as session:
+        logs = session.query(AuditLog).filter(AuditLog.action == "ASSETS_IMPORTED").order_by(AuditLog.id).all()
+        summaries = [json.loads(log.new_values) for log in logs]
+        assert [s["count"] for s in summaries] == [3, 1]
+        assert summaries[0]["asset_ids"] == ["IMP-1-2", "IMP-2", "IMP-2-1"]
+        assert "assets.xlsx" in logs[0].description
@@ -0,0 +1,49 @@
+from datetime import date
+
+from app.core.models import Asset, AssetCategory, AssetStatus
+from app.services.audit_service import AuditService
+from app.services.dashboard_snapshot import DashboardSnapshot, invalidate_dashboard_snapshot
+
+
+def _asset(asset_id, category_id, cost, status=AssetStatus.AVAILABLE):
+    return Asset(asset_id=asset_id, name=asset_id, description="", category_id=category_id,
+                 acquisition_date=date(2023, 1, 1), supplier="S", unit_cost=cost, total_cost=cost,
+                 accumulated_depreciation=cost / 10, net_book_value=cost, location="HQ", status=status)
+
+
+def test_snapshot_aggregates_and_recomputes_on_version_change(isolated_db, sql_statements):
+    invalidate_dashboard_snapshot()
+    with isolated_db.get_db() as session:
+        desks, phones = AssetCategory(name="Desks"), AssetCategory(name="Phones")
+        session.add_all([desks, phones, AssetCategory(name="Empty")])
+        session.flush()
+        session.add_all([
+            _asset("D-1", desks.id, 100.0),
+            _asset("D-2", desks.id, 300.0, AssetStatus.IN_USE),
+            _asset("P-1", phones.id, 50.0, AssetStatus.RETIRED),
+        ])
+    audit = AuditService()
+    audit.log_action("ASSET_CREATED", "Created D-1", table_name="assets", record_id="1")
+
+    snapshot = DashboardSnapshot(audit)
+    data = snapshot.get()
+    assert data['total_assets'] == 2
+    assert data['total_value'] == 400.0
+    assert data['total_categories'] == 3
+    assert data['by_category']['Desks'] == {
+        'count': 2, 'total_value': 400.0, 'total_depreciation': 40.0, 'net_book_value': 360.0}
+    assert data['by_category']['Empty']['count'] == 0
+    assert data['by_status'] == {'Available': 1, 'In Use': 1, 'Retired': 1}
+    assert [log['description'] for log in data['recent_activity']] == ["Created D-1"]
+
+    with sql_statements:
+        again = DashboardSnapshot(audit).get()
+    # Unchanged data: only the version stamp is queried
+    assert len(sql_statements) == 1
+    assert again['version'] == data['version']
+
+    with isolated_db.get_db() as session:
+        session.query(Asset).filter(Asset.asset_id == "D-1").one().total_cost = 150.0
+    changed = snapshot.get()
+    assert changed['total_value'] == 450.0
+    assert changed['recent_activity'] == data['recent_activity']
@@ -0,0 +1,109 @@
+import random
+from datetime import date
+
+import pytest
+
+from app.core.models import Asset, AssetCategory, AssetStatus, AuditLog
+from app.services.depreciation_calculator import DepreciationCalculator
+from app.services.depreciation_engine import (
+    STOP_REASONS, compute_year_end_depreciation, compute_year_end_expiry_years
+)
+from app.services.expiry_calculator import ExpiryCalculator
+from app.services.year_end_service import YearEndService
+
+
+def test_engine_matches_per_asset_calculator():
+    rng = random.Random(7)
+    cases = []
+    for _ in range(2000):
+        cost = rng.choice([1000.0, 2500.0, 80000.0, 123456.78])
+        residual = cost * rng.choice([0.0, 0.1, 0.25])
+        life = rng.randint(1, 10)
+        applied = rng.randint(0, life + 1)
+        # Some assets already at (or below) their residual value
+        nbv = rng.choice([cost, residual, residual + (cost - residual) * rng.random()])
+        cases.append((cost, residual, life, date(2020, rng.randint(1, 12), 15), applied, nbv))
+
+    result = compute_year_end_depreciation(
+        cost=[c[0] for c in cases],
+        residual_value=[c[1] for c in cases],
+        useful_life=[c[2] for c in cases],
+        purchase_month=[c[3].month for c in cases],
+        years_applied=[c[4] for c in cases],
+        net_book_value=[c[5] for c in cases],
+    )
+
+    for i, (cost, residual, life, purchased, applied, nbv) in enumerate(cases):
+        expected = DepreciationCalculator.calculate_depreciation_for_year(
+            cost, residual, life, purchased, applied, nbv
+        )
+        assert result['depreciation'][i] == pytest.approx(max(expected['depreciation_to_apply'], 0.0))
+        assert result['accumulated_depreciation'][i] == pytest.approx(expected['new_accumulated_depreciation'])
+        assert result['net_book_value'][i] == pytest.approx(expected['new_net_book_value'])
+        if expected['reason']:
+            assert STOP_REASONS[int(result['stop_code'][i])] == expected['reason']
+
+
+def test_engine_expiry_matches_calculator():
+    evaluation = date(2025, 12, 31)
+    acquired = [date(2019, 3, 1), date(2024, 12, 31), date(2025, 6, 1), date(2010, 1, 1)]
+    lives = [10, 4, 3, 5]
+    years = compute_year_end_expiry_years([d.year for d in acquired], lives, evaluation)
+    for acq, life, year in zip(acquired, lives, years):
+        assert date(int(year), 12, 31) == ExpiryCalculator.calculate_expiry_date_aligned_to_year_end(
+            acq, life, evaluation
+        )
+
+
+def test_year_end_service_bulk_updates_assets(isolated_db):
+    with isolated_db.get_db() as session:
+        cat = AssetCategory(name="Equipment")
+        session.add(cat)
+        session.flush()
+        common = dict(description="year end", category_id=cat.id, supplier="S", location="HQ")
+        session.add_all([
+            # First year, bought in October: 3 months of (500k - 50k) / 5
+            Asset(asset_id="YE-1", name="Generator", acquisition_date=date(2025, 10, 15),
+                  unit_cost=500000, total_cost=500000, net_book_value=500000,
+                  salvage_value=50000, useful_life=5, status=AssetStatus.IN_USE, **common),
+            # No salvage recorded: defaults to 10% and is persisted
+            Asset(asset_id="YE-2", name="Laptop", acquisition_date=date(2023, 1, 10),
+                  unit_cost=1000, total_cost=1000, net_book_value=700,
+                  useful_life=3, depreciation_years_applied=2, **common),
+            # Useful life already completed
+            Asset(asset_id="YE-3", name="Desk", acquisition_date=date(2015, 1, 1),
+                  unit_cost=200, total_cost=200, net_book_value=20, salvage_value=20,
+                  useful_life=5, depreciation_years_applied=5, **common),
+            # Retired assets are not processed
+            Asset(asset_id="YE-4", name="Old van", acquisition_date=date(2020, 1, 1),
+                  unit_cost=900, total_cost=900, net_book_value=900, useful_life=5,
+                  status=AssetStatus.RETIRED, **common),
+        ])
+        session.flush()
+        # Legacy rows can have NULL salvage despite the column default
+        session.query(Asset).filter(Asset.asset_id == "YE-2").update({Asset.salvage_value: None})
+
+    result = YearEndService().process_year_end_depreciation(processing_date=date(2025, 12, 31))
+    assert result["success"], result
+    assert result["processed_count"] == 3
+    by_id = {a["asset_id"]: a for a in result["updated_assets"]}
+    assert by_id["YE-1"]["depreciation_applied"] == pytest.approx(22500.0)
+    assert by_id["YE-3"]["stopped"] and by_id["YE-3"]["stop_reason"] == "Useful life completed"
+
+    with isolated_db.get_db() as session:
+        assets = {a.asset_id: a for a in session.query(Asset)}
+        assert assets["YE-1"].net_book_value == pytest.approx(477500.0)
+        assert assets["YE-1"].depreciation_years_applied == 1
+        assert assets["YE-1"].expiry_date == date(2029, 12, 31)
+        # Full year: (1000 - 100) / 3 = 300
+        assert assets["YE-2"].salvage_value == pytest.approx(100.0)
+        assert assets["YE-2"].net_book_value == pytest.approx(400.0)
+        assert assets["YE-2"].depreciation_years_applied == 3
+        assert assets["YE-3"].net_book_value == 20
+        assert assets["YE-4"].net_book_value == 900
+        # Written in the depreciation transaction; stopped assets get no record
+        logs = session.query(AuditLog).filter(AuditLog.action == 'YEAR_END_DEPRECIATION').all()
+        assert sorted(log.record_id for log in logs) == sorted(
+            str(assets[key].id) for key in ("YE-1", "YE-2"))
+
+    assert not YearEndService().process_year_end_depreciation(processing_date=date(2025, 6, 30))["success"]
@@ -0,0 +1,98 @@
+import itertools
+
+import pytest
+
+from app.core.models import DepreciationMethod
+from app.services.depreciation_engine import calculate_depreciation_arrays
+
+
+def _loop_reference(method, total_cost, useful_life, current_year=1, salvage_value=0):
+    """The original year-by-year implementation, kept to validate the closed forms."""
+    if useful_life <= 0 or total_cost <= 0:
+        return 0.0, 0.0, float(total_cost)
+    if current_year > useful_life:
+        return 0.0, float(total_cost - salvage_value), float(salvage_value)
+
+    if method == DepreciationMethod.STRAIGHT_LINE:
+        annual = (total_cost - salvage_value) / useful_life
+        accumulated = annual * (current_year - 1)
+        book_value = total_cost - accumulated
+    elif method == DepreciationMethod.DECLINING_BALANCE:
+        if salvage_value > 0:
+            rate = 1 - (salvage_value / total_cost) ** (1 / useful_life)
+        else:
+            rate = 1 - (0.1 / total_cost) ** (1 / useful_life)
+        book_value, accumulated = total_cost, 0.0
+        for _ in range(1, current_year):
+            dep = book_value * rate
+            accumulated += dep
+            book_value -= dep
+        annual = book_value * rate
+        if book_value - annual < salvage_value:
+            annual = max(0, book_value - salvage_value)
+    elif method == DepreciationMethod.DOUBLE_DECLINING:
+        rate = 2.0 / useful_life
+        book_value, accumulated = total_cost, 0.0
+        for _ in range(1, current_year):
+            dep = book_value * rate
+            if book_value - dep < salvage_value:
+                dep = max(0, book_value - salvage_value)
+            accumulated += dep
+            book_value -= dep
+        annual = book_value * rate
+        if book_value - annual < salvage_value:
+            annual = max(0, book_value - salvage_value)
+    else:
+        sum_of_years = useful_life * (useful_life + 1) / 2.0
+        depreciable = total_cost - salvage_value
+        accumulated = 0.0
+        for year in range(1, current_year):
+            accumulated += depreciable * (useful_life - (year - 1)) / sum_of_years
+        annual = depreciable * (useful_life - (current_year - 1)) / sum_of_years
+        book_value = total_cost - accumulated
+    return float(annual), float(accumulated), float(book_value)
+
+
+CASES = [
+    (method, cost, life, year, salvage)
+    for method, cost, life, salvage_rate in itertools.product(
+        list(DepreciationMethod), [0.0, 1500.0, 250000.0], [0, 1, 2, 5, 13, 40], [0.0, 0.1, 0.5, 1.2]
+    )
+    for salvage in [cost * salvage_rate]
+    for year in range(1, life + 3)
+]
+
+
+@pytest.mark.parametrize("method", list(DepreciationMethod))
+def test_closed_form_matches_loop(method):
+    for m, cost, life, year, salvage in CASES:
+        if m != method:
+            continue
+        expected = _loop_reference(m, cost, life, year, salvage)
+        actual = DepreciationMethod.calculate_depreciation(m.value, cost, life, year, salvage)
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-6), (m, cost, life, year, salvage)
+
+
+def test_array_variant_matches_scalar():
+    result = calculate_depreciation_arrays(
+        [c[0] for c in CASES],
+        [c[1] for c in CASES],
+        [c[2] for c in CASES],
+        [c[3] for c in CASES],
+        [c[4] for c in CASES],
+    )
+    for i, (m, cost, life, year, salvage) in enumerate(CASES):
+        expected = DepreciationMethod.calculate_depreciation(m, cost, life, year, salvage)
+        actual = (result['annual_depreciation'][i], result['accumulated_depreciation'][i],
+                  result['current_book_value'][i])
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-6), (m, cost, life, year, salvage)
+
+
+def test_array_variant_single_method_and_errors():
+    result = calculate_depreciation_arrays("Straight Line", [1000.0, 2000.0], 4, [1, 3], 200.0)
+    assert result['annual_depreciation'].tolist() == [200.0, 450.0]
+    assert result['accumulated_depreciation'].tolist() == [0.0, 900.0]
+    assert result['current_book_value'].tolist() == [1000.0, 1100.0]
+
+    with pytest.raises(ValueError):
+        calculate_depreciation_arrays("Units of Production", [1000.0], 4)
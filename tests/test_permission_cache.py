@@ -0,0 +1,85 @@
+from sqlalchemy import event
+
+from app.core.models import PermissionType, Role, User, UserRole
+from app.services.asset_service import AssetService
+from app.services.permission_cache import (
+    ALL_PERMISSIONS_MASK, get_permission_resolver, mask_to_permissions, permission_bit
+)
+from app.services.role_service import RoleService
+
+
+def _add_user(db, email, role):
+    with db.get_db() as session:
+        role_id = session.query(Role.id).filter(Role.name == role).scalar()
+        user = User(name=email, email=email, password_hash="x", role_id=role_id)
+        session.add(user)
+        session.flush()
+        return user.id, role_id
+
+
+def test_checks_use_cached_bitmasks_and_invalidate(isolated_db, sql_statements):
+    resolver = get_permission_resolver()
+    resolver.invalidate()
+    roles = RoleService()
+    viewer_id, viewer_role = _add_user(isolated_db, "viewer@example.com", UserRole.VIEWER)
+    admin_id, admin_role = _add_user(isolated_db, "admin@example.com", UserRole.ADMIN)
+
+    assert set(mask_to_permissions(resolver.role_mask(viewer_role))) == {
+        PermissionType.VIEW_ASSET, PermissionType.VIEW_REPORTS}
+    assert resolver.role_mask(admin_role) == ALL_PERMISSIONS_MASK
+    assert permission_bit("Delete Asset") == permission_bit("DELETE_ASSET") == permission_bit(PermissionType.DELETE_ASSET)
+
+    assert roles.check_permission(viewer_id, "View Asset")  # warms the user entry
+    with sql_statements:
+        for _ in range(20):
+            assert roles.check_permission(viewer_id, "View Asset")
+            assert not roles.check_permission(viewer_id, "Delete Asset")
+            assert roles.check_permission(admin_id, "Manage Users")
+        assert not roles.check_permission(viewer_id, "Not A Permission")
+    # Only the admin user's first role lookup hit the database
+    assert len(sql_statements) == 1
+
+    # Granting a permission to the role is visible immediately
+    assert roles.update_role_permissions(viewer_role, ["View Asset", "View Reports", "Delete Asset"])
+    assert roles.check_permission(viewer_id, "Delete Asset")
+
+    assets = AssetService()
+    assets.set_current_user(viewer_id, "viewer")
+    # Allowed by the role grant, not the global deletion toggle
+    assets.settings_service.can_delete_asset = lambda: False
+    assert assets.can_delete_asset(1)["success"]
+
+    # Moving the user to another role is visible immediately
+    user_role = isolated_db.get_db_session().query(Role.id).filter(Role.name == UserRole.USER).scalar()
+    assert roles.update_user_role(viewer_id, user_role)
+    assert not roles.check_permission(viewer_id, "Delete Asset")
+    assert roles.check_permission(viewer_id, "Create Asset")
+
+
+def test_user_lookup_racing_an_invalidation_is_not_cached(isolated_db):
+    resolver = get_permission_resolver()
+    resolver.invalidate()
+    user_id, viewer_role = _add_user(isolated_db, "race@example.com", UserRole.VIEWER)
+    resolver.role_mask(viewer_role)
+
+    fired = []
+
+    def invalidate_mid_lookup(conn, cursor, statement, *args):
+        if "users.role_id" in statement and not fired:
+            fired.append(statement)
+            resolver.invalidate_user(user_id)
+
+    engine = isolated_db.get_session_factory().bind
+    event.listen(engine, "before_cursor_execute", invalidate_mid_lookup)
+    try:
+        assert resolver.user_role_id(user_id) == viewer_role
+    finally:
+        event.remove(engine, "before_cursor_execute", invalidate_mid_lookup)
+    assert fired
+
+    # The raced result was not cached, so the next check sees the new role
+    with isolated_db.get_db() as session:
+        admin_role = session.query(Role.id).filter(Role.name == UserRole.ADMIN).scalar()
+        session.query(User).filter(User.id == user_id).update({User.role_id: admin_role})
+    assert resolver.user_role_id(user_id) == admin_role
+    assert resolver.is_admin_role(admin_role)
@@ -0,0 +1,89 @@
+import csv
+from datetime import date
+
+from app.core.models import Asset, AssetCategory
+from app.services.asset_service import AssetService
+from app.services.export_method import export_csv
+from app.services.report_rows import category_rows, stream_report_csv, valuation_rows
+
+
+def _seed(database, count=30):
+    with database.get_db() as session:
+        categories = [AssetCategory(name="IT"), AssetCategory(name="Furniture")]
+        session.add_all(categories)
+        session.flush()
+        session.add_all([
+            Asset(asset_id=f"A-{i:03}", name=f"Asset {i}", description="d",
+                  category_id=categories[i % 2].id, acquisition_date=date(2020, 1, 1 + i % 28),
+                  supplier="S", unit_cost=100 + i, total_cost=100 + i, net_book_value=100 + i,
+                  useful_life=5, location="HQ", department=[None, "Finance", "IT", ""][i % 4])
+            for i in range(count)
+        ])
+
+
+def _read(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))[1:]  # skip the timestamped title row
+
+
+def test_streamed_csv_matches_in_memory_export(isolated_db, tmp_path):
+    _seed(isolated_db)
+    service = AssetService()
+
+    streamed = tmp_path / "streamed.csv"
+    assert stream_report_csv("Asset Valuation Report", str(streamed), service) == 31
+    expected = tmp_path / "expected.csv"
+    export_csv(list(valuation_rows(service.get_all_assets())), str(expected), "Asset Valuation Report")
+    assert _read(streamed) == _read(expected)
+
+    # Grouped reports arrive one contiguous group at a time, empty and
+    # missing departments sharing the "Not Assigned" section
+    grouped = tmp_path / "grouped.csv"
+    assert stream_report_csv("Assets by Department", str(grouped), service) == 30
+    sections = [row[0] for row in _read(grouped) if row and row[0].startswith("===")]
+    assert sections == ["=== Finance ===", "=== IT ===", "=== Not Assigned ==="]
+
+    by_category = {}
+    for group, row in category_rows(service.get_all_assets()):
+        by_category.setdefault(group, []).append(row)
+    expected = tmp_path / "expected_grouped.csv"
+    export_csv(dict(sorted(by_category.items())), str(expected), "Assets by Category")
+    streamed = tmp_path / "streamed_grouped.csv"
+    stream_report_csv("Assets by Category", str(streamed), service)
+    assert _read(streamed) == _read(expected)
+
+
+def test_iter_assets_is_lazy(isolated_db):
+    _seed(isolated_db, count=5)
+    assets = AssetService().iter_assets(batch_size=2)
+    first = next(assets)
+    assert first['asset_id'] == "A-004"  # newest first, like get_all_assets
+    assets.close()
+    assert [a['department'] for a in AssetService().iter_assets(group_by='department')][:2] == ["Finance", "IT"]
+
+
+def test_write_only_xlsx_matches_report_layout(isolated_db, tmp_path, monkeypatch):
+    from openpyxl import load_workbook
+
+    from app.services import export_method
+    from app.services.export_method import export_xlsx_stream
+    from app.services.report_rows import stream_report_xlsx
+
+    _seed(isolated_db, count=12)
+    path = tmp_path / "grouped.xlsx"
+    assert stream_report_xlsx("Assets by Department", str(path), AssetService()) == 12
+    ws = load_workbook(path).active
+    values = [row for row in ws.iter_rows(min_row=4, values_only=True)]
+    labels = [row[0] for row in values if row[0] in ("Finance", "IT", "Not Assigned")]
+    assert labels == ["Finance", "IT", "Not Assigned"]
+    assert values[1][0] == "Asset ID" and ws["A5"].style == "report_header"
+    assert ws["G6"].number_format == "0.00" and ws.freeze_panes == "A4"
+    assert ws.column_dimensions["B"].width >= 12
+
+    # Exports past the sheet row limit carry on in a new sheet with its own header
+    monkeypatch.setattr(export_method, "XLSX_MAX_SHEET_ROWS", 10)
+    path = tmp_path / "split.xlsx"
+    assert export_xlsx_stream(({'n': i} for i in range(8)), str(path), "Split") == 8
+    sheets = load_workbook(path).worksheets
+    assert [s.title for s in sheets] == ["Split", "Split (2)"]
+    assert [r[0] for r in sheets[1].iter_rows(min_row=4, values_only=True)] == ['n', 6, 7]
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from app.core.models import SystemConfiguration
+from app.services import settings_service
+from app.services.settings_service import SettingsService
+
+
+def test_settings_served_from_snapshot_and_invalidated(isolated_db, sql_statements, monkeypatch):
+    monkeypatch.setattr(settings_service, "SETTINGS_REVALIDATE_SECONDS", None)
+    svc = SettingsService()
+    assert svc.can_bulk_operate() is False  # loads the snapshot
+
+    with sql_statements:
+        for _ in range(50):
+            assert svc.can_create_asset() is True
+            assert svc.get_high_value_threshold() == 10000.0
+            assert svc.get_setting("NOPE", "missing", "fallback") == "fallback"
+        # A second service instance neither re-seeds defaults nor reloads
+        SettingsService().can_edit_asset()
+    assert sql_statements == []
+
+    assert svc.set_setting("CRUD_RESTRICTIONS", "allow_bulk_operations", "true", updated_by_id=None)["success"]
+    assert svc.can_bulk_operate() is True
+    assert svc.reset_setting_to_default("CRUD_RESTRICTIONS", "allow_bulk_operations", updated_by_id=None)["success"]
+    assert svc.can_bulk_operate() is False
+
+    exported = svc.export_settings()
+    exported["settings"]["CRUD_RESTRICTIONS"]["allow_asset_creation"]["value"] = "false"
+    assert svc.import_settings(exported, updated_by_id=None)["success"]
+    assert svc.can_create_asset() is False
+
+
+def test_version_check_picks_up_external_changes(isolated_db, monkeypatch):
+    monkeypatch.setattr(settings_service, "SETTINGS_REVALIDATE_SECONDS", 0)
+    svc = SettingsService()
+    assert svc.can_delete_asset() is True
+
+    # Another workstation changes the row directly
+    with isolated_db.get_db() as session:
+        row = session.query(SystemConfiguration).filter_by(
+            category="CRUD_RESTRICTIONS", key="allow_asset_deletion").one()
+        row.value = "false"
+        row.updated_at = datetime.utcnow() + timedelta(seconds=1)
+
+    assert svc.can_delete_asset() is False